@@ -1,3 +1,4 @@
+import re
 from enum import Enum
 
 
@@ -7,6 +8,72 @@ class SprintStates(Enum):
     FUTURE = "FUTURE"
 
 
+class ReportFormats(Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+class BurndownFrequencies(Enum):
+    DAILY = "daily"
+    HOURLY = "hourly"
+
+
+class BurndownEventTypes(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    STORY_POINTS = "story_points"
+    COMPLETED = "completed"
+    REOPENED = "reopened"
+
+
+class SnapshotRecordTypes(Enum):
+    HEADER = "header"
+    SPRINT = "sprint"
+    ISSUE = "issue"
+    PARENT = "parent"
+
+
+class ForecastVelocities(Enum):
+    COMPLETED = "completed"
+    PRIORITY = "priority"
+
+
+class RenderFormats(Enum):
+    HTML = "html"
+    JSON = "json"
+
+
+class WebhookEvents(Enum):
+    ISSUE_CREATED = "jira:issue_created"
+    ISSUE_UPDATED = "jira:issue_updated"
+    ISSUE_DELETED = "jira:issue_deleted"
+    SPRINT_CREATED = "sprint_created"
+    SPRINT_UPDATED = "sprint_updated"
+    SPRINT_STARTED = "sprint_started"
+    SPRINT_CLOSED = "sprint_closed"
+    SPRINT_DELETED = "sprint_deleted"
+
+
+class PortfolioGroups(Enum):
+    PROJECT = "project"
+    PERIOD = "period"
+
+
+class PortfolioPeriods(Enum):
+    MONTH = "month"
+    QUARTER = "quarter"
+    YEAR = "year"
+
+
+class PortfolioAggregations(Enum):
+    SUM = "sum"
+    MEAN = "mean"
+    MEDIAN = "median"
+    MIN = "min"
+    MAX = "max"
+    COUNT = "count"
+
+
 class IssueTypeEnum(Enum):
     STORY = "Story"
     TASK = "Task"
@@ -15,6 +82,8 @@ class IssueTypeEnum(Enum):
 
 REPORT_COLUMNS = [
     "Sprint",
+    "Sprint ID",
+    "Start Date",
     "Commitment",
     "Completed",
     "4-Sprint Average",
@@ -29,6 +98,127 @@ REPORT_COLUMNS = [
     "Bug Tickets",
     "Priority Points",
     "Non-Priority Points",
+    "Completed Priority Points",
+    "Priority Percentage",
+    "Non Priority Percentage",
 ]
 
+REPORT_INDEX_COLUMNS = ["Sprint", "Sprint ID", "Start Date"]
+
+PARQUET_ENGINES = ["pyarrow", "fastparquet"]
+
+REPORT_METRIC_COLUMNS = [
+    "Sprint",
+    "Sprint ID",
+    "Start Date",
+    "Commitment",
+    "Completed",
+    "Scope Change",
+    "Planned Capacity",
+    "Unpointed Issues",
+    "Unpointed Stories",
+    "Unpointed Tasks",
+    "Bug Tickets",
+    "Priority Points",
+    "Non-Priority Points",
+    "Completed Priority Points",
+]
+
+PERCENTAGE_REPORT_COLUMNS = [
+    "Capacity Achieved",
+    "4-Sprint Capacity Achieved",
+    "4-Sprint Smoothed Average",
+    "Priority Percentage",
+    "Non Priority Percentage",
+]
+
+ROLLING_WINDOW = 4
+
+BURNDOWN_COLUMNS = [
+    "Sprint",
+    "Sprint ID",
+    "Timestamp",
+    "Elapsed Days",
+    "Remaining",
+    "Completed",
+    "Added Scope",
+]
+BURNDOWN_SERIES_COLUMNS = ["Remaining", "Completed", "Added Scope"]
+
+FORECAST_COLUMNS = ["Project", "Target", "Velocity", "Remaining Points"]
+FORECAST_ALL_TARGET = "All"
+FORECAST_PRIORITY_TARGET = "Priority"
+FORECAST_SIMULATIONS = 100000
+FORECAST_CONFIDENCES = [0.5, 0.85, 0.95]
+FORECAST_MAX_SPRINTS = 104
+
+PORTFOLIO_FILENAME = "reports/portfolio.sqlite"
+PORTFOLIO_METRIC_COLUMNS = [
+    column for column in REPORT_COLUMNS if column not in REPORT_INDEX_COLUMNS
+]
+PORTFOLIO_PERIOD_FREQUENCIES = {
+    PortfolioPeriods.MONTH: "M",
+    PortfolioPeriods.QUARTER: "Q",
+    PortfolioPeriods.YEAR: "Y",
+}
+PORTFOLIO_TREND_SPRINTS = 6
+
+RENDER_OUTPUT_DIR = "reports/render"
+RENDER_INDEX_FILENAME = "render_index.json"
+RENDER_MAX_POINTS = 104
+
 DEFAULT_STORY_POINTS_FIELD_NAME = "customfield_10591"
+DEFAULT_SPRINT_FIELD_NAME = "customfield_10020"
+DEFAULT_MAX_WORKERS = 1
+
+SEARCH_PAGE_SIZE = 100
+STREAM_PAGES_IN_FLIGHT_PER_WORKER = 2
+BOARD_SPRINT_PAGE_SIZE = 50
+AGILE_BASE_URL = "{server}/rest/agile/1.0/{path}"
+AGILE_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+ISSUE_DATE_FORMAT = "%Y-%m-%dT%X.%f%z"
+ISSUE_FIELDS = ["status", "issuetype", "parent", "created", "updated"]
+SPRINT_QUERY_CHUNK_SIZE = 10
+BACKFILL_CHUNK_SIZE = 10
+BATCH_UNSUPPORTED_OPTIONS = [
+    "stream",
+    "backfill",
+    "record_snapshot",
+    "replay",
+    "metrics_json",
+    "metrics_prometheus",
+    "profile",
+]
+LEGACY_SPRINT_ID_PATTERN = re.compile(r"\bid=(\d+)")
+ISSUE_STORE_SYNC_OVERLAP_HOURS = 24
+HIERARCHY_QUERY_CHUNK_SIZE = 100
+HIERARCHY_CACHE_TTL_HOURS = 24.0
+METRICS_CACHE_VERSION = 4
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8089
+DAEMON_RECONCILE_SECONDS = 900.0
+DAEMON_WEBHOOK_PATH = "/webhook"
+DAEMON_SPRINTS_PATH = "/sprints"
+WEBHOOK_SIGNATURE_HEADER = "X-Hub-Signature"
+
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+THROTTLED_STATUS_CODES = (429, 503)
+LATENCY_SMOOTHING = 0.2
+LATENCY_TOLERANCE = 2.0
+LATENCY_BACKOFF_FACTOR = 0.9
+
+PROMETHEUS_METRIC_PREFIX = "jira_scraper"
+PHASE_COUNTER_FIELDS = [
+    "calls",
+    "wall_seconds",
+    "cpu_seconds",
+    "http_requests",
+    "response_bytes",
+    "issues",
+    "changelog_entries",
+    "downloads_avoided",
+    "errors",
+]
@@ -0,0 +1,92 @@
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pytz
+
+from app.constants import SprintStates
+from app.managers.jira_managers import JIRAManager
+from app.managers.report_managers import ReportManager
+from app.models import BackfillCheckpoint, BoardSprint
+
+
+class BackfillManager:
+    @classmethod
+    def build(cls, manager: JIRAManager):
+        config = manager.config
+        report_manager = ReportManager.build(config.project_name, config.report_format)
+        return cls(
+            manager,
+            report_manager,
+            f"cache/{config.project_name}_backfill_checkpoint.json",
+        )
+
+    def __init__(
+        self,
+        manager: JIRAManager,
+        report_manager: ReportManager,
+        checkpoint_filename: str,
+    ):
+        self.manager = manager
+        self.report_manager = report_manager
+        self.checkpoint_filename = checkpoint_filename
+        self.config = manager.config
+
+    def run(self) -> List[int]:
+        checkpoint = self._read_checkpoint()
+        board_sprints = self.manager.get_board_sprints()
+        planned_capacities = self.manager.get_planned_capacities(
+            [sprint.id for sprint in board_sprints]
+        )
+        completed_sprint_ids = set(checkpoint.completed_sprint_ids)
+        sprints = [
+            sprint
+            for sprint in reversed(board_sprints)
+            if sprint.state == SprintStates.CLOSED.value
+            and sprint.id not in completed_sprint_ids
+        ]
+
+        backfilled_sprint_ids = []
+        for chunk in self._get_chunks(sprints):
+            self._backfill_chunk(chunk, planned_capacities)
+            backfilled_sprint_ids.extend(sprint.id for sprint in chunk)
+            checkpoint.completed_sprint_ids.extend(sprint.id for sprint in chunk)
+            checkpoint.updated_at = datetime.now(pytz.UTC)
+            self._write_checkpoint(checkpoint)
+        return backfilled_sprint_ids
+
+    def _backfill_chunk(
+        self, sprints: List[BoardSprint], planned_capacities: Dict[int, float]
+    ) -> None:
+        sprint_data = self.manager.fetch_sprints_data(
+            sprints, {sprint.id: planned_capacities[sprint.id] for sprint in sprints}
+        )
+        sprint_metrics = self.manager.compute_sprint_metrics(sprint_data)
+        with self.manager.instrumentation.phase("report"):
+            self.report_manager.create_or_update_report(sprint_metrics)
+        if self.config.burndown:
+            burndowns = self.manager.compute_sprint_burndowns(sprint_data)
+            with self.manager.instrumentation.phase("report"):
+                self.report_manager.create_or_update_burndown(burndowns)
+
+    def _get_chunks(self, sprints: List[BoardSprint]) -> List[List[BoardSprint]]:
+        chunk_size = self.config.backfill_chunk_size
+        chunks = [
+            sprints[index : index + chunk_size]
+            for index in range(0, len(sprints), chunk_size)
+        ]
+        return chunks
+
+    def _read_checkpoint(self) -> BackfillCheckpoint:
+        checkpoint: Optional[BackfillCheckpoint] = None
+        if os.path.exists(self.checkpoint_filename):
+            checkpoint = BackfillCheckpoint.parse_file(self.checkpoint_filename)
+        if checkpoint is None or checkpoint.board_id != self.config.board_id:
+            checkpoint = BackfillCheckpoint(board_id=self.config.board_id)
+        return checkpoint
+
+    def _write_checkpoint(self, checkpoint: BackfillCheckpoint) -> None:
+        temporary_filename = f"{self.checkpoint_filename}.tmp"
+        with open(temporary_filename, "w") as f:
+            f.write(checkpoint.json())
+        os.replace(temporary_filename, self.checkpoint_filename)
@@ -0,0 +1,128 @@
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from app.constants import BATCH_UNSUPPORTED_OPTIONS
+from app.managers.jira_managers import JIRAManager
+from app.managers.request_managers import RequestManager
+from app.managers.store_managers import MetricsCacheManager
+from app.models import BatchCommandLineArgs, BoardResult, ManagerConfig, SprintData
+from app.utils import get_batch_command_line_args, get_config_file_manager_config
+
+if TYPE_CHECKING:
+    from jira import JIRA
+
+
+def compute_board_report(config: ManagerConfig, sprint_data: SprintData) -> int:
+    from app.managers.report_managers import ReportManager
+
+    metrics_cache = (
+        MetricsCacheManager.build(config.project_name)
+        if config.use_metrics_cache
+        else None
+    )
+    manager = JIRAManager(None, config, metrics_cache=metrics_cache)
+    sprint_metrics = manager.compute_sprint_metrics(sprint_data)
+
+    report_manager = ReportManager.build(
+        config.project_name, config.report_format, tail=len(sprint_metrics)
+    )
+    report_manager.create_or_update_report(sprint_metrics)
+    if config.burndown:
+        report_manager.create_or_update_burndown(
+            manager.compute_sprint_burndowns(sprint_data)
+        )
+    if config.export_csv:
+        report_manager.export_csv()
+    return len(sprint_metrics)
+
+
+class BatchManager:
+    @classmethod
+    def build(cls, args: Optional[BatchCommandLineArgs] = None):
+        if args is None:
+            args = get_batch_command_line_args()
+        configs = [
+            get_config_file_manager_config(config_filename)
+            for config_filename in args.config_filenames
+        ]
+        return cls(configs, args.processes)
+
+    def __init__(self, configs: List[ManagerConfig], processes: Optional[int] = None):
+        self.configs = configs
+        self.processes = processes
+        self._jiras: Dict[str, "JIRA"] = {}
+        self._request_managers: Dict[str, RequestManager] = {}
+
+    def run(self) -> List[BoardResult]:
+        project_name_counts = Counter(config.project_name for config in self.configs)
+        results: Dict[int, BoardResult] = {}
+        futures: Dict[int, Future] = {}
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            for index, config in enumerate(self.configs):
+                try:
+                    self._validate_config(config, project_name_counts)
+                    manager = JIRAManager.build(
+                        config,
+                        self._get_jira(config),
+                        self._request_managers[config.server_url],
+                    )
+                    sprint_data = manager.fetch_sprint_data()
+                except Exception as e:
+                    results[index] = self._failed_result(config.project_name, e)
+                    continue
+                futures[index] = executor.submit(
+                    compute_board_report, config, sprint_data
+                )
+
+            for index, future in futures.items():
+                project_name = self.configs[index].project_name
+                try:
+                    sprint_count = future.result()
+                except Exception as e:
+                    results[index] = self._failed_result(project_name, e)
+                    continue
+                results[index] = BoardResult(
+                    project_name=project_name,
+                    succeeded=True,
+                    sprint_count=sprint_count,
+                )
+
+        ordered_results = [results[index] for index in range(len(self.configs))]
+        return ordered_results
+
+    def _validate_config(
+        self, config: ManagerConfig, project_name_counts: Dict[str, int]
+    ) -> None:
+        if project_name_counts[config.project_name] > 1:
+            raise ValueError(
+                f"{config.project_name} is configured by more than one config file"
+            )
+        unsupported_options = [
+            option for option in BATCH_UNSUPPORTED_OPTIONS if getattr(config, option)
+        ]
+        if len(unsupported_options) > 0:
+            raise ValueError(
+                f"{', '.join(unsupported_options)} cannot be used in a batch run"
+            )
+
+    def _get_jira(self, config: ManagerConfig) -> "JIRA":
+        if config.server_url not in self._jiras:
+            pool_size = max(
+                board_config.max_workers
+                for board_config in self.configs
+                if board_config.server_url == config.server_url
+            )
+            self._request_managers[config.server_url] = RequestManager(
+                pool_size, config.requests_per_second, config.max_retries
+            )
+            self._jiras[config.server_url] = JIRAManager.build_jira(
+                config, self._request_managers[config.server_url], pool_size=pool_size
+            )
+        return self._jiras[config.server_url]
+
+    def _failed_result(self, project_name: str, error: Exception) -> BoardResult:
+        result = BoardResult(
+            project_name=project_name, succeeded=False, error=repr(error)
+        )
+        return result
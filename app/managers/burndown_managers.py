@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from app.constants import BurndownEventTypes, BurndownFrequencies
+from app.models import BurndownEvent, BurndownIssue, ManagerConfig, SprintBurndown
+
+
+class BurndownManager:
+    def __init__(self, config: ManagerConfig):
+        self.config = config
+
+    def get_sprint_burndown(
+        self,
+        sprint_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        issues: List[BurndownIssue],
+        events: List[BurndownEvent],
+        until: datetime,
+    ) -> SprintBurndown:
+        story_points = [issue.story_points for issue in issues]
+        is_complete = [issue.is_complete for issue in issues]
+        in_sprint = [False] * len(issues)
+        added_late = [False] * len(issues)
+
+        timestamps = self._get_sample_timestamps(start_date, min(end_date, until))
+        sorted_events = sorted(events, key=lambda event: event.timestamp)
+        remaining, completed, added_scope = 0.0, 0.0, 0.0
+        remaining_series, completed_series, added_scope_series = [], [], []
+
+        event_index = 0
+        for timestamp in timestamps:
+            while (
+                event_index < len(sorted_events)
+                and sorted_events[event_index].timestamp <= timestamp
+            ):
+                event = sorted_events[event_index]
+                index = event.issue_index
+                old_contribution = self._get_contribution(
+                    in_sprint[index],
+                    story_points[index],
+                    is_complete[index],
+                    added_late[index],
+                )
+
+                if event.event_type == BurndownEventTypes.ADDED:
+                    in_sprint[index] = True
+                    added_late[index] = event.timestamp > start_date
+                elif event.event_type == BurndownEventTypes.REMOVED:
+                    in_sprint[index] = False
+                elif event.event_type == BurndownEventTypes.STORY_POINTS:
+                    story_points[index] = event.story_points
+                elif event.event_type == BurndownEventTypes.COMPLETED:
+                    is_complete[index] = True
+                elif event.event_type == BurndownEventTypes.REOPENED:
+                    is_complete[index] = False
+
+                new_contribution = self._get_contribution(
+                    in_sprint[index],
+                    story_points[index],
+                    is_complete[index],
+                    added_late[index],
+                )
+                remaining += new_contribution[0] - old_contribution[0]
+                completed += new_contribution[1] - old_contribution[1]
+                added_scope += new_contribution[2] - old_contribution[2]
+                event_index += 1
+
+            remaining_series.append(remaining)
+            completed_series.append(completed)
+            added_scope_series.append(added_scope)
+
+        burndown = SprintBurndown(
+            sprint_id=sprint_id,
+            start_date=start_date,
+            end_date=end_date,
+            timestamps=timestamps,
+            remaining=remaining_series,
+            completed=completed_series,
+            added_scope=added_scope_series,
+        )
+        return burndown
+
+    def _get_contribution(
+        self, in_sprint: bool, story_points: float, is_complete: bool, added_late: bool
+    ) -> Tuple[float, float, float]:
+        if not in_sprint:
+            return 0.0, 0.0, 0.0
+        remaining = 0.0 if is_complete else story_points
+        completed = story_points if is_complete else 0.0
+        added_scope = story_points if added_late else 0.0
+        return remaining, completed, added_scope
+
+    def _get_sample_timestamps(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[datetime]:
+        if self.config.burndown_frequency == BurndownFrequencies.HOURLY:
+            frequency = timedelta(hours=1)
+        else:
+            frequency = timedelta(days=1)
+
+        sample_count = max(0, int((end_date - start_date) / frequency))
+        timestamps = [
+            start_date + frequency * index for index in range(sample_count + 1)
+        ]
+        if timestamps[-1] < end_date:
+            timestamps.append(end_date)
+        return timestamps
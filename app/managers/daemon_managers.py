@@ -0,0 +1,424 @@
+import hashlib
+import hmac
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from app.constants import (
+    DAEMON_SPRINTS_PATH,
+    DAEMON_WEBHOOK_PATH,
+    ISSUE_DATE_FORMAT,
+    WEBHOOK_SIGNATURE_HEADER,
+    WebhookEvents,
+)
+from app.managers.jira_managers import JIRAManager
+from app.managers.report_managers import ReportManager
+from app.models import (
+    DaemonCommandLineArgs,
+    JiraTicket,
+    SprintData,
+    SprintMetrics,
+    TicketMetrics,
+)
+from app.utils import get_config_file_manager_config, get_daemon_command_line_args
+
+ISSUE_EVENTS = [
+    WebhookEvents.ISSUE_CREATED.value,
+    WebhookEvents.ISSUE_UPDATED.value,
+    WebhookEvents.ISSUE_DELETED.value,
+]
+SPRINT_EVENTS = [
+    WebhookEvents.SPRINT_CREATED.value,
+    WebhookEvents.SPRINT_UPDATED.value,
+    WebhookEvents.SPRINT_STARTED.value,
+    WebhookEvents.SPRINT_CLOSED.value,
+    WebhookEvents.SPRINT_DELETED.value,
+]
+
+
+class DaemonManager:
+    @classmethod
+    def build(cls, args: Optional[DaemonCommandLineArgs] = None):
+        if args is None:
+            args = get_daemon_command_line_args()
+        config = get_config_file_manager_config(args.config_filename)
+        if config.replay is not None:
+            raise ValueError("The daemon cannot be run against a replayed snapshot")
+        return cls(
+            JIRAManager.build(config),
+            args.host,
+            args.port,
+            args.reconcile_seconds,
+            args.webhook_secret,
+        )
+
+    def __init__(
+        self,
+        manager: JIRAManager,
+        host: str,
+        port: int,
+        reconcile_seconds: float,
+        webhook_secret: Optional[str] = None,
+    ):
+        self.manager = manager
+        self.config = manager.config
+        self.host = host
+        self.port = port
+        self.reconcile_seconds = reconcile_seconds
+        self.webhook_secret = webhook_secret
+
+        self.report_manager: Optional[ReportManager] = None
+        self.sprint_data: Optional[SprintData] = None
+        self.sprint_infos: Dict[int, Dict] = {}
+        self.start_dates: Dict[int, datetime] = {}
+        self.issues: Dict[str, Dict] = {}
+        self.tickets: Dict[str, Dict[int, JiraTicket]] = {}
+        self.ticket_metrics: Dict[int, TicketMetrics] = {}
+        self.sprint_metrics: Dict[int, SprintMetrics] = {}
+
+        self._condition = threading.Condition()
+        self._changed_sprint_ids: Set[int] = set()
+        self._pending_events: Optional[List[Dict]] = None
+        self._reconcile_requested = False
+        self._next_reconcile = 0.0
+
+    def run(
+        self, on_reconcile_error: Optional[Callable[[Exception], None]] = None
+    ) -> None:
+        self.reconcile()
+        self.flush()
+        server = DaemonServer((self.host, self.port), self)
+        server.start()
+        try:
+            while True:
+                self._wait_for_changes()
+                if self._is_reconcile_due():
+                    self._try_reconcile(on_reconcile_error)
+                self.flush()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def reconcile(self) -> None:
+        with self._condition:
+            self._pending_events = []
+            self._reconcile_requested = False
+
+        with self.manager.instrumentation.phase("reconcile"):
+            sprint_data = self.manager.fetch_sprint_data()
+            sprint_metrics = self.manager.compute_sprint_metrics(sprint_data)
+
+        with self._condition:
+            self._load_sprint_data(sprint_data, sprint_metrics)
+            pending_events, self._pending_events = self._pending_events, None
+            for event in pending_events:
+                self._apply_issue_event(event)
+            self._next_reconcile = time.monotonic() + self.reconcile_seconds
+
+        if self.config.burndown:
+            burndowns = self.manager.compute_sprint_burndowns(sprint_data)
+            with self.manager.instrumentation.phase("report"):
+                self._get_report_manager().create_or_update_burndown(burndowns)
+
+    def flush(self) -> None:
+        with self._condition:
+            changed_sprint_metrics = [
+                self.sprint_metrics[sprint_id]
+                for sprint_id in self._changed_sprint_ids
+                if sprint_id in self.sprint_metrics
+            ]
+            self._changed_sprint_ids = set()
+        if len(changed_sprint_metrics) == 0:
+            return None
+
+        with self.manager.instrumentation.phase("report"):
+            report_manager = self._get_report_manager()
+            report_manager.create_or_update_report(changed_sprint_metrics)
+            if self.config.export_csv:
+                report_manager.export_csv()
+
+    def handle_event(self, event: Dict) -> None:
+        event_type = event["webhookEvent"]
+        if event_type in SPRINT_EVENTS:
+            board_id = event.get("sprint", {}).get("originBoardId")
+            if board_id is None or board_id == self.config.board_id:
+                with self._condition:
+                    self._reconcile_requested = True
+                    self._condition.notify_all()
+            return None
+        if event_type not in ISSUE_EVENTS:
+            return None
+
+        with self.manager.instrumentation.phase("webhook"):
+            if event_type != WebhookEvents.ISSUE_DELETED.value:
+                if not self._has_issue_fields(event["issue"]):
+                    issue = self.manager.fetch_issue(event["issue"]["key"])
+                    if issue is None:
+                        return None
+                    event = {"webhookEvent": event_type, "issue": issue}
+                self.manager.resolve_hierarchy([event["issue"]])
+
+            with self._condition:
+                if self._pending_events is not None:
+                    self._pending_events.append(event)
+                self._apply_issue_event(event)
+                self._condition.notify_all()
+
+    def get_sprints(self) -> List[Dict]:
+        with self._condition:
+            sprint_ids = self.sprint_data.sprint_ids if self.sprint_data else []
+            sprints = [
+                self.sprint_metrics[sprint_id].dict()
+                for sprint_id in sprint_ids
+                if sprint_id in self.sprint_metrics
+            ]
+        return sprints
+
+    def verify_signature(self, body: bytes, signature: Optional[str]) -> bool:
+        if self.webhook_secret is None:
+            return True
+        digest = hmac.new(self.webhook_secret.encode(), body, hashlib.sha256)
+        expected_signature = f"sha256={digest.hexdigest()}"
+        return signature is not None and hmac.compare_digest(
+            signature, expected_signature
+        )
+
+    def _wait_for_changes(self) -> None:
+        with self._condition:
+            while len(self._changed_sprint_ids) == 0 and not self._reconcile_requested:
+                timeout = self._next_reconcile - time.monotonic()
+                if timeout <= 0:
+                    break
+                self._condition.wait(timeout)
+
+    def _is_reconcile_due(self) -> bool:
+        with self._condition:
+            is_reconcile_due = (
+                self._reconcile_requested or time.monotonic() >= self._next_reconcile
+            )
+        return is_reconcile_due
+
+    def _try_reconcile(
+        self, on_reconcile_error: Optional[Callable[[Exception], None]]
+    ) -> None:
+        try:
+            self.reconcile()
+        except Exception as e:
+            self.manager.instrumentation.count("reconcile", errors=1)
+            if on_reconcile_error is not None:
+                on_reconcile_error(e)
+            with self._condition:
+                self._pending_events = None
+                self._next_reconcile = time.monotonic() + self.reconcile_seconds
+
+    def _load_sprint_data(
+        self, sprint_data: SprintData, sprint_metrics: List[SprintMetrics]
+    ) -> None:
+        self.sprint_data = sprint_data
+        self.sprint_infos = {
+            sprint_issues.sprint_id: sprint_issues.sprint_info
+            for sprint_issues in sprint_data.sprints_issues
+        }
+        self.start_dates = self.manager.get_sprint_start_dates(sprint_data)
+        self.issues = {
+            issue["key"]: issue
+            for sprint_issues in sprint_data.sprints_issues
+            for issue in sprint_issues.issues
+        }
+        self.tickets = {
+            key: self.manager.get_issue_tickets(issue, self.start_dates)
+            for key, issue in self.issues.items()
+        }
+
+        sprints_tickets: Dict[int, List[JiraTicket]] = {
+            sprint_id: [] for sprint_id in self.start_dates
+        }
+        for tickets in self.tickets.values():
+            for sprint_id, ticket in tickets.items():
+                sprints_tickets[sprint_id].append(ticket)
+        self.ticket_metrics = dict(
+            zip(
+                sprints_tickets,
+                self.manager.metrics_manager.get_ticket_metrics(
+                    list(sprints_tickets.values()),
+                    [self.start_dates[sprint_id] for sprint_id in sprints_tickets],
+                ),
+            )
+        )
+        self.sprint_metrics = {metrics.sprint_id: metrics for metrics in sprint_metrics}
+        self._changed_sprint_ids.update(self.sprint_metrics)
+
+        registry_keys = {
+            (key, issue["fields"]["updated"]) for key, issue in self.issues.items()
+        }
+        self.manager.issue_registry = {
+            registry_key: sprint_memberships
+            for registry_key, sprint_memberships in self.manager.issue_registry.items()
+            if registry_key in registry_keys
+        }
+
+    def _apply_issue_event(self, event: Dict) -> None:
+        key = event["issue"]["key"]
+        stored_issue = self.issues.get(key)
+        issue = None
+        if event["webhookEvent"] != WebhookEvents.ISSUE_DELETED.value:
+            issue = self._get_event_issue(event, stored_issue)
+            if stored_issue is not None and not self._is_newer(issue, stored_issue):
+                return None
+
+        old_tickets = self.tickets.pop(key, {})
+        if stored_issue is not None:
+            self.manager.forget_issue(stored_issue)
+            del self.issues[key]
+
+        new_tickets: Dict[int, JiraTicket] = {}
+        if issue is not None:
+            new_tickets = self.manager.get_issue_tickets(issue, self.start_dates)
+            if len(new_tickets) > 0:
+                self.issues[key] = issue
+                self.tickets[key] = new_tickets
+            else:
+                self.manager.forget_issue(issue)
+
+        for sprint_id in set(old_tickets) | set(new_tickets):
+            old_ticket = old_tickets.get(sprint_id)
+            new_ticket = new_tickets.get(sprint_id)
+            if old_ticket == new_ticket:
+                continue
+            self._update_sprint_metrics(sprint_id, old_ticket, new_ticket)
+
+    def _update_sprint_metrics(
+        self,
+        sprint_id: int,
+        old_ticket: Optional[JiraTicket],
+        new_ticket: Optional[JiraTicket],
+    ) -> None:
+        self.ticket_metrics[
+            sprint_id
+        ] = self.manager.metrics_manager.update_ticket_metrics(
+            self.ticket_metrics[sprint_id],
+            [old_ticket] if old_ticket is not None else [],
+            [new_ticket] if new_ticket is not None else [],
+            self.start_dates[sprint_id],
+        )
+        self.sprint_metrics[sprint_id] = self.manager.build_sprint_metrics(
+            sprint_id,
+            self.sprint_infos[sprint_id],
+            self.sprint_data.planned_capacities[sprint_id],
+            self.ticket_metrics[sprint_id],
+        )
+        self._changed_sprint_ids.add(sprint_id)
+
+    def _get_event_issue(self, event: Dict, stored_issue: Optional[Dict]) -> Dict:
+        event_issue = event["issue"]
+        fields = event_issue["fields"]
+        if "changelog" in event_issue:
+            histories = event_issue["changelog"]["histories"]
+        else:
+            histories = (
+                list(stored_issue["changelog"]["histories"])
+                if stored_issue is not None
+                else []
+            )
+            changelog = event.get("changelog") or {}
+            if len(changelog.get("items") or []) > 0:
+                histories.append(
+                    {
+                        "id": changelog.get("id"),
+                        "created": fields["updated"],
+                        "items": changelog["items"],
+                    }
+                )
+
+        issue = {
+            "key": event_issue["key"],
+            "fields": {
+                field: fields.get(field) for field in self.manager.get_issue_fields()
+            },
+            "changelog": {"histories": histories},
+        }
+        return issue
+
+    def _has_issue_fields(self, event_issue: Dict) -> bool:
+        fields = event_issue.get("fields") or {}
+        has_issue_fields = all(
+            fields.get(field) is not None
+            for field in ["issuetype", "status", "updated"]
+        )
+        return has_issue_fields
+
+    def _is_newer(self, issue: Dict, stored_issue: Dict) -> bool:
+        updated = datetime.strptime(issue["fields"]["updated"], ISSUE_DATE_FORMAT)
+        stored_updated = datetime.strptime(
+            stored_issue["fields"]["updated"], ISSUE_DATE_FORMAT
+        )
+        return updated > stored_updated
+
+    def _get_report_manager(self) -> ReportManager:
+        if self.report_manager is None:
+            self.report_manager = ReportManager.build(
+                self.config.project_name,
+                self.config.report_format,
+                tail=len(self.sprint_data.sprint_ids),
+            )
+        return self.report_manager
+
+
+class DaemonServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], daemon_manager: DaemonManager):
+        super().__init__(server_address, DaemonRequestHandler)
+        self.daemon_manager = daemon_manager
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    server: DaemonServer
+
+    def log_message(self, format, *args) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path != DAEMON_SPRINTS_PATH:
+            self._send_json(404, {"error": "Not found"})
+            return None
+        self._send_json(200, self.server.daemon_manager.get_sprints())
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != DAEMON_WEBHOOK_PATH:
+            self._send_json(404, {"error": "Not found"})
+            return None
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.server.daemon_manager.verify_signature(
+            body, self.headers.get(WEBHOOK_SIGNATURE_HEADER)
+        ):
+            self._send_json(401, {"error": "Invalid signature"})
+            return None
+
+        try:
+            self.server.daemon_manager.handle_event(json.loads(body))
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {"error": repr(e)})
+            return None
+        except Exception as e:
+            self._send_json(500, {"error": repr(e)})
+            return None
+        self._send_json(202, {"accepted": True})
+
+    def _send_json(self, status: int, body) -> None:
+        payload = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import pytz
+
+from app.constants import PHASE_COUNTER_FIELDS, PROMETHEUS_METRIC_PREFIX
+from app.models import PhaseStats, RunInstrumentation
+
+if TYPE_CHECKING:
+    from jira import JIRA
+    from requests import Response
+
+
+class InstrumentationManager:
+    def __init__(self, project_name: str):
+        self.project_name = project_name
+        self.started_at = datetime.now(pytz.UTC)
+        self._started = time.perf_counter()
+        self._phases: Dict[Tuple[str, Optional[int]], PhaseStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def attach(self, jira: "JIRA") -> None:
+        hooks = jira._session.hooks["response"]
+        hooks[:] = [
+            hook
+            for hook in hooks
+            if not isinstance(getattr(hook, "__self__", None), InstrumentationManager)
+        ]
+        hooks.append(self._record_response)
+
+    @contextmanager
+    def phase(self, name: str, sprint_id: Optional[int] = None) -> Iterator[None]:
+        phase_stack = self._get_phase_stack()
+        phase_stack.append((name, sprint_id))
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            phase_stack.pop()
+            self.count(
+                name,
+                sprint_id,
+                calls=1,
+                wall_seconds=time.perf_counter() - wall_started,
+                cpu_seconds=time.thread_time() - cpu_started,
+            )
+
+    def count(self, name: str, sprint_id: Optional[int] = None, **counts) -> None:
+        with self._lock:
+            key = (name, sprint_id)
+            if key not in self._phases:
+                self._phases[key] = PhaseStats(phase=name, sprint_id=sprint_id)
+            stats = self._phases[key]
+            for field, value in counts.items():
+                setattr(stats, field, getattr(stats, field) + value)
+
+    def get_run_instrumentation(self) -> RunInstrumentation:
+        with self._lock:
+            phases = [stats.copy() for stats in self._phases.values()]
+        run_instrumentation = RunInstrumentation(
+            project_name=self.project_name,
+            started_at=self.started_at,
+            wall_seconds=time.perf_counter() - self._started,
+            phases=phases,
+        )
+        return run_instrumentation
+
+    def write_json(self, filename: str) -> None:
+        self._write_atomically(
+            filename, self.get_run_instrumentation().json(indent=2) + "\n"
+        )
+
+    def write_prometheus(self, filename: str) -> None:
+        run_instrumentation = self.get_run_instrumentation()
+        phase_totals: Dict[str, Dict[str, float]] = {}
+        for stats in run_instrumentation.phases:
+            totals = phase_totals.setdefault(
+                stats.phase, {field: 0 for field in PHASE_COUNTER_FIELDS}
+            )
+            for field in PHASE_COUNTER_FIELDS:
+                totals[field] += getattr(stats, field)
+
+        lines = self._get_prometheus_metric(
+            "run_wall_seconds",
+            "Wall time of the whole scraper run.",
+            [({}, run_instrumentation.wall_seconds)],
+        )
+        lines += self._get_prometheus_metric(
+            "last_run_timestamp_seconds",
+            "Unix timestamp of the start of the last scraper run.",
+            [({}, run_instrumentation.started_at.timestamp())],
+        )
+        for field in PHASE_COUNTER_FIELDS:
+            lines += self._get_prometheus_metric(
+                f"phase_{field}",
+                f"Total {field.replace('_', ' ')} of each scraper phase.",
+                [
+                    ({"phase": phase}, totals[field])
+                    for phase, totals in sorted(phase_totals.items())
+                ],
+            )
+        self._write_atomically(filename, "\n".join(lines) + "\n")
+
+    def _get_prometheus_metric(
+        self, name: str, description: str, samples: List[Tuple[Dict, float]]
+    ) -> List[str]:
+        metric_name = f"{PROMETHEUS_METRIC_PREFIX}_{name}"
+        lines = [f"# HELP {metric_name} {description}", f"# TYPE {metric_name} gauge"]
+        for labels, value in samples:
+            labels = {"project": self.project_name, **labels}
+            formatted_labels = ",".join(
+                f'{label}="{label_value}"' for label, label_value in labels.items()
+            )
+            lines.append(f"{metric_name}{{{formatted_labels}}} {value}")
+        return lines
+
+    def _record_response(self, response: "Response", *args, **kwargs) -> None:
+        phase_stack = self._get_phase_stack()
+        if len(phase_stack) == 0:
+            return None
+        name, sprint_id = phase_stack[-1]
+        self.count(
+            name, sprint_id, http_requests=1, response_bytes=len(response.content)
+        )
+
+    def _get_phase_stack(self) -> List[Tuple[str, Optional[int]]]:
+        if not hasattr(self._local, "phase_stack"):
+            self._local.phase_stack = []
+        return self._local.phase_stack
+
+    def _write_atomically(self, filename: str, content: str) -> None:
+        temporary_filename = f"{filename}.tmp"
+        with open(temporary_filename, "w") as f:
+            f.write(content)
+        os.replace(temporary_filename, filename)
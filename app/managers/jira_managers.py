@@ -1,163 +1,733 @@
 from __future__ import absolute_import
 
-from datetime import datetime
-from typing import List, Optional, Dict
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterator, List, Optional, Dict, Set, Tuple
 
 import pytz
-from jira import JIRA, Issue
 
-from app.constants import IssueTypeEnum, SprintStates
+from app.constants import (
+    SprintStates,
+    SEARCH_PAGE_SIZE,
+    STREAM_PAGES_IN_FLIGHT_PER_WORKER,
+    BOARD_SPRINT_PAGE_SIZE,
+    AGILE_BASE_URL,
+    AGILE_DATE_FORMAT,
+    ISSUE_DATE_FORMAT,
+    ISSUE_FIELDS,
+    SPRINT_QUERY_CHUNK_SIZE,
+    LEGACY_SPRINT_ID_PATTERN,
+    ISSUE_STORE_SYNC_OVERLAP_HOURS,
+    HIERARCHY_QUERY_CHUNK_SIZE,
+    METRICS_CACHE_VERSION,
+    BurndownEventTypes,
+)
 from app.models import (
+    BoardSprint,
+    BurndownEvent,
+    BurndownIssue,
+    SprintBurndown,
     ManagerConfig,
     SprintMetrics,
-    UnpointedBreakdown,
-    PriorityPointsBreakdown,
     JiraTicket,
     SprintIssues,
+    SprintData,
+    SprintMembership,
+    Snapshot,
+    SnapshotSprint,
+    StoredIssue,
+    TicketMetrics,
+)
+from app.managers.burndown_managers import BurndownManager
+from app.managers.instrumentation_managers import InstrumentationManager
+from app.managers.metric_managers import MetricsManager
+from app.managers.request_managers import RequestManager
+from app.managers.store_managers import (
+    HierarchyCacheManager,
+    IssueStoreManager,
+    MetricsCacheManager,
+    SprintIndexManager,
 )
 from app.utils import get_manager_config
 
+if TYPE_CHECKING:
+    from jira import JIRA
+
 
 class JIRAManager:
     @classmethod
-    def build(cls):
-        config = get_manager_config()
-        jira = JIRA(
+    def build(
+        cls,
+        config: Optional[ManagerConfig] = None,
+        jira: Optional["JIRA"] = None,
+        request_manager: Optional[RequestManager] = None,
+    ):
+        if config is None:
+            config = get_manager_config()
+        if config.replay is not None:
+            return cls(None, config, request_manager)
+
+        if request_manager is None:
+            request_manager = RequestManager.build(config)
+        if jira is None:
+            jira = cls.build_jira(config, request_manager)
+        issue_store = (
+            IssueStoreManager.build(config.project_name)
+            if config.use_issue_store
+            else None
+        )
+        metrics_cache = (
+            MetricsCacheManager.build(config.project_name)
+            if config.use_metrics_cache
+            else None
+        )
+        sprint_index = (
+            SprintIndexManager.build(config.project_name)
+            if config.use_sprint_index
+            else None
+        )
+        hierarchy_cache = (
+            HierarchyCacheManager.build(config.project_name)
+            if config.resolve_hierarchy
+            else None
+        )
+        return cls(
+            jira,
+            config,
+            request_manager,
+            issue_store,
+            metrics_cache,
+            sprint_index=sprint_index,
+            hierarchy_cache=hierarchy_cache,
+        )
+
+    @classmethod
+    def build_jira(
+        cls,
+        config: ManagerConfig,
+        request_manager: RequestManager,
+        pool_size: Optional[int] = None,
+    ) -> "JIRA":
+        from jira import JIRA
+        from requests.adapters import HTTPAdapter
+
+        pool_size = pool_size if pool_size is not None else config.max_workers
+        jira = request_manager.call(
+            JIRA,
             server=config.server_url,
             basic_auth=(config.email, config.jira_token),
+            max_retries=0,
         )
-        return cls(jira, config)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        jira._session.mount("https://", adapter)
+        jira._session.mount("http://", adapter)
+        return jira
 
-    def __init__(self, jira: JIRA, config: ManagerConfig):
+    def __init__(
+        self,
+        jira: Optional["JIRA"],
+        config: ManagerConfig,
+        request_manager: Optional[RequestManager] = None,
+        issue_store: Optional[IssueStoreManager] = None,
+        metrics_cache: Optional[MetricsCacheManager] = None,
+        instrumentation: Optional[InstrumentationManager] = None,
+        sprint_index: Optional[SprintIndexManager] = None,
+        hierarchy_cache: Optional[HierarchyCacheManager] = None,
+    ):
         self.jira = jira
         self.config = config
+        self.request_manager = (
+            request_manager
+            if request_manager is not None
+            else RequestManager.build(config)
+        )
+        self.issue_store = issue_store
+        self.metrics_cache = metrics_cache
+        self.sprint_index = sprint_index
+        self.hierarchy_cache = hierarchy_cache
+        self.parent_keys: Dict[str, Optional[str]] = {}
+        self.issue_registry: Dict[Tuple[str, str], List[SprintMembership]] = {}
+        self.metrics_manager = MetricsManager(config)
+        self.burndown_manager = BurndownManager(config)
+        self.instrumentation = (
+            instrumentation
+            if instrumentation is not None
+            else InstrumentationManager(config.project_name)
+        )
+        if jira is not None:
+            self.instrumentation.attach(jira)
 
     def get_sprint_metrics(self) -> List[SprintMetrics]:
-        sprints = self._get_sprint_issues()
-        metrics = []
-        for index, sprint_issues in enumerate(sprints):
-            tickets = self._parse_issues(sprint_issues.issues)
-            sprint_info = self._get_sprint_info(sprint_issues.sprint_id)
-            start_date = self._get_sprint_start_date(sprint_info)
-            end_date = self._get_sprint_end_date(sprint_info)
+        sprint_data = self.fetch_sprint_data()
+        metrics = self.compute_sprint_metrics(sprint_data)
+        return metrics
 
-            commitment = self._get_initial_sprint_commitment(tickets, start_date)
-            completed = self._get_completed_story_points(tickets)
-            scope_change = self._get_scope_change(tickets, start_date)
-            unpointed_breakdown = self._get_unpointed_breakdown(tickets)
-            priority_breakdown = self._priority_points_breakdown(tickets)
+    def fetch_sprint_data(self) -> SprintData:
+        with self.instrumentation.phase("list_sprints"):
+            sprints = self._get_sprints()
+        planned_capacities = self.get_planned_capacities(
+            [sprint.id for sprint in sprints]
+        )
+        sprint_data = self.fetch_sprints_data(sprints, planned_capacities)
+        return sprint_data
 
-            planned_capacity = (
-                self.config.planned_capacities[index]
-                if index < len(self.config.planned_capacities)
-                else 0
-            )
+    def fetch_sprints_data(
+        self, sprints: List[BoardSprint], planned_capacities: Dict[int, float]
+    ) -> SprintData:
+        fingerprints = self._get_metrics_fingerprints(planned_capacities)
+        closed_sprint_ids = [
+            sprint.id for sprint in sprints if sprint.state == SprintStates.CLOSED.value
+        ]
 
-            sprint_metrics = SprintMetrics(
-                planned_capacity=planned_capacity,
-                commitment=commitment,
-                completed=completed,
-                scope_change=scope_change,
-                start_date=start_date,
-                end_date=end_date,
-                unpointed_breakdown=unpointed_breakdown,
-                priority_breakdown=priority_breakdown,
+        cached_metrics = {}
+        if self.config.record_snapshot is None:
+            cached_metrics = self._get_cached_metrics(closed_sprint_ids, fingerprints)
+
+        uncached_sprint_ids = [
+            sprint.id for sprint in sprints if sprint.id not in cached_metrics
+        ]
+        sprints_issues = self._get_sprint_issues(uncached_sprint_ids)
+        self.resolve_hierarchy(
+            [
+                issue
+                for sprint_issues in sprints_issues
+                for issue in sprint_issues.issues
+            ]
+        )
+        sprint_data = SprintData(
+            sprint_ids=[sprint.id for sprint in sprints],
+            closed_sprint_ids=closed_sprint_ids,
+            planned_capacities=planned_capacities,
+            fingerprints=fingerprints,
+            cached_metrics=cached_metrics,
+            sprints_issues=sprints_issues,
+            parent_keys=dict(self.parent_keys),
+        )
+        return sprint_data
+
+    def stream_sprint_metrics(self) -> List[SprintMetrics]:
+        with self.instrumentation.phase("list_sprints"):
+            sprints = self._get_sprints()
+        sprint_ids = [sprint.id for sprint in sprints]
+        planned_capacities = self.get_planned_capacities(sprint_ids)
+        fingerprints = self._get_metrics_fingerprints(planned_capacities)
+        closed_sprint_ids = [
+            sprint.id for sprint in sprints if sprint.state == SprintStates.CLOSED.value
+        ]
+        cached_metrics = self._get_cached_metrics(closed_sprint_ids, fingerprints)
+
+        uncached_sprint_ids = [
+            sprint_id for sprint_id in sprint_ids if sprint_id not in cached_metrics
+        ]
+        computed_metrics = {}
+        if len(uncached_sprint_ids) > 0:
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                sprint_infos = list(
+                    executor.map(self._get_sprint_info, uncached_sprint_ids)
+                )
+                start_dates = [
+                    self._get_sprint_start_date(sprint_info)
+                    for sprint_info in sprint_infos
+                ]
+                ticket_metrics = self.metrics_manager.get_ticket_metrics(
+                    [[] for _ in uncached_sprint_ids], start_dates
+                )
+                for issues in self._stream_issue_pages(executor, uncached_sprint_ids):
+                    self.resolve_hierarchy(issues)
+                    with self.instrumentation.phase("parse_issues"):
+                        sprints_tickets = self._parse_issue_page(
+                            issues, uncached_sprint_ids, start_dates
+                        )
+                    self.instrumentation.count(
+                        "parse_issues",
+                        issues=len(issues),
+                        changelog_entries=sum(
+                            len(issue["changelog"]["histories"]) for issue in issues
+                        ),
+                    )
+                    with self.instrumentation.phase("compute_metrics"):
+                        ticket_metrics = self.metrics_manager.fold_ticket_metrics(
+                            ticket_metrics, sprints_tickets, start_dates
+                        )
+
+            computed_metrics = {
+                sprint_metrics.sprint_id: sprint_metrics
+                for sprint_metrics in self._build_sprints_metrics(
+                    uncached_sprint_ids,
+                    sprint_infos,
+                    planned_capacities,
+                    ticket_metrics,
+                )
+            }
+            self._put_cached_metrics(closed_sprint_ids, fingerprints, computed_metrics)
+
+        metrics = [
+            cached_metrics.get(sprint_id) or computed_metrics[sprint_id]
+            for sprint_id in sprint_ids
+        ]
+        return metrics
+
+    def get_board_sprints(self) -> List[BoardSprint]:
+        with self.instrumentation.phase("list_sprints"):
+            board_sprints = self._get_newest_board_sprints(None)
+        sprints = [
+            board_sprints[position] for position in sorted(board_sprints, reverse=True)
+        ]
+        return sprints
+
+    def get_planned_capacities(self, sprint_ids: List[int]) -> Dict[int, float]:
+        planned_capacities = {
+            sprint_id: self._get_planned_capacity(index)
+            for index, sprint_id in enumerate(sprint_ids)
+        }
+        return planned_capacities
+
+    def replay_sprint_data(self, snapshot: Snapshot) -> SprintData:
+        if self.config.past_n_sprints is not None:
+            states = [SprintStates.CLOSED.value, SprintStates.ACTIVE.value]
+            limit = self.config.past_n_sprints + 1
+        else:
+            states = [SprintStates.ACTIVE.value]
+            limit = 1
+        sprints = [sprint for sprint in snapshot.sprints if sprint.state in states]
+        sprints = sprints[:limit]
+
+        sprint_ids = [sprint.sprint_id for sprint in sprints]
+        planned_capacities = self.get_planned_capacities(sprint_ids)
+        sprint_data = SprintData(
+            sprint_ids=sprint_ids,
+            closed_sprint_ids=[
+                sprint.sprint_id
+                for sprint in sprints
+                if sprint.state == SprintStates.CLOSED.value
+            ],
+            planned_capacities=planned_capacities,
+            fingerprints=self._get_metrics_fingerprints(planned_capacities),
+            cached_metrics={},
+            sprints_issues=self._group_sprint_issues(
+                sprint_ids,
+                [sprint.sprint_info for sprint in sprints],
+                snapshot.issues,
+            ),
+            parent_keys=snapshot.parent_keys,
+        )
+        return sprint_data
+
+    def get_snapshot(self, sprint_data: SprintData) -> Snapshot:
+        issues = {}
+        for sprint_issues in sprint_data.sprints_issues:
+            for issue in sprint_issues.issues:
+                issues[issue["key"]] = issue
+
+        snapshot = Snapshot(
+            project_name=self.config.project_name,
+            board_id=self.config.board_id,
+            recorded_at=datetime.now(pytz.UTC),
+            sprints=[
+                SnapshotSprint(
+                    sprint_id=sprint_issues.sprint_id,
+                    state=SprintStates.CLOSED.value
+                    if sprint_issues.sprint_id in sprint_data.closed_sprint_ids
+                    else SprintStates.ACTIVE.value,
+                    sprint_info=sprint_issues.sprint_info,
+                )
+                for sprint_issues in sprint_data.sprints_issues
+            ],
+            issues=list(issues.values()),
+            parent_keys=sprint_data.parent_keys,
+        )
+        return snapshot
+
+    def compute_sprint_metrics(self, sprint_data: SprintData) -> List[SprintMetrics]:
+        self.parent_keys.update(sprint_data.parent_keys)
+        computed_metrics = {
+            sprint_metrics.sprint_id: sprint_metrics
+            for sprint_metrics in self._compute_sprints_metrics(
+                sprint_data.sprints_issues, sprint_data.planned_capacities
             )
-            metrics.append(sprint_metrics)
+        }
+
+        self._put_cached_metrics(
+            sprint_data.closed_sprint_ids, sprint_data.fingerprints, computed_metrics
+        )
+
+        metrics = [
+            sprint_data.cached_metrics.get(sprint_id) or computed_metrics[sprint_id]
+            for sprint_id in sprint_data.sprint_ids
+        ]
         return metrics
 
-    def _parse_issues(self, issues: List[Issue]) -> List[JiraTicket]:
-        tickets: List[JiraTicket] = []
-        for issue in issues:
-            issue_type = issue.fields.issuetype.name
-            story_points = self._get_issue_story_points(issue)
-            epic_key = self._get_epic_key(issue)
-            status = issue.fields.status.name
-            date_added = self._get_date_issue_added_to_sprint(issue)
-            ticket = JiraTicket(
-                issue_type=issue_type,
-                story_points=story_points,
-                epic_key=epic_key,
-                status=status,
-                date_added=date_added,
-            )
-            tickets.append(ticket)
+    def get_issue_fields(self) -> List[str]:
+        issue_fields = [
+            self.config.story_points_field,
+            self.config.sprint_field,
+            *ISSUE_FIELDS,
+        ]
+        return issue_fields
+
+    def fetch_issue(self, key: str) -> Optional[Dict]:
+        issues = self._search_issues_page(f"key = {key}", 0)["issues"]
+        return issues[0] if len(issues) > 0 else None
+
+    def get_sprint_start_dates(self, sprint_data: SprintData) -> Dict[int, datetime]:
+        start_dates = {
+            sprint_issues.sprint_id: self._get_sprint_start_date(
+                sprint_issues.sprint_info
+            )
+            for sprint_issues in sprint_data.sprints_issues
+        }
+        return start_dates
+
+    def resolve_hierarchy(self, issues: List[Dict]) -> None:
+        if not self.config.resolve_hierarchy:
+            return None
+
+        with self.instrumentation.phase("hierarchy"):
+            self.parent_keys.update(
+                (issue["key"], self._get_parent_key(issue)) for issue in issues
+            )
+            unresolved_keys = self._get_unresolved_keys(
+                [issue["key"] for issue in issues]
+            )
+            while len(unresolved_keys) > 0:
+                self.parent_keys.update(self._get_parent_keys(unresolved_keys))
+                unresolved_keys = self._get_unresolved_keys(unresolved_keys)
+
+    def get_issue_tickets(
+        self, issue: Dict, start_dates: Dict[int, datetime]
+    ) -> Dict[int, JiraTicket]:
+        sprint_memberships = self._get_registered_sprint_memberships(issue)
+        tickets = {
+            sprint_id: self._get_ticket(
+                issue, sprint_id, start_dates[sprint_id], sprint_memberships
+            )
+            for sprint_id in set(self._get_issue_sprint_ids(issue))
+            if sprint_id in start_dates
+        }
         return tickets
 
-    def _priority_points_breakdown(
-        self, tickets: List[JiraTicket]
-    ) -> PriorityPointsBreakdown:
-        priority_points = 0
-        non_priority_points = 0
+    def forget_issue(self, issue: Dict) -> None:
+        self.issue_registry.pop((issue["key"], issue["fields"]["updated"]), None)
 
-        for ticket in tickets:
-            if ticket.story_points is None:
-                continue
+    def build_sprint_metrics(
+        self,
+        sprint_id: int,
+        sprint_info: Dict,
+        planned_capacity: float,
+        ticket_metrics: TicketMetrics,
+    ) -> SprintMetrics:
+        sprint_metrics = self._build_sprints_metrics(
+            [sprint_id], [sprint_info], {sprint_id: planned_capacity}, [ticket_metrics]
+        )[0]
+        return sprint_metrics
 
-            if (
-                ticket.epic_key is not None
-                and ticket.epic_key in self.config.priority_epics
-            ):
-                priority_points += ticket.story_points
-            else:
-                non_priority_points += ticket.story_points
+    def _get_cached_metrics(
+        self, closed_sprint_ids: List[int], fingerprints: Dict[int, str]
+    ) -> Dict[int, SprintMetrics]:
+        if self.metrics_cache is None:
+            return {}
 
-        priority_points_breakdown = PriorityPointsBreakdown(
-            priority_points=priority_points,
-            non_priority_points=non_priority_points,
+        with self.instrumentation.phase("metrics_cache"):
+            cached_metrics = self.metrics_cache.get_metrics(
+                {sprint_id: fingerprints[sprint_id] for sprint_id in closed_sprint_ids}
+            )
+        return cached_metrics
+
+    def _put_cached_metrics(
+        self,
+        closed_sprint_ids: List[int],
+        fingerprints: Dict[int, str],
+        computed_metrics: Dict[int, SprintMetrics],
+    ) -> None:
+        if self.metrics_cache is None:
+            return None
+
+        with self.instrumentation.phase("metrics_cache"):
+            self.metrics_cache.put_metrics(
+                [
+                    computed_metrics[sprint_id]
+                    for sprint_id in closed_sprint_ids
+                    if sprint_id in computed_metrics
+                ],
+                fingerprints,
+            )
+
+    def _compute_sprints_metrics(
+        self, sprints_issues: List[SprintIssues], planned_capacities: Dict[int, float]
+    ) -> List[SprintMetrics]:
+        start_dates = [
+            self._get_sprint_start_date(sprint_issues.sprint_info)
+            for sprint_issues in sprints_issues
+        ]
+
+        with self.instrumentation.phase("sprint_memberships"):
+            sprints_memberships = self._get_sprints_memberships(sprints_issues)
+        self.resolve_hierarchy(
+            [
+                issue
+                for sprint_issues in sprints_issues
+                for issue in sprint_issues.issues
+            ]
         )
-        return priority_points_breakdown
 
-    def _get_completed_story_points(self, tickets: List[JiraTicket]) -> int:
-        completed_story_points = 0
-        for ticket in tickets:
-            if ticket.status == self.config.complete_status:
-                completed_story_points += (
-                    ticket.story_points if ticket.story_points is not None else 0
+        sprints_tickets = []
+        for sprint_issues, start_date in zip(sprints_issues, start_dates):
+            with self.instrumentation.phase("parse_issues", sprint_issues.sprint_id):
+                sprints_tickets.append(
+                    self._parse_issues(
+                        sprint_issues.issues,
+                        sprint_issues.sprint_id,
+                        start_date,
+                        sprints_memberships,
+                    )
                 )
+            self.instrumentation.count(
+                "parse_issues",
+                sprint_issues.sprint_id,
+                issues=len(sprint_issues.issues),
+                changelog_entries=sum(
+                    len(issue["changelog"]["histories"])
+                    for issue in sprint_issues.issues
+                ),
+            )
+        with self.instrumentation.phase("compute_metrics"):
+            ticket_metrics = self.metrics_manager.get_ticket_metrics(
+                sprints_tickets, start_dates
+            )
+
+        metrics = self._build_sprints_metrics(
+            [sprint_issues.sprint_id for sprint_issues in sprints_issues],
+            [sprint_issues.sprint_info for sprint_issues in sprints_issues],
+            planned_capacities,
+            ticket_metrics,
+        )
+        return metrics
+
+    def _build_sprints_metrics(
+        self,
+        sprint_ids: List[int],
+        sprint_infos: List[Dict],
+        planned_capacities: Dict[int, float],
+        ticket_metrics: List[TicketMetrics],
+    ) -> List[SprintMetrics]:
+        metrics = []
+        for sprint_id, sprint_info, sprint_ticket_metrics in zip(
+            sprint_ids, sprint_infos, ticket_metrics
+        ):
+            sprint_metrics = SprintMetrics(
+                sprint_id=sprint_id,
+                planned_capacity=planned_capacities[sprint_id],
+                start_date=self._get_sprint_start_date(sprint_info),
+                end_date=self._get_sprint_end_date(sprint_info),
+                **sprint_ticket_metrics.dict(),
+            )
+            metrics.append(sprint_metrics)
+        return metrics
 
-        return completed_story_points
+    def compute_sprint_burndowns(self, sprint_data: SprintData) -> List[SprintBurndown]:
+        with self.instrumentation.phase("sprint_memberships"):
+            sprints_memberships = self._get_sprints_memberships(
+                sprint_data.sprints_issues
+            )
 
-    def _get_unpointed_breakdown(self, tickets: List[JiraTicket]) -> UnpointedBreakdown:
-        breakdown = {}
+        until = datetime.now(pytz.UTC)
+        burndowns = []
+        for sprint_issues in sprint_data.sprints_issues:
+            with self.instrumentation.phase("burndown", sprint_issues.sprint_id):
+                issues, events = self._get_burndown_events(
+                    sprint_issues.issues, sprint_issues.sprint_id, sprints_memberships
+                )
+                burndown = self.burndown_manager.get_sprint_burndown(
+                    sprint_issues.sprint_id,
+                    self._get_sprint_start_date(sprint_issues.sprint_info),
+                    self._get_sprint_end_date(sprint_issues.sprint_info),
+                    issues,
+                    events,
+                    until,
+                )
+            burndowns.append(burndown)
+        return burndowns
 
-        for ticket in tickets:
-            if ticket.story_points is None:
-                issue_type = ticket.issue_type
-                breakdown[issue_type] = breakdown.get(issue_type, 0) + 1
+    def _get_sprints_memberships(
+        self, sprints_issues: List[SprintIssues]
+    ) -> Dict[str, List[SprintMembership]]:
+        sprints_memberships = {
+            issue["key"]: self._get_registered_sprint_memberships(issue)
+            for sprint_issues in sprints_issues
+            for issue in sprint_issues.issues
+        }
+        return sprints_memberships
 
-        unpointed_breakdown = UnpointedBreakdown(
-            unpointed_stories=breakdown.get(IssueTypeEnum.STORY.value, 0),
-            unpointed_tasks=breakdown.get(IssueTypeEnum.TASK.value, 0),
-            unpointed_bugs=breakdown.get(IssueTypeEnum.BUG.value, 0),
-        )
-        return unpointed_breakdown
+    def _get_burndown_events(
+        self,
+        issues: List[Dict],
+        sprint_id: int,
+        sprints_memberships: Dict[str, List[SprintMembership]],
+    ) -> Tuple[List[BurndownIssue], List[BurndownEvent]]:
+        burndown_issues = []
+        events = []
+        for index, issue in enumerate(issues):
+            for membership in sprints_memberships[issue["key"]]:
+                if membership.sprint_id != sprint_id:
+                    continue
+                events.append(
+                    BurndownEvent(membership.added, index, BurndownEventTypes.ADDED)
+                )
+                if membership.removed is not None:
+                    events.append(
+                        BurndownEvent(
+                            membership.removed, index, BurndownEventTypes.REMOVED
+                        )
+                    )
+
+            story_points = self._get_issue_story_points(issue)
+            is_complete = (
+                issue["fields"]["status"]["name"] == self.config.complete_status
+            )
+            initial_story_points = None
+            initial_is_complete = None
+            for history in issue["changelog"]["histories"]:
+                for item in history["items"]:
+                    if item.get("fieldId") == self.config.story_points_field:
+                        if initial_story_points is None:
+                            initial_story_points = self._parse_changelog_story_points(
+                                item["fromString"]
+                            )
+                        events.append(
+                            BurndownEvent(
+                                self._convert_created_history_timestamp(
+                                    history["created"]
+                                ),
+                                index,
+                                BurndownEventTypes.STORY_POINTS,
+                                self._parse_changelog_story_points(item["toString"]),
+                            )
+                        )
+                    elif item["field"] == "status":
+                        if initial_is_complete is None:
+                            initial_is_complete = (
+                                item["fromString"] == self.config.complete_status
+                            )
+                        events.append(
+                            BurndownEvent(
+                                self._convert_created_history_timestamp(
+                                    history["created"]
+                                ),
+                                index,
+                                BurndownEventTypes.COMPLETED
+                                if item["toString"] == self.config.complete_status
+                                else BurndownEventTypes.REOPENED,
+                            )
+                        )
+
+            burndown_issue = BurndownIssue(
+                story_points=initial_story_points
+                if initial_story_points is not None
+                else float(story_points or 0),
+                is_complete=initial_is_complete
+                if initial_is_complete is not None
+                else is_complete,
+            )
+            burndown_issues.append(burndown_issue)
+        return burndown_issues, events
 
-    def _get_initial_sprint_commitment(
-        self, tickets: List[JiraTicket], start_date: datetime
-    ) -> int:
-        commitment = 0
+    def _parse_changelog_story_points(self, story_points: Optional[str]) -> float:
+        if story_points is None or story_points.strip() == "":
+            return 0.0
+        return float(story_points)
 
-        for ticket in tickets:
-            if ticket.date_added < start_date:
-                issue_points = ticket.story_points
-                commitment += issue_points if issue_points is not None else 0
-        return commitment
+    def _get_metrics_fingerprints(
+        self, planned_capacities: Dict[int, float]
+    ) -> Dict[int, str]:
+        fingerprints = {
+            sprint_id: self._get_metrics_fingerprint(planned_capacity)
+            for sprint_id, planned_capacity in planned_capacities.items()
+        }
+        return fingerprints
 
-    def _get_scope_change(self, tickets: List[JiraTicket], start_date: datetime) -> int:
-        scope_change = 0
+    def _get_planned_capacity(self, index: int) -> float:
+        planned_capacity = (
+            self.config.planned_capacities[index]
+            if index < len(self.config.planned_capacities)
+            else 0
+        )
+        return planned_capacity
+
+    def _get_metrics_fingerprint(self, planned_capacity: float) -> str:
+        fingerprint_config = {
+            "version": METRICS_CACHE_VERSION,
+            "complete_status": self.config.complete_status,
+            "priority_epics": sorted(self.config.priority_epics),
+            "resolve_hierarchy": self.config.resolve_hierarchy,
+            "story_points_field": self.config.story_points_field,
+            "planned_capacity": planned_capacity,
+        }
+        serialized_config = json.dumps(fingerprint_config, sort_keys=True)
+        fingerprint = hashlib.sha256(serialized_config.encode()).hexdigest()
+        return fingerprint
 
-        for ticket in tickets:
-            if ticket.date_added > start_date:
-                issue_points = ticket.story_points
-                scope_change += issue_points if issue_points is not None else 0
+    def _parse_issues(
+        self,
+        issues: List[Dict],
+        sprint_id: int,
+        start_date: datetime,
+        sprints_memberships: Dict[str, List[SprintMembership]],
+    ) -> List[JiraTicket]:
+        tickets: List[JiraTicket] = [
+            self._get_ticket(
+                issue, sprint_id, start_date, sprints_memberships[issue["key"]]
+            )
+            for issue in issues
+        ]
+        return tickets
 
-        return scope_change
+    def _parse_issue_page(
+        self,
+        issues: List[Dict],
+        sprint_ids: List[int],
+        start_dates: List[datetime],
+    ) -> List[List[JiraTicket]]:
+        sprint_indexes = {
+            sprint_id: index for index, sprint_id in enumerate(sprint_ids)
+        }
+        sprints_tickets: List[List[JiraTicket]] = [[] for _ in sprint_ids]
+        for issue in issues:
+            sprint_memberships = self._get_registered_sprint_memberships(issue)
+            for sprint_id in set(self._get_issue_sprint_ids(issue)):
+                if sprint_id not in sprint_indexes:
+                    continue
+                index = sprint_indexes[sprint_id]
+                sprints_tickets[index].append(
+                    self._get_ticket(
+                        issue, sprint_id, start_dates[index], sprint_memberships
+                    )
+                )
+        return sprints_tickets
 
-    def _get_sprint_issues(self) -> List[SprintIssues]:
-        sprints = self.jira.sprints(board_id=self.config.board_id)
-        sprints = reversed(sprints)
+    def _get_ticket(
+        self,
+        issue: Dict,
+        sprint_id: int,
+        start_date: datetime,
+        sprint_memberships: List[SprintMembership],
+    ) -> JiraTicket:
+        fields = issue["fields"]
+        ticket = JiraTicket(
+            issue_type=fields["issuetype"]["name"],
+            story_points=self._get_issue_story_points(issue),
+            epic_key=self._get_epic_key(issue),
+            status=fields["status"]["name"],
+            date_added=self._get_date_issue_added_to_sprint(
+                sprint_memberships, sprint_id, start_date
+            ),
+        )
+        return ticket
 
+    def _get_sprints(self) -> List[BoardSprint]:
         if self.config.past_n_sprints is not None:
             states = [SprintStates.CLOSED.value, SprintStates.ACTIVE.value]
             limit = self.config.past_n_sprints + 1
@@ -165,48 +735,517 @@ class JIRAManager:
             states = [SprintStates.ACTIVE.value]
             limit = 1
 
+        board_sprints = self._get_newest_board_sprints(limit)
+        last_position = max(board_sprints, default=-1)
+        sprints = [
+            board_sprints[position]
+            for position in range(last_position, last_position - limit, -1)
+            if position in board_sprints
+        ]
+
         filtered_sprints = list(filter(lambda sprint: sprint.state in states, sprints))
         filtered_sprints = filtered_sprints[:limit]
+        return filtered_sprints
+
+    def _get_newest_board_sprints(self, count: Optional[int]) -> Dict[int, BoardSprint]:
+        closed_sprints = {}
+        if self.sprint_index is not None:
+            closed_sprints = self.sprint_index.get_closed_sprints(self.config.board_id)
+
+        start_at = max(closed_sprints, default=0)
+        page = self._get_board_sprints_page(start_at)
+        page_sprints = self._parse_board_sprints(page)
+        if len(closed_sprints) > 0 and (
+            start_at not in page_sprints
+            or page_sprints[start_at].id != closed_sprints[start_at].id
+        ):
+            self.sprint_index.clear(self.config.board_id)
+            closed_sprints = {}
+            page = self._get_board_sprints_page(0)
+            page_sprints = self._parse_board_sprints(page)
+
+        board_sprints = dict(closed_sprints)
+        board_sprints.update(page_sprints)
+        next_position = page["startAt"] + len(page["values"])
+        total = page.get("total")
+        if count is not None and total is not None and total - count > next_position:
+            page = self._get_board_sprints_page(total - count)
+            board_sprints.update(self._parse_board_sprints(page))
+            next_position = page["startAt"] + len(page["values"])
+
+        while not page["isLast"] and len(page["values"]) > 0:
+            page = self._get_board_sprints_page(next_position)
+            board_sprints.update(self._parse_board_sprints(page))
+            next_position = page["startAt"] + len(page["values"])
+
+        last_position = max(board_sprints, default=-1)
+        first_position = 0 if count is None else max(0, last_position - count + 1)
+        missing_positions = [
+            position
+            for position in range(first_position, last_position + 1)
+            if position not in board_sprints
+        ]
+        next_position = min(missing_positions, default=last_position + 1)
+        while next_position <= last_position:
+            page = self._get_board_sprints_page(next_position)
+            if len(page["values"]) == 0:
+                break
+            board_sprints.update(self._parse_board_sprints(page))
+            next_position = page["startAt"] + len(page["values"])
+
+        if self.sprint_index is not None:
+            self.sprint_index.put_closed_sprints(
+                self.config.board_id,
+                {
+                    position: sprint
+                    for position, sprint in board_sprints.items()
+                    if sprint.state == SprintStates.CLOSED.value
+                    and position not in closed_sprints
+                },
+            )
+        return board_sprints
+
+    def _get_board_sprints_page(self, start_at: int) -> Dict:
+        page = self.request_manager.call(
+            self.jira._get_json,
+            f"board/{self.config.board_id}/sprint",
+            params={
+                "state": ",".join(
+                    [
+                        SprintStates.ACTIVE.value.lower(),
+                        SprintStates.CLOSED.value.lower(),
+                    ]
+                ),
+                "startAt": start_at,
+                "maxResults": BOARD_SPRINT_PAGE_SIZE,
+            },
+            base=AGILE_BASE_URL,
+        )
+        return page
+
+    def _parse_board_sprints(self, page: Dict) -> Dict[int, BoardSprint]:
+        board_sprints = {
+            page["startAt"]
+            + index: BoardSprint(
+                id=sprint["id"],
+                name=sprint["name"],
+                state=sprint["state"].upper(),
+                start_date=self._parse_agile_date(sprint.get("startDate")),
+                end_date=self._parse_agile_date(sprint.get("endDate")),
+            )
+            for index, sprint in enumerate(page["values"])
+        }
+        return board_sprints
+
+    def _parse_agile_date(self, date: Optional[str]) -> Optional[datetime]:
+        if date is None:
+            return None
+        parsed_date = datetime.strptime(date, AGILE_DATE_FORMAT)
+        return parsed_date
+
+    def _get_sprint_issues(self, sprint_ids: List[int]) -> List[SprintIssues]:
+        if len(sprint_ids) == 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            sprint_infos = executor.map(self._get_sprint_info, sprint_ids)
+            if self.issue_store is None:
+                issues = self._search_issues(
+                    executor, self._get_sprint_jqls(sprint_ids)
+                )
+                self._count_avoided_downloads(issues, sprint_ids)
+            else:
+                issues = self._sync_issue_store(executor, sprint_ids)
+            sprint_issues = self._group_sprint_issues(
+                sprint_ids, list(sprint_infos), issues
+            )
+        return sprint_issues
+
+    def _group_sprint_issues(
+        self, sprint_ids: List[int], sprint_infos: List[Dict], issues: List[Dict]
+    ) -> List[SprintIssues]:
+        issues_by_sprint = {sprint_id: [] for sprint_id in sprint_ids}
+        for issue in issues:
+            for sprint_id in self._get_issue_sprint_ids(issue):
+                if sprint_id in issues_by_sprint:
+                    issues_by_sprint[sprint_id].append(issue)
 
         sprint_issues = []
-        for sprint in filtered_sprints:
-            jql = f"project = {self.config.project_name} AND sprint = {sprint.id}"
-            issues = self.jira.search_issues(
-                jql_str=jql,
-                fields=f"{self.config.story_points_field},status,issuetype,parent",
-                expand="changelog",
+        for sprint_id, sprint_info in zip(sprint_ids, sprint_infos):
+            sprint_issue = SprintIssues(
+                sprint_id=sprint_id,
+                issues=issues_by_sprint[sprint_id],
+                sprint_info=sprint_info,
             )
-            sprint_issue = SprintIssues(sprint_id=sprint.id, issues=issues)
             sprint_issues.append(sprint_issue)
         return sprint_issues
 
-    def _get_issue_story_points(self, issue: Issue) -> Optional[int]:
-        issue_points = issue.raw["fields"][self.config.story_points_field]
-        return issue_points
+    def _sync_issue_store(
+        self, executor: ThreadPoolExecutor, sprint_ids: List[int]
+    ) -> List[Dict]:
+        synced_at = datetime.now(pytz.UTC)
+        jqls, unsynced_sprint_ids = self._get_issue_store_sync_jqls(sprint_ids)
+        updated_issues = self._search_issues(executor, jqls)
+        self._count_avoided_downloads(updated_issues, unsynced_sprint_ids)
+        with self.instrumentation.phase("issue_store"):
+            issues = self._update_issue_store(updated_issues, sprint_ids, synced_at)
+        return issues
+
+    def _get_issue_store_sync_jqls(
+        self, sprint_ids: List[int]
+    ) -> Tuple[List[str], List[int]]:
+        last_syncs = self.issue_store.get_last_syncs(sprint_ids)
+        unsynced_sprint_ids = [
+            sprint_id for sprint_id in sprint_ids if sprint_id not in last_syncs
+        ]
+
+        jqls = self._get_sprint_jqls(unsynced_sprint_ids)
+        if len(last_syncs) > 0:
+            overlap = timedelta(hours=ISSUE_STORE_SYNC_OVERLAP_HOURS)
+            updated_since = min(last_syncs.values()) - overlap
+            jqls.append(
+                f"project = {self.config.project_name} AND "
+                f'updated >= "{updated_since.strftime("%Y/%m/%d %H:%M")}"'
+            )
+        return jqls, unsynced_sprint_ids
+
+    def _update_issue_store(
+        self, updated_issues: List[Dict], sprint_ids: List[int], synced_at: datetime
+    ) -> List[Dict]:
+        self._store_issues(updated_issues)
+        self.issue_store.mark_synced(sprint_ids, synced_at)
+
+        issues = self.issue_store.get_issues(sprint_ids)
+        return issues
+
+    def _store_issues(self, issues: List[Dict]) -> None:
+        stored_issues = [
+            StoredIssue(
+                key=issue["key"],
+                updated=issue["fields"]["updated"],
+                raw=issue,
+                sprint_ids=self._get_issue_sprint_ids(issue),
+            )
+            for issue in issues
+        ]
+        self.issue_store.upsert_issues(stored_issues)
+
+    def _stream_issue_pages(
+        self, executor: ThreadPoolExecutor, sprint_ids: List[int]
+    ) -> Iterator[List[Dict]]:
+        if self.issue_store is None:
+            jqls = self._get_sprint_jqls(sprint_ids)
+            for issues in self._stream_search_pages(executor, jqls):
+                self._count_avoided_downloads(issues, sprint_ids)
+                yield issues
+            return None
+
+        synced_at = datetime.now(pytz.UTC)
+        jqls, unsynced_sprint_ids = self._get_issue_store_sync_jqls(sprint_ids)
+        for issues in self._stream_search_pages(executor, jqls):
+            self._count_avoided_downloads(issues, unsynced_sprint_ids)
+            with self.instrumentation.phase("issue_store"):
+                self._store_issues(issues)
+        self.issue_store.mark_synced(sprint_ids, synced_at)
+
+        for issues in self.issue_store.iter_issue_pages(sprint_ids, SEARCH_PAGE_SIZE):
+            yield issues
 
-    def _get_epic_key(self, issue: Issue) -> Optional[str]:
-        if hasattr(issue.fields, "parent"):
-            return issue.fields.parent.key
+    def _stream_search_pages(
+        self, executor: ThreadPoolExecutor, jqls: List[str]
+    ) -> Iterator[List[Dict]]:
+        max_pages_in_flight = (
+            self.config.max_workers * STREAM_PAGES_IN_FLIGHT_PER_WORKER
+        )
+        queued_pages = deque((jql_index, 0) for jql_index in range(len(jqls)))
+        pages_in_flight: Dict[Future, Tuple[int, int]] = {}
+        while len(queued_pages) > 0 or len(pages_in_flight) > 0:
+            while len(queued_pages) > 0 and len(pages_in_flight) < max_pages_in_flight:
+                jql_index, start_at = queued_pages.popleft()
+                future = executor.submit(
+                    self._search_issues_page, jqls[jql_index], start_at
+                )
+                pages_in_flight[future] = (jql_index, start_at)
+
+            done, _ = wait(pages_in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                jql_index, start_at = pages_in_flight.pop(future)
+                page = future.result()
+                page_size = len(page["issues"])
+                if start_at == 0 and page_size > 0:
+                    queued_pages.extend(
+                        (jql_index, next_start_at)
+                        for next_start_at in range(page_size, page["total"], page_size)
+                    )
+                yield page.pop("issues")
+
+    def _get_sprint_jqls(self, sprint_ids: List[int]) -> List[str]:
+        jqls = []
+        for index in range(0, len(sprint_ids), SPRINT_QUERY_CHUNK_SIZE):
+            chunk = sprint_ids[index : index + SPRINT_QUERY_CHUNK_SIZE]
+            sprints = ", ".join(str(sprint_id) for sprint_id in chunk)
+            jql = f"project = {self.config.project_name} AND sprint in ({sprints})"
+            if index > 0:
+                queried_sprints = ", ".join(
+                    str(sprint_id) for sprint_id in sprint_ids[:index]
+                )
+                jql += f" AND sprint not in ({queried_sprints})"
+            jqls.append(jql)
+        return jqls
+
+    def _count_avoided_downloads(
+        self, issues: List[Dict], sprint_ids: List[int]
+    ) -> None:
+        chunk_indexes = {
+            sprint_id: index // SPRINT_QUERY_CHUNK_SIZE
+            for index, sprint_id in enumerate(sprint_ids)
+        }
+        downloads_avoided = 0
+        for issue in issues:
+            issue_chunk_indexes = {
+                chunk_indexes[sprint_id]
+                for sprint_id in self._get_issue_sprint_ids(issue)
+                if sprint_id in chunk_indexes
+            }
+            downloads_avoided += max(0, len(issue_chunk_indexes) - 1)
+        self.instrumentation.count("search_issues", downloads_avoided=downloads_avoided)
+
+    def _search_issues(
+        self, executor: ThreadPoolExecutor, jqls: List[str]
+    ) -> List[Dict]:
+        first_pages = list(executor.map(self._search_issues_page, jqls, repeat(0)))
+
+        remaining_pages = []
+        for jql, first_page in zip(jqls, first_pages):
+            page_size = len(first_page["issues"])
+            if page_size == 0:
+                continue
+            for start_at in range(page_size, first_page["total"], page_size):
+                future = executor.submit(self._search_issues_page, jql, start_at)
+                remaining_pages.append(future)
+
+        issues = {
+            issue["key"]: issue for page in first_pages for issue in page["issues"]
+        }
+        for future in remaining_pages:
+            issues.update((issue["key"], issue) for issue in future.result()["issues"])
+        return list(issues.values())
+
+    def _search_issues_page(self, jql: str, start_at: int) -> Dict:
+        with self.instrumentation.phase("search_issues"):
+            issues = self.request_manager.call(
+                self.jira.search_issues,
+                jql_str=jql,
+                startAt=start_at,
+                maxResults=SEARCH_PAGE_SIZE,
+                fields=",".join(self.get_issue_fields()),
+                expand="changelog",
+                json_result=True,
+            )
+        self.instrumentation.count("search_issues", issues=len(issues["issues"]))
+        return issues
+
+    def _get_issue_sprint_ids(self, issue: Dict) -> List[int]:
+        sprints = issue["fields"].get(self.config.sprint_field) or []
+        sprint_ids = []
+        for sprint in sprints:
+            if isinstance(sprint, dict):
+                sprint_ids.append(int(sprint["id"]))
+            else:
+                match = LEGACY_SPRINT_ID_PATTERN.search(sprint)
+                if match is not None:
+                    sprint_ids.append(int(match.group(1)))
+        return sprint_ids
+
+    def _get_issue_story_points(self, issue: Dict) -> Optional[int]:
+        issue_points = issue["fields"].get(self.config.story_points_field)
+        return int(issue_points) if issue_points is not None else None
+
+    def _get_epic_key(self, issue: Dict) -> Optional[str]:
+        parent_key = self._get_parent_key(issue)
+        if not self.config.resolve_hierarchy:
+            return parent_key
+
+        visited_keys = {issue["key"]}
+        key = parent_key
+        while key is not None and key not in visited_keys:
+            if key in self.config.priority_epics:
+                return key
+            visited_keys.add(key)
+            key = self.parent_keys.get(key)
+        return parent_key
+
+    def _get_parent_key(self, issue: Dict) -> Optional[str]:
+        parent = issue["fields"].get("parent")
+        if parent is not None:
+            return parent["key"]
         else:
             return None
 
-    def _get_date_issue_added_to_sprint(self, issue: Issue) -> datetime:
-        added_dt = None
-        for history in issue.changelog.histories:
-            if history.items[0].field == "Sprint":
-                added_dt = history.created
-        added_datetime = self._convert_created_history_timestamp(added_dt)
-        return added_datetime
+    def _get_unresolved_keys(self, keys: List[str]) -> List[str]:
+        unresolved_keys = set()
+        for key in keys:
+            visited_keys = set()
+            while key is not None and key not in visited_keys:
+                if key in self.config.priority_epics:
+                    break
+                if key not in self.parent_keys:
+                    unresolved_keys.add(key)
+                    break
+                visited_keys.add(key)
+                key = self.parent_keys[key]
+        return sorted(unresolved_keys)
+
+    def _get_parent_keys(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        parent_keys: Dict[str, Optional[str]] = {}
+        if self.hierarchy_cache is not None:
+            fetched_since = datetime.now(pytz.UTC) - timedelta(
+                hours=self.config.hierarchy_cache_ttl_hours
+            )
+            for index in range(0, len(keys), HIERARCHY_QUERY_CHUNK_SIZE):
+                parent_keys.update(
+                    self.hierarchy_cache.get_parent_keys(
+                        keys[index : index + HIERARCHY_QUERY_CHUNK_SIZE], fetched_since
+                    )
+                )
+
+        uncached_keys = [key for key in keys if key not in parent_keys]
+        if len(uncached_keys) == 0:
+            return parent_keys
+
+        fetched_at = datetime.now(pytz.UTC)
+        fetched_parent_keys = self._fetch_parent_keys(uncached_keys)
+        if self.hierarchy_cache is not None and self.jira is not None:
+            self.hierarchy_cache.put_parent_keys(fetched_parent_keys, fetched_at)
+        parent_keys.update(fetched_parent_keys)
+        return parent_keys
+
+    def _fetch_parent_keys(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        parent_keys: Dict[str, Optional[str]] = {key: None for key in keys}
+        if self.jira is None:
+            return parent_keys
+
+        jqls = [
+            "key in ({})".format(
+                ", ".join(keys[index : index + HIERARCHY_QUERY_CHUNK_SIZE])
+            )
+            for index in range(0, len(keys), HIERARCHY_QUERY_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            for issues in executor.map(self._search_parent_keys_page, jqls):
+                parent_keys.update(
+                    (issue["key"], self._get_parent_key(issue))
+                    for issue in issues
+                    if issue["key"] in parent_keys
+                )
+        return parent_keys
+
+    def _search_parent_keys_page(self, jql: str) -> List[Dict]:
+        with self.instrumentation.phase("search_parents"):
+            issues = self.request_manager.call(
+                self.jira.search_issues,
+                jql_str=jql,
+                maxResults=HIERARCHY_QUERY_CHUNK_SIZE,
+                fields="parent",
+                validate_query=False,
+                json_result=True,
+            )["issues"]
+        self.instrumentation.count("search_parents", issues=len(issues))
+        return issues
+
+    def _get_date_issue_added_to_sprint(
+        self,
+        sprint_memberships: List[SprintMembership],
+        sprint_id: int,
+        start_date: datetime,
+    ) -> datetime:
+        memberships = [
+            membership
+            for membership in sprint_memberships
+            if membership.sprint_id == sprint_id
+        ]
+        for membership in memberships:
+            if membership.added < start_date and (
+                membership.removed is None or membership.removed > start_date
+            ):
+                return membership.added
+
+        if len(memberships) == 0:
+            return start_date
+        return max(membership.added for membership in memberships)
+
+    def _get_registered_sprint_memberships(self, issue: Dict) -> List[SprintMembership]:
+        registry_key = (issue["key"], issue["fields"]["updated"])
+        if registry_key not in self.issue_registry:
+            self.issue_registry[registry_key] = self._get_sprint_memberships(issue)
+        return self.issue_registry[registry_key]
+
+    def _get_sprint_memberships(self, issue: Dict) -> List[SprintMembership]:
+        sprint_changes = []
+        for history in issue["changelog"]["histories"]:
+            for item in history["items"]:
+                if item["field"] == "Sprint":
+                    sprint_changes.append(
+                        (
+                            self._convert_created_history_timestamp(history["created"]),
+                            self._parse_changelog_sprint_ids(item["from"]),
+                            self._parse_changelog_sprint_ids(item["to"]),
+                        )
+                    )
+        sprint_changes.sort(key=lambda sprint_change: sprint_change[0])
+
+        created = self._get_issue_created_date(issue)
+        added_dates: Dict[int, datetime] = {}
+        memberships = []
+        for changed, from_sprint_ids, to_sprint_ids in sprint_changes:
+            for sprint_id in from_sprint_ids - to_sprint_ids:
+                membership = SprintMembership(
+                    sprint_id=sprint_id,
+                    added=added_dates.pop(sprint_id, created),
+                    removed=changed,
+                )
+                memberships.append(membership)
+            for sprint_id in to_sprint_ids - from_sprint_ids:
+                added_dates.setdefault(sprint_id, changed)
+
+        for sprint_id in self._get_issue_sprint_ids(issue):
+            added_dates.setdefault(sprint_id, created)
+        memberships.extend(
+            SprintMembership(sprint_id=sprint_id, added=added, removed=None)
+            for sprint_id, added in added_dates.items()
+        )
+        return memberships
+
+    def _parse_changelog_sprint_ids(self, sprint_ids: Optional[str]) -> Set[int]:
+        if sprint_ids is None:
+            return set()
+        parsed_sprint_ids = {
+            int(sprint_id) for sprint_id in sprint_ids.split(",") if sprint_id.strip()
+        }
+        return parsed_sprint_ids
+
+    def _get_issue_created_date(self, issue: Dict) -> datetime:
+        created = issue["fields"].get("created")
+        if created is None:
+            histories = issue["changelog"]["histories"]
+            if len(histories) == 0:
+                return datetime.fromtimestamp(0, tz=pytz.UTC)
+            created = min(history["created"] for history in histories)
+        created_date = self._convert_created_history_timestamp(created)
+        return created_date
 
     def _convert_created_history_timestamp(self, dt: str) -> datetime:
-        date = datetime.strptime(dt, "%Y-%m-%dT%X.%f%z")
+        date = datetime.strptime(dt, ISSUE_DATE_FORMAT)
         utc_datetime = date.replace(tzinfo=pytz.UTC)
         return utc_datetime
 
     def _get_sprint_info(self, sprint_id: str) -> Dict:
-        sprint_info = self.jira.sprint_info(
-            board_id=self.config.board_id, sprint_id=sprint_id
-        )
+        with self.instrumentation.phase("sprint_info", sprint_id):
+            sprint_info = self.request_manager.call(
+                self.jira.sprint_info,
+                board_id=self.config.board_id,
+                sprint_id=sprint_id,
+            )
         return sprint_info
 
     def _get_sprint_start_date(self, sprint_info: Dict) -> datetime:
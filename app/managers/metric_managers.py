@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta
+from typing import List, NamedTuple
+
+import numpy as np
+import pytz
+
+from app.constants import IssueTypeEnum
+from app.models import (
+    ManagerConfig,
+    JiraTicket,
+    TicketMetrics,
+    UnpointedBreakdown,
+    PriorityPointsBreakdown,
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=pytz.UTC)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class TicketColumns(NamedTuple):
+    sprint_index: np.ndarray
+    story_points: np.ndarray
+    date_added: np.ndarray
+    is_complete: np.ndarray
+    is_priority: np.ndarray
+    is_story: np.ndarray
+    is_task: np.ndarray
+    is_bug: np.ndarray
+
+
+class MetricsManager:
+    def __init__(self, config: ManagerConfig):
+        self.config = config
+
+    def get_ticket_metrics(
+        self, sprints_tickets: List[List[JiraTicket]], start_dates: List[datetime]
+    ) -> List[TicketMetrics]:
+        columns = self._build_columns(sprints_tickets)
+        sprint_count = len(sprints_tickets)
+
+        start_timestamps = np.array(
+            [self._to_timestamp(start_date) for start_date in start_dates],
+            dtype=np.int64,
+        )
+        ticket_start_timestamps = start_timestamps[columns.sprint_index]
+        points = np.nan_to_num(columns.story_points)
+        unpointed = np.isnan(columns.story_points)
+
+        commitment = self._sum_by_sprint(
+            columns, points, columns.date_added < ticket_start_timestamps, sprint_count
+        )
+        completed = self._sum_by_sprint(
+            columns, points, columns.is_complete, sprint_count
+        )
+        scope_change = self._sum_by_sprint(
+            columns, points, columns.date_added > ticket_start_timestamps, sprint_count
+        )
+        priority_points = self._sum_by_sprint(
+            columns, points, columns.is_priority, sprint_count
+        )
+        non_priority_points = self._sum_by_sprint(
+            columns, points, ~columns.is_priority, sprint_count
+        )
+        completed_priority_points = self._sum_by_sprint(
+            columns, points, columns.is_complete & columns.is_priority, sprint_count
+        )
+        unpointed_stories = self._count_by_sprint(
+            columns, unpointed & columns.is_story, sprint_count
+        )
+        unpointed_tasks = self._count_by_sprint(
+            columns, unpointed & columns.is_task, sprint_count
+        )
+        unpointed_bugs = self._count_by_sprint(
+            columns, unpointed & columns.is_bug, sprint_count
+        )
+
+        ticket_metrics = [
+            TicketMetrics(
+                commitment=commitment[index],
+                completed=completed[index],
+                scope_change=scope_change[index],
+                unpointed_breakdown=UnpointedBreakdown(
+                    unpointed_stories=unpointed_stories[index],
+                    unpointed_tasks=unpointed_tasks[index],
+                    unpointed_bugs=unpointed_bugs[index],
+                ),
+                priority_breakdown=PriorityPointsBreakdown(
+                    priority_points=priority_points[index],
+                    non_priority_points=non_priority_points[index],
+                    completed_priority_points=completed_priority_points[index],
+                ),
+            )
+            for index in range(sprint_count)
+        ]
+        return ticket_metrics
+
+    def fold_ticket_metrics(
+        self,
+        ticket_metrics: List[TicketMetrics],
+        sprints_tickets: List[List[JiraTicket]],
+        start_dates: List[datetime],
+    ) -> List[TicketMetrics]:
+        folded_ticket_metrics = [
+            self._add_ticket_metrics(sprint_ticket_metrics, partial_ticket_metrics)
+            for sprint_ticket_metrics, partial_ticket_metrics in zip(
+                ticket_metrics, self.get_ticket_metrics(sprints_tickets, start_dates)
+            )
+        ]
+        return folded_ticket_metrics
+
+    def update_ticket_metrics(
+        self,
+        ticket_metrics: TicketMetrics,
+        removed_tickets: List[JiraTicket],
+        added_tickets: List[JiraTicket],
+        start_date: datetime,
+    ) -> TicketMetrics:
+        removed_ticket_metrics, added_ticket_metrics = self.get_ticket_metrics(
+            [removed_tickets, added_tickets], [start_date, start_date]
+        )
+        updated_ticket_metrics = self._add_ticket_metrics(
+            self._add_ticket_metrics(ticket_metrics, removed_ticket_metrics, sign=-1),
+            added_ticket_metrics,
+        )
+        return updated_ticket_metrics
+
+    def _add_ticket_metrics(
+        self, ticket_metrics: TicketMetrics, other: TicketMetrics, sign: int = 1
+    ) -> TicketMetrics:
+        added_ticket_metrics = TicketMetrics(
+            commitment=ticket_metrics.commitment + sign * other.commitment,
+            completed=ticket_metrics.completed + sign * other.completed,
+            scope_change=ticket_metrics.scope_change + sign * other.scope_change,
+            unpointed_breakdown=UnpointedBreakdown(
+                unpointed_stories=ticket_metrics.unpointed_breakdown.unpointed_stories
+                + sign * other.unpointed_breakdown.unpointed_stories,
+                unpointed_tasks=ticket_metrics.unpointed_breakdown.unpointed_tasks
+                + sign * other.unpointed_breakdown.unpointed_tasks,
+                unpointed_bugs=ticket_metrics.unpointed_breakdown.unpointed_bugs
+                + sign * other.unpointed_breakdown.unpointed_bugs,
+            ),
+            priority_breakdown=PriorityPointsBreakdown(
+                priority_points=ticket_metrics.priority_breakdown.priority_points
+                + sign * other.priority_breakdown.priority_points,
+                non_priority_points=ticket_metrics.priority_breakdown.non_priority_points
+                + sign * other.priority_breakdown.non_priority_points,
+                completed_priority_points=(
+                    ticket_metrics.priority_breakdown.completed_priority_points
+                    + sign * other.priority_breakdown.completed_priority_points
+                ),
+            ),
+        )
+        return added_ticket_metrics
+
+    def _build_columns(self, sprints_tickets: List[List[JiraTicket]]) -> TicketColumns:
+        ticket_count = sum(len(tickets) for tickets in sprints_tickets)
+        sprint_index = np.empty(ticket_count, dtype=np.int64)
+        story_points = np.empty(ticket_count, dtype=np.float64)
+        date_added = np.empty(ticket_count, dtype=np.int64)
+        issue_types = np.empty(ticket_count, dtype=object)
+        statuses = np.empty(ticket_count, dtype=object)
+        epic_keys = np.empty(ticket_count, dtype=object)
+
+        row = 0
+        for index, tickets in enumerate(sprints_tickets):
+            for ticket in tickets:
+                sprint_index[row] = index
+                story_points[row] = (
+                    ticket.story_points if ticket.story_points is not None else np.nan
+                )
+                date_added[row] = self._to_timestamp(ticket.date_added)
+                issue_types[row] = ticket.issue_type
+                statuses[row] = ticket.status
+                epic_keys[row] = ticket.epic_key if ticket.epic_key is not None else ""
+                row += 1
+
+        columns = TicketColumns(
+            sprint_index=sprint_index,
+            story_points=story_points,
+            date_added=date_added,
+            is_complete=statuses == self.config.complete_status,
+            is_priority=np.isin(epic_keys, self.config.priority_epics),
+            is_story=issue_types == IssueTypeEnum.STORY.value,
+            is_task=issue_types == IssueTypeEnum.TASK.value,
+            is_bug=issue_types == IssueTypeEnum.BUG.value,
+        )
+        return columns
+
+    def _sum_by_sprint(
+        self,
+        columns: TicketColumns,
+        values: np.ndarray,
+        mask: np.ndarray,
+        sprint_count: int,
+    ) -> List[int]:
+        sums = np.bincount(
+            columns.sprint_index[mask], weights=values[mask], minlength=sprint_count
+        )
+        return [int(value) for value in sums]
+
+    def _count_by_sprint(
+        self, columns: TicketColumns, mask: np.ndarray, sprint_count: int
+    ) -> List[int]:
+        counts = np.bincount(columns.sprint_index[mask], minlength=sprint_count)
+        return [int(value) for value in counts]
+
+    def _to_timestamp(self, date: datetime) -> int:
+        timestamp = (date - EPOCH) // MICROSECOND
+        return timestamp
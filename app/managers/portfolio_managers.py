@@ -0,0 +1,162 @@
+import hashlib
+import os
+from datetime import date
+from glob import glob
+from typing import List, Optional
+
+import pandas as pd
+
+from app.constants import (
+    PORTFOLIO_PERIOD_FREQUENCIES,
+    PORTFOLIO_TREND_SPRINTS,
+    PortfolioAggregations,
+    PortfolioGroups,
+    PortfolioPeriods,
+    ReportFormats,
+)
+from app.managers.report_managers import ReportManager
+from app.managers.report_store_managers import PortfolioStoreManager
+
+
+class PortfolioManager:
+    @classmethod
+    def build(cls, report_format: ReportFormats = ReportFormats.CSV):
+        store = PortfolioStoreManager.build()
+        return cls(store, report_format)
+
+    def __init__(self, store: PortfolioStoreManager, report_format: ReportFormats):
+        self.store = store
+        self.report_format = report_format
+
+    def get_project_names(self) -> List[str]:
+        if self.report_format == ReportFormats.PARQUET:
+            paths = glob("reports/*_sprint_metrics/")
+        else:
+            paths = glob("reports/*_sprint_metrics.csv")
+        project_names = sorted(
+            os.path.basename(os.path.normpath(path)).rsplit("_sprint_metrics", 1)[0]
+            for path in paths
+        )
+        return project_names
+
+    def sync(self, project_names: Optional[List[str]] = None) -> List[str]:
+        fingerprints = self.store.get_fingerprints(self.report_format)
+        if project_names is None:
+            project_names = self.get_project_names()
+            self.store.delete_boards(
+                [
+                    project_name
+                    for project_name in fingerprints
+                    if project_name not in project_names
+                ],
+                self.report_format,
+            )
+
+        synced_project_names = []
+        for project_name in project_names:
+            fingerprint = self._get_report_fingerprint(project_name)
+            if fingerprint is None:
+                self.store.delete_boards([project_name], self.report_format)
+            elif fingerprints.get(project_name) != fingerprint:
+                report_manager = ReportManager.build(project_name, self.report_format)
+                self.store.replace_board(
+                    project_name, self.report_format, fingerprint, report_manager.df
+                )
+                synced_project_names.append(project_name)
+        return synced_project_names
+
+    def query(
+        self,
+        metrics: List[str],
+        group_by: List[PortfolioGroups],
+        period: PortfolioPeriods = PortfolioPeriods.QUARTER,
+        aggregation: PortfolioAggregations = PortfolioAggregations.MEAN,
+        rolling: Optional[int] = None,
+        project_names: Optional[List[str]] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> pd.DataFrame:
+        df = self.store.read_sprints(metrics, project_names, since, until)
+        keys = []
+        if PortfolioGroups.PROJECT in group_by:
+            keys.append("Project")
+        if PortfolioGroups.PERIOD in group_by:
+            df["Period"] = (
+                df["Start Date"]
+                .dt.tz_convert(None)
+                .dt.to_period(PORTFOLIO_PERIOD_FREQUENCIES[period])
+            )
+            keys.append("Period")
+
+        if len(keys) == 0:
+            result_df = df[metrics].agg(aggregation.value).to_frame().T
+            return result_df
+
+        result_df = (
+            df.groupby(keys, sort=True)[metrics].agg(aggregation.value).reset_index()
+        )
+        if rolling is not None:
+            if "Period" not in keys:
+                raise ValueError("rolling requires grouping by period")
+            if "Project" in keys:
+                result_df[metrics] = (
+                    result_df.groupby("Project")[metrics]
+                    .rolling(rolling)
+                    .mean()
+                    .reset_index(level=0, drop=True)
+                )
+            else:
+                result_df[metrics] = result_df[metrics].rolling(rolling).mean()
+        if "Period" in keys:
+            result_df["Period"] = result_df["Period"].astype(str)
+        return result_df
+
+    def trends(
+        self,
+        metrics: List[str],
+        sprints: int = PORTFOLIO_TREND_SPRINTS,
+        project_names: Optional[List[str]] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> pd.DataFrame:
+        df = self.store.read_sprints(metrics, project_names, since, until)
+        df = df.groupby("Project", sort=False).tail(sprints)
+        positions = df.groupby("Project", sort=False).cumcount().astype(float)
+
+        result_df = pd.DataFrame({"Sprints": df.groupby("Project").size()})
+        for metric in metrics:
+            values = df[metric].astype(float)
+            valid = values.notna()
+            metric_df = pd.DataFrame(
+                {
+                    "Project": df["Project"][valid],
+                    "x": positions[valid],
+                    "y": values[valid],
+                }
+            )
+            grouped = metric_df.groupby("Project")
+            metric_df["x"] -= grouped["x"].transform("mean")
+            metric_df["y"] -= grouped["y"].transform("mean")
+            metric_df["xy"] = metric_df["x"] * metric_df["y"]
+            metric_df["xx"] = metric_df["x"] * metric_df["x"]
+            sums = metric_df.groupby("Project")[["xy", "xx"]].sum()
+            result_df[metric] = (sums["xy"] / sums["xx"]).where(sums["xx"] > 0)
+
+        result_df = result_df.sort_values(
+            metrics[0], ascending=False, na_position="last"
+        ).reset_index()
+        return result_df
+
+    def _get_report_fingerprint(self, project_name: str) -> Optional[str]:
+        if self.report_format == ReportFormats.PARQUET:
+            paths = sorted(glob(f"reports/{project_name}_sprint_metrics/*.parquet"))
+        else:
+            paths = glob(f"reports/{project_name}_sprint_metrics.csv")
+        if len(paths) == 0:
+            return None
+
+        digest = hashlib.sha256()
+        for path in paths:
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
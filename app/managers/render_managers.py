@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import pandas as pd
+
+from app.constants import RENDER_INDEX_FILENAME, RenderFormats, ReportFormats
+from app.managers.report_managers import ReportManager
+from app.models import RenderCommandLineArgs, RenderedBoard, RenderResult
+from app.utils import get_render_command_line_args
+
+if TYPE_CHECKING:
+    from plotly.graph_objects import Figure
+
+
+class RenderManager:
+    @classmethod
+    def build(cls, args: Optional[RenderCommandLineArgs] = None):
+        if args is None:
+            args = get_render_command_line_args()
+        return cls(
+            args.project_names,
+            args.report_format,
+            args.output_dir,
+            args.output_format,
+            args.max_points,
+            args.force,
+        )
+
+    def __init__(
+        self,
+        project_names: List[str],
+        report_format: ReportFormats,
+        output_dir: str,
+        output_format: RenderFormats,
+        max_points: int,
+        force: bool = False,
+    ):
+        self.project_names = project_names
+        self.report_format = report_format
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.max_points = max_points
+        self.force = force
+        self.index_filename = os.path.join(output_dir, RENDER_INDEX_FILENAME)
+
+    def run(self) -> List[RenderResult]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        index = self._read_index()
+        results = []
+        for project_name in self.project_names:
+            try:
+                result = self._render_board(project_name, index)
+            except Exception as e:
+                result = RenderResult(
+                    project_name=project_name, succeeded=False, error=repr(e)
+                )
+            results.append(result)
+        return results
+
+    def _render_board(
+        self, project_name: str, index: Dict[str, RenderedBoard]
+    ) -> RenderResult:
+        report_manager = ReportManager.build(project_name, self.report_format)
+        report_df, burndown_df = report_manager.get_visualization_frames(
+            self.max_points
+        )
+        if len(report_df) == 0:
+            raise ValueError(f"No sprints in the report of {project_name}")
+
+        fingerprint = self._get_fingerprint(report_df, burndown_df)
+        rendered_board = index.get(project_name)
+        if (
+            not self.force
+            and rendered_board is not None
+            and rendered_board.fingerprint == fingerprint
+            and all(os.path.exists(filename) for filename in rendered_board.filenames)
+        ):
+            result = RenderResult(
+                project_name=project_name,
+                succeeded=True,
+                filenames=rendered_board.filenames,
+            )
+            return result
+
+        filenames = [
+            self._write_figure(project_name, name, figure)
+            for name, figure in report_manager.get_figures(
+                report_df, burndown_df
+            ).items()
+        ]
+        index[project_name] = RenderedBoard(
+            fingerprint=fingerprint, filenames=filenames
+        )
+        self._write_index(index)
+        result = RenderResult(
+            project_name=project_name,
+            succeeded=True,
+            rendered=True,
+            filenames=filenames,
+        )
+        return result
+
+    def _write_figure(self, project_name: str, name: str, figure: "Figure") -> str:
+        filename = os.path.join(
+            self.output_dir, f"{project_name}_{name}.{self.output_format.value}"
+        )
+        if self.output_format == RenderFormats.JSON:
+            figure.write_json(filename)
+        else:
+            figure.write_html(filename, include_plotlyjs="directory")
+        return filename
+
+    def _get_fingerprint(
+        self, report_df: pd.DataFrame, burndown_df: pd.DataFrame
+    ) -> str:
+        digest = hashlib.sha256(
+            f"{self.output_format.value}:{self.max_points}".encode()
+        )
+        for df in (report_df, burndown_df):
+            digest.update(",".join(df.columns).encode())
+            digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        return digest.hexdigest()
+
+    def _read_index(self) -> Dict[str, RenderedBoard]:
+        if not os.path.exists(self.index_filename):
+            return {}
+        with open(self.index_filename) as f:
+            index = {
+                project_name: RenderedBoard(**rendered_board)
+                for project_name, rendered_board in json.load(f).items()
+            }
+        return index
+
+    def _write_index(self, index: Dict[str, RenderedBoard]) -> None:
+        temporary_filename = f"{self.index_filename}.tmp"
+        with open(temporary_filename, "w") as f:
+            json.dump(
+                {
+                    project_name: rendered_board.dict()
+                    for project_name, rendered_board in index.items()
+                },
+                f,
+                indent=2,
+            )
+        os.replace(temporary_filename, self.index_filename)
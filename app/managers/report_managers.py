@@ -1,97 +1,454 @@
-from typing import Optional, List
+import math
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from app.constants import REPORT_COLUMNS
-from app.models import SprintMetrics
+from app.constants import (
+    BURNDOWN_COLUMNS,
+    BURNDOWN_SERIES_COLUMNS,
+    FORECAST_ALL_TARGET,
+    FORECAST_COLUMNS,
+    FORECAST_CONFIDENCES,
+    FORECAST_MAX_SPRINTS,
+    FORECAST_PRIORITY_TARGET,
+    FORECAST_SIMULATIONS,
+    PARQUET_ENGINES,
+    REPORT_COLUMNS,
+    REPORT_INDEX_COLUMNS,
+    PERCENTAGE_REPORT_COLUMNS,
+    ROLLING_WINDOW,
+    ForecastVelocities,
+    ReportFormats,
+)
+from app.managers.report_store_managers import ParquetReportStoreManager
+from app.models import SprintBurndown, SprintMetrics
+import numpy as np
 import pandas as pd
-import plotly.express as ex
+
+if TYPE_CHECKING:
+    from plotly.graph_objects import Figure
 
 
 class ReportManager:
     @classmethod
-    def build(cls, project_name: str):
+    def build(
+        cls,
+        project_name: str,
+        report_format: ReportFormats = ReportFormats.CSV,
+        tail: Optional[int] = None,
+    ):
+        if report_format == ReportFormats.PARQUET:
+            cls._check_parquet_engine()
+            store = ParquetReportStoreManager.build(project_name)
+            history = tail + ROLLING_WINDOW - 1 if tail is not None else None
+            df = store.read_sprints(tail=history)
+            return cls(df, project_name, store)
+
         try:
             df = pd.read_csv(f"reports/{project_name}_sprint_metrics.csv")
         except FileNotFoundError:
-            df = pd.DataFrame(columns=REPORT_COLUMNS)
+            df = cls.get_empty_report()
         return cls(df, project_name)
 
-    def __init__(self, df: pd.DataFrame, project_name: str):
-        self.df = df
+    @classmethod
+    def get_empty_report(cls) -> pd.DataFrame:
+        df = pd.DataFrame(columns=REPORT_COLUMNS)
+        return df
+
+    @classmethod
+    def _check_parquet_engine(cls) -> None:
+        if not any(find_spec(engine) is not None for engine in PARQUET_ENGINES):
+            raise ImportError(
+                "The parquet report format requires pyarrow or fastparquet, "
+                "install them with `poetry install -E parquet`"
+            )
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        project_name: str,
+        store: Optional[ParquetReportStoreManager] = None,
+    ):
+        self.df = self._compute_derived_columns(self._parse_report(df))
         self.project_name = project_name
+        self.store = store
 
     def visualize_report(self) -> None:
+        report_df, burndown_df = self.get_visualization_frames()
+        for figure in self.get_figures(report_df, burndown_df).values():
+            figure.show()
+
+    def get_visualization_frames(
+        self, max_points: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        report_df = self.df
+        burndown_df = self._read_burndown()
+        if max_points is not None:
+            report_df = self._downsample_report(report_df, max_points)
+            burndown_df = self._downsample_burndown(burndown_df, max_points)
+        return report_df, burndown_df
+
+    def get_figures(
+        self, report_df: pd.DataFrame, burndown_df: pd.DataFrame
+    ) -> Dict[str, "Figure"]:
+        import plotly.express as ex
+
         df = pd.melt(
-            self.df,
-            id_vars=self.df.columns[0],
-            value_vars=self.df.columns[1:],
-        )
-        figure = ex.line(
-            df, x="Sprint", y="value", color="variable", template="plotly_dark"
+            report_df,
+            id_vars="Sprint",
+            value_vars=[
+                column
+                for column in report_df.columns
+                if column not in REPORT_INDEX_COLUMNS
+            ],
         )
-        figure.show()
+        figures = {
+            "sprint_metrics": ex.line(
+                df, x="Sprint", y="value", color="variable", template="plotly_dark"
+            )
+        }
+
+        if len(burndown_df) > 0:
+            burndown_df = pd.melt(
+                burndown_df,
+                id_vars=["Sprint", "Elapsed Days"],
+                value_vars=BURNDOWN_SERIES_COLUMNS,
+            )
+            burndown_figure = ex.line(
+                burndown_df,
+                x="Elapsed Days",
+                y="value",
+                color="Sprint",
+                facet_row="variable",
+                template="plotly_dark",
+            )
+            figures["sprint_burndown"] = burndown_figure
+        return figures
 
     def create_or_update_report(self, sprint_metrics: List[SprintMetrics]) -> None:
+        sprint_ids = [metrics.sprint_id for metrics in sprint_metrics]
         sprint_names = [metrics.sprint_name for metrics in sprint_metrics]
-        for sprint_name in sprint_names:
-            self._remove_existing_current_sprint_entry(sprint_name)
+        stale_rows = self.df["Sprint ID"].isin(sprint_ids) | (
+            self.df["Sprint ID"].isna() & self.df.Sprint.isin(sprint_names)
+        )
+        existing_df = self.df[~stale_rows]
 
         ordered_sprint_metrics = self._chronologically_order_metrics(sprint_metrics)
-        for sprint_metric in ordered_sprint_metrics:
-            if len(self.df) < 3:
-                four_sprint_average = None
-                four_sprint_capacity_achieved_avg = None
-                four_sprint_smoothed_capacity_avg = None
-            else:
-                four_sprint_average = self._get_four_sprint_completed_average(
-                    sprint_metric.completed
-                )
-                four_sprint_capacity_achieved_avg = (
-                    self._get_four_sprint_capacity_achieved_average(
-                        sprint_metric.capacity_achieved
-                    )
-                )
-                four_sprint_smoothed_capacity_avg = (
-                    self._get_four_sprint_smoothed_capacity_achieved_average(
-                        sprint_metric.completed, sprint_metric.planned_capacity
-                    )
+        metrics_df = self._build_metrics_frame(ordered_sprint_metrics)
+
+        df = pd.concat([existing_df, metrics_df], ignore_index=True)
+        df = df.sort_values(
+            "Start Date", kind="mergesort", na_position="first", ignore_index=True
+        )
+        self.df = self._compute_derived_columns(df)
+
+        if self.store is not None:
+            self.store.upsert_sprints(metrics_df)
+        else:
+            self._write_csv(self.df)
+
+    def create_or_update_burndown(self, burndowns: List[SprintBurndown]) -> None:
+        df = self._read_burndown()
+        sprint_ids = [burndown.sprint_id for burndown in burndowns]
+        existing_df = df[~df["Sprint ID"].isin(sprint_ids)]
+        df = pd.concat(
+            [existing_df, self._build_burndown_frame(burndowns)], ignore_index=True
+        )
+        df = df.sort_values(["Timestamp", "Sprint ID"], kind="mergesort")
+
+        if self.store is not None:
+            df.to_parquet(self._get_burndown_filename(), index=False)
+        else:
+            df.to_csv(self._get_burndown_filename(), index=False, mode="w+")
+
+    def create_what_if_report(
+        self, variations_metrics: Dict[str, List[SprintMetrics]]
+    ) -> str:
+        frames = []
+        for name, sprint_metrics in variations_metrics.items():
+            ordered_sprint_metrics = self._chronologically_order_metrics(sprint_metrics)
+            df = self._compute_derived_columns(
+                self._parse_report(self._build_metrics_frame(ordered_sprint_metrics))
+            )
+            df.insert(0, "Variation", name)
+            frames.append(df)
+        df = pd.concat(frames, ignore_index=True)
+
+        filename = f"reports/{self.project_name}_what_if.csv"
+        self._format_percentages(df).to_csv(filename, index=False, mode="w+")
+        return filename
+
+    def forecast(
+        self,
+        remaining_points: Optional[float] = None,
+        priority_remaining_points: Optional[float] = None,
+        simulations: int = FORECAST_SIMULATIONS,
+        confidences: List[float] = FORECAST_CONFIDENCES,
+        history: Optional[int] = None,
+        exclude_latest_sprints: int = 1,
+        seed: Optional[int] = None,
+    ) -> pd.DataFrame:
+        df = self.df.iloc[: max(0, len(self.df) - exclude_latest_sprints)]
+        if history is not None:
+            df = df.tail(history)
+        if len(df) == 0:
+            raise ValueError(
+                f"The report of {self.project_name} has no historical sprints to "
+                "forecast with"
+            )
+        completed = df["Completed"].astype(float)
+        completed_priority = df["Completed Priority Points"].dropna().astype(float)
+        velocities = {
+            ForecastVelocities.COMPLETED: completed.to_numpy(),
+            ForecastVelocities.PRIORITY: completed_priority.to_numpy(),
+        }
+
+        targets = []
+        if remaining_points is not None:
+            targets.append(
+                (FORECAST_ALL_TARGET, ForecastVelocities.COMPLETED, remaining_points)
+            )
+        if priority_remaining_points is not None:
+            targets.append(
+                (
+                    FORECAST_PRIORITY_TARGET,
+                    ForecastVelocities.PRIORITY,
+                    priority_remaining_points,
                 )
+            )
+
+        rng = np.random.default_rng(seed)
+        confidence_columns = [
+            self._format_float_as_percent(confidence) for confidence in confidences
+        ]
+        rows = []
+        for target, velocity, points in targets:
+            sprints = self._simulate_sprints_to_finish(
+                rng, velocities[velocity], points, simulations, confidences
+            )
             row = {
+                "Project": self.project_name,
+                "Target": target,
+                "Velocity": velocity.value,
+                "Remaining Points": points,
+                **dict(zip(confidence_columns, sprints)),
+            }
+            rows.append(row)
+        forecast_df = pd.DataFrame(rows, columns=FORECAST_COLUMNS + confidence_columns)
+        return forecast_df
+
+    def write_forecast(self, forecast_df: pd.DataFrame) -> str:
+        filename = f"reports/{self.project_name}_forecast.csv"
+        forecast_df.to_csv(filename, index=False, mode="w+")
+        return filename
+
+    def export_csv(self) -> None:
+        if self.store is None:
+            self._write_csv(self.df)
+            return None
+
+        df = self._parse_report(self.store.read_sprints())
+        self._write_csv(self._compute_derived_columns(df))
+
+    def _write_csv(self, df: pd.DataFrame) -> None:
+        self._format_percentages(df).to_csv(
+            f"reports/{self.project_name}_sprint_metrics.csv",
+            index=False,
+            mode="w+",
+        )
+
+    def _build_metrics_frame(self, metrics: List[SprintMetrics]) -> pd.DataFrame:
+        rows = [
+            {
                 "Sprint": sprint_metric.sprint_name,
+                "Sprint ID": sprint_metric.sprint_id,
+                "Start Date": sprint_metric.start_date,
                 "Commitment": sprint_metric.commitment,
                 "Completed": sprint_metric.completed,
-                "4-Sprint Average": four_sprint_average,
                 "Scope Change": sprint_metric.scope_change,
                 "Planned Capacity": sprint_metric.planned_capacity,
-                "Capacity Achieved": self._format_float_as_percent(
-                    sprint_metric.capacity_achieved
-                ),
-                "4-Sprint Capacity Achieved": four_sprint_capacity_achieved_avg,
-                "4-Sprint Smoothed Average": four_sprint_smoothed_capacity_avg,
                 "Unpointed Issues": sprint_metric.unpointed_breakdown.unpointed_sum,
                 "Unpointed Stories": sprint_metric.unpointed_breakdown.unpointed_stories,
                 "Unpointed Tasks": sprint_metric.unpointed_breakdown.unpointed_tasks,
                 "Bug Tickets": sprint_metric.unpointed_breakdown.unpointed_bugs,
                 "Priority Points": sprint_metric.priority_breakdown.priority_points,
                 "Non-Priority Points": sprint_metric.priority_breakdown.non_priority_points,
-                "Priority Percentage": self._get_priority_point_percentage(
-                    sprint_metric
-                ),
-                "Non Priority Percentage": self._get_non_priority_point_percentage(
-                    sprint_metric
+                "Completed Priority Points": (
+                    sprint_metric.priority_breakdown.completed_priority_points
                 ),
             }
+            for sprint_metric in metrics
+        ]
+        df = pd.DataFrame(rows, columns=REPORT_COLUMNS)
+        return df
 
-            self.df = self.df.append(row, ignore_index=True)
-        self.df.to_csv(
-            f"reports/{self.project_name}_sprint_metrics.csv",
-            index=False,
-            mode="w+",
+    def _build_burndown_frame(self, burndowns: List[SprintBurndown]) -> pd.DataFrame:
+        frames = [
+            pd.DataFrame(
+                {
+                    "Sprint": burndown.sprint_name,
+                    "Sprint ID": burndown.sprint_id,
+                    "Timestamp": pd.to_datetime(burndown.timestamps, utc=True),
+                    "Elapsed Days": [
+                        (timestamp - burndown.start_date).total_seconds() / 86400
+                        for timestamp in burndown.timestamps
+                    ],
+                    "Remaining": burndown.remaining,
+                    "Completed": burndown.completed,
+                    "Added Scope": burndown.added_scope,
+                },
+                columns=BURNDOWN_COLUMNS,
+            )
+            for burndown in burndowns
+        ]
+        if len(frames) == 0:
+            return pd.DataFrame(columns=BURNDOWN_COLUMNS)
+        df = pd.concat(frames, ignore_index=True)
+        return df
+
+    def _read_burndown(self) -> pd.DataFrame:
+        try:
+            if self.store is not None:
+                df = pd.read_parquet(self._get_burndown_filename())
+            else:
+                df = pd.read_csv(self._get_burndown_filename())
+        except FileNotFoundError:
+            df = pd.DataFrame(columns=BURNDOWN_COLUMNS)
+        df["Timestamp"] = pd.to_datetime(df["Timestamp"], utc=True)
+        return df
+
+    def _downsample_report(self, df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+        if len(df) <= max_points:
+            return df
+
+        bucket_size = math.ceil(len(df) / max_points)
+        buckets = (len(df) - 1 - np.arange(len(df))) // bucket_size
+        metric_columns = [
+            column for column in df.columns if column not in REPORT_INDEX_COLUMNS
+        ]
+        downsampled_df = (
+            df[metric_columns].astype(float).groupby(buckets, sort=False).mean()
         )
+        grouped_df = df.groupby(buckets, sort=False)
+        downsampled_df["Sprint"] = grouped_df["Sprint"].agg(self._get_bucket_name)
+        downsampled_df["Start Date"] = grouped_df["Start Date"].first()
+        downsampled_df = downsampled_df.reindex(columns=df.columns).reset_index(
+            drop=True
+        )
+        return downsampled_df
 
-    def _remove_existing_current_sprint_entry(self, sprint_name: str) -> None:
-        if len(self.df) == 0:
-            return None
-        self.df = self.df[self.df.Sprint != sprint_name]
+    def _downsample_burndown(self, df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+        grouped_df = df.groupby("Sprint ID", sort=False)
+        positions = grouped_df.cumcount()
+        sizes = grouped_df["Sprint ID"].transform("size")
+        intervals = (sizes - 1).clip(lower=1)
+        buckets = positions * (max_points - 1) // intervals
+        previous_buckets = (positions - 1) * (max_points - 1) // intervals
+        downsampled_df = df[
+            (sizes <= max_points) | (positions == 0) | (buckets != previous_buckets)
+        ].reset_index(drop=True)
+        return downsampled_df
+
+    def _get_bucket_name(self, sprints: pd.Series) -> str:
+        if len(sprints) == 1:
+            return sprints.iloc[0]
+        return f"{sprints.iloc[0]} to {sprints.iloc[-1]}"
+
+    def _get_burndown_filename(self) -> str:
+        extension = "parquet" if self.store is not None else "csv"
+        filename = f"reports/{self.project_name}_sprint_burndown.{extension}"
+        return filename
+
+    def _simulate_sprints_to_finish(
+        self,
+        rng: np.random.Generator,
+        velocities: np.ndarray,
+        points: float,
+        simulations: int,
+        confidences: List[float],
+    ) -> np.ndarray:
+        sprints = np.full(simulations, np.inf)
+        mean_velocity = velocities.mean() if len(velocities) > 0 else 0.0
+        if mean_velocity <= 0:
+            return np.full(len(confidences), np.nan)
+
+        block_size = int(
+            min(FORECAST_MAX_SPRINTS, max(1, math.ceil(points / mean_velocity)))
+        )
+        indexes = np.ceil(np.array(confidences) * simulations).astype(int) - 1
+        required_finished = int(indexes.max()) + 1
+        cumulative_velocities = np.zeros(simulations)
+        unfinished = np.arange(simulations)
+        for first_sprint in range(0, FORECAST_MAX_SPRINTS, block_size):
+            block_size = min(block_size, FORECAST_MAX_SPRINTS - first_sprint)
+            sampled_velocities = velocities[
+                rng.integers(
+                    0,
+                    len(velocities),
+                    size=(len(unfinished), block_size),
+                    dtype=np.int32,
+                )
+            ]
+            block_cumulative_velocities = cumulative_velocities[
+                unfinished, np.newaxis
+            ] + np.cumsum(sampled_velocities, axis=1)
+
+            finished = block_cumulative_velocities[:, -1] >= points
+            sprints[unfinished[finished]] = (
+                first_sprint
+                + (block_cumulative_velocities[finished] < points).sum(axis=1)
+                + 1
+            )
+            cumulative_velocities[unfinished] = block_cumulative_velocities[:, -1]
+            unfinished = unfinished[~finished]
+            if simulations - len(unfinished) >= required_finished:
+                break
+
+        sprints.sort()
+        confidence_sprints = sprints[indexes]
+        confidence_sprints[np.isinf(confidence_sprints)] = np.nan
+        return confidence_sprints
+
+    def _compute_derived_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        completed = df["Completed"].astype(float)
+        planned_capacity = df["Planned Capacity"].astype(float)
+        capacity_achieved = (completed / planned_capacity).where(
+            planned_capacity != 0, 0.0
+        )
+        completed_rolling_sum = completed.rolling(ROLLING_WINDOW).sum()
+        planned_capacity_rolling_sum = planned_capacity.rolling(ROLLING_WINDOW).sum()
+        planned_points = df["Commitment"].astype(float) + df["Scope Change"].astype(
+            float
+        )
+
+        df["4-Sprint Average"] = completed_rolling_sum / ROLLING_WINDOW
+        df["Capacity Achieved"] = capacity_achieved
+        df["4-Sprint Capacity Achieved"] = capacity_achieved.rolling(
+            ROLLING_WINDOW
+        ).mean()
+        df["4-Sprint Smoothed Average"] = (
+            completed_rolling_sum / planned_capacity_rolling_sum
+        ).where(planned_capacity_rolling_sum != 0)
+        df["Priority Percentage"] = (
+            df["Priority Points"].astype(float) / planned_points
+        ).where(planned_points != 0)
+        df["Non Priority Percentage"] = (
+            df["Non-Priority Points"].astype(float) / planned_points
+        ).where(planned_points != 0)
+        df = df.reindex(columns=REPORT_COLUMNS)
+        return df
+
+    def _parse_report(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.reindex(columns=REPORT_COLUMNS)
+        df["Sprint ID"] = pd.to_numeric(df["Sprint ID"]).astype("Int64")
+        df["Start Date"] = pd.to_datetime(df["Start Date"], utc=True)
+        return df
+
+    def _format_percentages(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        for column in PERCENTAGE_REPORT_COLUMNS:
+            df[column] = df[column].map(self._format_float_as_percent)
+        return df
 
     def _chronologically_order_metrics(
         self, metrics: List[SprintMetrics]
@@ -102,42 +459,7 @@ class ReportManager:
         return ordered_metrics
 
     def _format_float_as_percent(self, value: float) -> str:
+        if pd.isna(value):
+            return ""
         formatted_float = "{0:.2%}".format(value)
         return formatted_float
-
-    def _get_four_sprint_smoothed_capacity_achieved_average(
-        self, completed: int, planned_capacity: float
-    ) -> str:
-        completed_sum = self.df.Completed.iloc[-3:].sum() + completed
-        planned_capacity_sum = (
-            self.df["Planned Capacity"].iloc[-3:].sum() + planned_capacity
-        )
-        average = completed_sum / planned_capacity_sum
-        formatted_average = self._format_float_as_percent(average)
-        return formatted_average
-
-    def _get_four_sprint_capacity_achieved_average(
-        self, capacity_achieved: float
-    ) -> str:
-        values = [float(ca[:-1]) for ca in self.df["Capacity Achieved"].iloc[-3:]]
-        average = (sum(values) + capacity_achieved * 100) / 4 / 100
-        formatted_average = self._format_float_as_percent(average)
-        return formatted_average
-
-    def _get_four_sprint_completed_average(self, completed: int) -> str:
-        average = (self.df.Completed.iloc[-3:].sum() + completed) / 4
-        return average
-
-    def _get_priority_point_percentage(self, sprint_metric: SprintMetrics) -> str:
-        fraction = sprint_metric.priority_breakdown.priority_points / (
-            sprint_metric.commitment + sprint_metric.scope_change
-        )
-        percentage = self._format_float_as_percent(fraction)
-        return percentage
-
-    def _get_non_priority_point_percentage(self, sprint_metric: SprintMetrics) -> str:
-        fraction = sprint_metric.priority_breakdown.non_priority_points / (
-            sprint_metric.commitment + sprint_metric.scope_change
-        )
-        percentage = self._format_float_as_percent(fraction)
-        return percentage
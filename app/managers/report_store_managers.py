@@ -0,0 +1,196 @@
+import os
+import sqlite3
+from datetime import date, timedelta
+from glob import glob
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from app.constants import (
+    PORTFOLIO_FILENAME,
+    PORTFOLIO_METRIC_COLUMNS,
+    REPORT_COLUMNS,
+    REPORT_INDEX_COLUMNS,
+    REPORT_METRIC_COLUMNS,
+    ReportFormats,
+)
+
+
+class ParquetReportStoreManager:
+    @classmethod
+    def build(cls, project_name: str):
+        directory = f"reports/{project_name}_sprint_metrics"
+        os.makedirs(directory, exist_ok=True)
+        return cls(directory)
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def read_sprints(self, tail: Optional[int] = None) -> pd.DataFrame:
+        paths = self._get_partition_paths()
+        if tail is not None:
+            paths = paths[len(paths) - tail :] if tail > 0 else []
+
+        if len(paths) == 0:
+            return pd.DataFrame(columns=REPORT_METRIC_COLUMNS)
+
+        df = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+        return df
+
+    def upsert_sprints(self, df: pd.DataFrame) -> None:
+        for sprint_id, sprint_df in df.groupby("Sprint ID"):
+            for path in glob(os.path.join(self.directory, f"*_{sprint_id}.parquet")):
+                os.remove(path)
+
+            start_date = sprint_df["Start Date"].iloc[0]
+            path = os.path.join(
+                self.directory, f"{start_date:%Y%m%d%H%M%S}_{sprint_id}.parquet"
+            )
+            sprint_df[REPORT_METRIC_COLUMNS].to_parquet(path, index=False)
+
+    def _get_partition_paths(self) -> List[str]:
+        paths = sorted(glob(os.path.join(self.directory, "*.parquet")))
+        return paths
+
+
+class PortfolioStoreManager:
+    @classmethod
+    def build(cls, filename: str = PORTFOLIO_FILENAME):
+        connection = sqlite3.connect(filename)
+        return cls(connection)
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self._create_tables()
+
+    def get_fingerprints(self, report_format: ReportFormats) -> Dict[str, str]:
+        rows = self.connection.execute(
+            "SELECT project_name, fingerprint FROM boards WHERE report_format = ?",
+            (report_format.value,),
+        ).fetchall()
+        fingerprints = {project_name: fingerprint for project_name, fingerprint in rows}
+        return fingerprints
+
+    def replace_board(
+        self,
+        project_name: str,
+        report_format: ReportFormats,
+        fingerprint: str,
+        df: pd.DataFrame,
+    ) -> None:
+        df = df.reindex(columns=REPORT_COLUMNS)
+        df["Start Date"] = (
+            df["Start Date"] - pd.Timestamp(0, tz="UTC")
+        ).dt.total_seconds()
+        df = df.astype(object).where(df.notna(), None)
+        columns = ", ".join(
+            self._quote(column)
+            for column in ["Project", "Report Format", *REPORT_COLUMNS]
+        )
+        placeholders = ", ".join("?" for _ in range(len(REPORT_COLUMNS) + 2))
+        with self.connection:
+            self._delete_board(project_name, report_format)
+            self.connection.executemany(
+                f"INSERT INTO sprints ({columns}) VALUES ({placeholders})",
+                [
+                    (project_name, report_format.value, *row)
+                    for row in df.itertuples(index=False)
+                ],
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO boards "
+                "(project_name, report_format, fingerprint) VALUES (?, ?, ?)",
+                (project_name, report_format.value, fingerprint),
+            )
+
+    def delete_boards(
+        self, project_names: List[str], report_format: ReportFormats
+    ) -> None:
+        with self.connection:
+            for project_name in project_names:
+                self._delete_board(project_name, report_format)
+
+    def read_sprints(
+        self,
+        metrics: List[str],
+        project_names: Optional[List[str]] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> pd.DataFrame:
+        for metric in metrics:
+            if metric not in PORTFOLIO_METRIC_COLUMNS:
+                raise ValueError(f"Unknown metric {metric}")
+
+        conditions = []
+        parameters: List = []
+        if project_names:
+            placeholders = ", ".join("?" for _ in project_names)
+            conditions.append(f'"Project" IN ({placeholders})')
+            parameters.extend(project_names)
+        if since is not None:
+            conditions.append('"Start Date" >= ?')
+            parameters.append(self._get_timestamp(since))
+        if until is not None:
+            conditions.append('"Start Date" < ?')
+            parameters.append(self._get_timestamp(until + timedelta(days=1)))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        columns = ", ".join(
+            self._quote(column)
+            for column in ["Project", *REPORT_INDEX_COLUMNS, *dict.fromkeys(metrics)]
+        )
+        df = pd.read_sql_query(
+            f'SELECT {columns} FROM sprints {where} ORDER BY "Project", "Start Date"',
+            self.connection,
+            params=parameters,
+        )
+        df["Sprint ID"] = df["Sprint ID"].astype("Int64")
+        df["Start Date"] = pd.to_datetime(df["Start Date"], unit="s", utc=True)
+        return df
+
+    def _delete_board(self, project_name: str, report_format: ReportFormats) -> None:
+        self.connection.execute(
+            'DELETE FROM sprints WHERE "Project" = ? AND "Report Format" = ?',
+            (project_name, report_format.value),
+        )
+        self.connection.execute(
+            "DELETE FROM boards WHERE project_name = ? AND report_format = ?",
+            (project_name, report_format.value),
+        )
+
+    def _get_timestamp(self, day: date) -> float:
+        timestamp = pd.Timestamp(day, tz="UTC").timestamp()
+        return timestamp
+
+    def _quote(self, column: str) -> str:
+        return f'"{column}"'
+
+    def _create_tables(self) -> None:
+        metric_columns = ", ".join(
+            f"{self._quote(column)} REAL" for column in PORTFOLIO_METRIC_COLUMNS
+        )
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS boards ("
+                "project_name TEXT NOT NULL, report_format TEXT NOT NULL, "
+                "fingerprint TEXT NOT NULL, "
+                "PRIMARY KEY (project_name, report_format))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sprints ("
+                '"Project" TEXT NOT NULL, "Report Format" TEXT NOT NULL, '
+                '"Sprint" TEXT, "Sprint ID" INTEGER, '
+                f'"Start Date" REAL, {metric_columns})'
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS sprints_project_start_date "
+                'ON sprints ("Project", "Start Date")'
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS sprints_project_sprint_id "
+                'ON sprints ("Project", "Sprint ID")'
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS sprints_start_date "
+                'ON sprints ("Start Date")'
+            )
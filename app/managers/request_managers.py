@@ -0,0 +1,155 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from app.constants import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    LATENCY_TOLERANCE,
+    LATENCY_SMOOTHING,
+    LATENCY_BACKOFF_FACTOR,
+    THROTTLED_STATUS_CODES,
+)
+from app.models import ManagerConfig
+
+
+class RequestManager:
+    @classmethod
+    def build(cls, config: ManagerConfig):
+        return cls(config.max_workers, config.requests_per_second, config.max_retries)
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_second: Optional[float],
+        max_retries: int,
+    ):
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+
+        self._condition = threading.Condition()
+        self._concurrency_limit = float(max_concurrency)
+        self._in_flight = 0
+        self._bucket_size = max(1.0, requests_per_second or 0.0)
+        self._tokens = self._bucket_size
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._latency: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self._concurrency_limit)
+
+    def call(self, function: Callable, *args, **kwargs) -> Any:
+        attempt = 0
+        while True:
+            self._acquire()
+            started = time.monotonic()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                self._release()
+                retry_delay = self._get_retry_delay(e, attempt)
+                if retry_delay is None or attempt >= self.max_retries:
+                    raise
+                self._on_failure(e, retry_delay)
+                time.sleep(retry_delay)
+                attempt += 1
+                continue
+
+            self._release()
+            self._on_success(time.monotonic() - started)
+            return result
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill_tokens(now)
+                wait = max(self._paused_until - now, self._get_token_wait())
+                if wait <= 0 and self._in_flight < self.concurrency_limit:
+                    break
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+            self._in_flight += 1
+            if self.requests_per_second is not None:
+                self._tokens -= 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _refill_tokens(self, now: float) -> None:
+        if self.requests_per_second is not None:
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self._bucket_size, self._tokens + elapsed * self.requests_per_second
+            )
+        self._last_refill = now
+
+    def _get_token_wait(self) -> float:
+        if self.requests_per_second is None or self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.requests_per_second
+
+    def _get_retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        from requests.exceptions import ConnectionError, Timeout
+
+        response = getattr(error, "response", None)
+        status_code = self._get_status_code(error)
+        if status_code in THROTTLED_STATUS_CODES and response is not None:
+            retry_after = response.headers.get("Retry-After")
+            try:
+                return float(retry_after)
+            except (TypeError, ValueError):
+                pass
+
+        retryable = (
+            status_code in THROTTLED_STATUS_CODES
+            or (status_code is not None and status_code >= 500)
+            or isinstance(error, (ConnectionError, Timeout))
+        )
+        if not retryable:
+            return None
+
+        backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+        return random.uniform(0, backoff)
+
+    def _on_failure(self, error: Exception, retry_delay: float) -> None:
+        with self._condition:
+            self._concurrency_limit = max(1.0, self._concurrency_limit / 2)
+            if self._get_status_code(error) in THROTTLED_STATUS_CODES:
+                self._paused_until = max(
+                    self._paused_until, time.monotonic() + retry_delay
+                )
+
+    def _on_success(self, latency: float) -> None:
+        with self._condition:
+            if self._latency is None:
+                self._latency = latency
+            else:
+                self._latency += LATENCY_SMOOTHING * (latency - self._latency)
+            if self._baseline_latency is None or self._latency < self._baseline_latency:
+                self._baseline_latency = self._latency
+
+            if self._latency <= self._baseline_latency * LATENCY_TOLERANCE:
+                self._concurrency_limit = min(
+                    float(self.max_concurrency),
+                    self._concurrency_limit + 1 / self._concurrency_limit,
+                )
+            else:
+                self._concurrency_limit = max(
+                    1.0, self._concurrency_limit * LATENCY_BACKOFF_FACTOR
+                )
+            self._condition.notify_all()
+
+    def _get_status_code(self, error: Exception) -> Optional[int]:
+        status_code = getattr(error, "status_code", None)
+        response = getattr(error, "response", None)
+        if status_code is None and response is not None:
+            status_code = response.status_code
+        return status_code
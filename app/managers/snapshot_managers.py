@@ -0,0 +1,62 @@
+import gzip
+import json
+from datetime import datetime
+
+from app.constants import SnapshotRecordTypes
+from app.models import Snapshot, SnapshotSprint
+
+
+class SnapshotManager:
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def write_snapshot(self, snapshot: Snapshot) -> None:
+        with gzip.open(self.filename, "wt") as f:
+            header = {
+                "type": SnapshotRecordTypes.HEADER.value,
+                "project_name": snapshot.project_name,
+                "board_id": snapshot.board_id,
+                "recorded_at": snapshot.recorded_at.isoformat(),
+            }
+            f.write(json.dumps(header) + "\n")
+            for sprint in snapshot.sprints:
+                record = {"type": SnapshotRecordTypes.SPRINT.value, **sprint.dict()}
+                f.write(json.dumps(record) + "\n")
+            for issue in snapshot.issues:
+                record = {"type": SnapshotRecordTypes.ISSUE.value, "issue": issue}
+                f.write(json.dumps(record) + "\n")
+            for key, parent_key in snapshot.parent_keys.items():
+                record = {
+                    "type": SnapshotRecordTypes.PARENT.value,
+                    "key": key,
+                    "parent_key": parent_key,
+                }
+                f.write(json.dumps(record) + "\n")
+
+    def read_snapshot(self) -> Snapshot:
+        header = {}
+        sprints = []
+        issues = []
+        parent_keys = {}
+        with gzip.open(self.filename, "rt") as f:
+            for line in f:
+                record = json.loads(line)
+                record_type = SnapshotRecordTypes(record.pop("type"))
+                if record_type == SnapshotRecordTypes.HEADER:
+                    header = record
+                elif record_type == SnapshotRecordTypes.SPRINT:
+                    sprints.append(SnapshotSprint(**record))
+                elif record_type == SnapshotRecordTypes.ISSUE:
+                    issues.append(record["issue"])
+                else:
+                    parent_keys[record["key"]] = record["parent_key"]
+
+        snapshot = Snapshot(
+            project_name=header["project_name"],
+            board_id=header["board_id"],
+            recorded_at=datetime.fromisoformat(header["recorded_at"]),
+            sprints=sprints,
+            issues=issues,
+            parent_keys=parent_keys,
+        )
+        return snapshot
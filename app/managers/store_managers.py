@@ -0,0 +1,249 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import pytz
+
+from app.models import BoardSprint, StoredIssue, SprintMetrics
+
+
+class IssueStoreManager:
+    @classmethod
+    def build(cls, project_name: str):
+        connection = sqlite3.connect(f"cache/{project_name}_issues.sqlite")
+        return cls(connection)
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self._create_tables()
+
+    def get_last_syncs(self, sprint_ids: List[int]) -> Dict[int, datetime]:
+        placeholders = ", ".join("?" for _ in sprint_ids)
+        rows = self.connection.execute(
+            "SELECT sprint_id, last_sync FROM synced_sprints "
+            f"WHERE sprint_id IN ({placeholders})",
+            sprint_ids,
+        ).fetchall()
+        last_syncs = {
+            sprint_id: datetime.fromtimestamp(last_sync, tz=pytz.UTC)
+            for sprint_id, last_sync in rows
+        }
+        return last_syncs
+
+    def upsert_issues(self, issues: List[StoredIssue]) -> None:
+        with self.connection:
+            for issue in issues:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO issues (key, updated, raw) VALUES (?, ?, ?)",
+                    (issue.key, issue.updated, json.dumps(issue.raw)),
+                )
+                self.connection.execute(
+                    "DELETE FROM issue_sprints WHERE issue_key = ?", (issue.key,)
+                )
+                self.connection.executemany(
+                    "INSERT INTO issue_sprints (issue_key, sprint_id) VALUES (?, ?)",
+                    [(issue.key, sprint_id) for sprint_id in issue.sprint_ids],
+                )
+
+    def mark_synced(self, sprint_ids: List[int], synced_at: datetime) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO synced_sprints (sprint_id, last_sync) "
+                "VALUES (?, ?)",
+                [(sprint_id, synced_at.timestamp()) for sprint_id in sprint_ids],
+            )
+
+    def get_issues(self, sprint_ids: List[int]) -> List[Dict]:
+        placeholders = ", ".join("?" for _ in sprint_ids)
+        rows = self.connection.execute(
+            "SELECT raw FROM issues WHERE key IN ("
+            "SELECT DISTINCT issue_key FROM issue_sprints "
+            f"WHERE sprint_id IN ({placeholders}))",
+            sprint_ids,
+        ).fetchall()
+        issues = [json.loads(raw) for (raw,) in rows]
+        return issues
+
+    def iter_issue_pages(
+        self, sprint_ids: List[int], page_size: int
+    ) -> Iterator[List[Dict]]:
+        placeholders = ", ".join("?" for _ in sprint_ids)
+        cursor = self.connection.execute(
+            "SELECT raw FROM issues WHERE key IN ("
+            "SELECT DISTINCT issue_key FROM issue_sprints "
+            f"WHERE sprint_id IN ({placeholders}))",
+            sprint_ids,
+        )
+        while True:
+            rows = cursor.fetchmany(page_size)
+            if len(rows) == 0:
+                break
+            yield [json.loads(raw) for (raw,) in rows]
+
+    def _create_tables(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS issues ("
+                "key TEXT PRIMARY KEY, updated TEXT NOT NULL, raw TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS issue_sprints ("
+                "issue_key TEXT NOT NULL, sprint_id INTEGER NOT NULL, "
+                "PRIMARY KEY (issue_key, sprint_id))"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS issue_sprints_sprint_id "
+                "ON issue_sprints (sprint_id)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS synced_sprints ("
+                "sprint_id INTEGER PRIMARY KEY, last_sync REAL NOT NULL)"
+            )
+
+
+class MetricsCacheManager:
+    @classmethod
+    def build(cls, project_name: str):
+        connection = sqlite3.connect(f"cache/{project_name}_sprint_metrics.sqlite")
+        return cls(connection)
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self._create_tables()
+
+    def get_metrics(self, fingerprints: Dict[int, str]) -> Dict[int, SprintMetrics]:
+        placeholders = ", ".join("?" for _ in fingerprints)
+        rows = self.connection.execute(
+            "SELECT sprint_id, fingerprint, metrics FROM sprint_metrics "
+            f"WHERE sprint_id IN ({placeholders})",
+            list(fingerprints.keys()),
+        ).fetchall()
+        metrics = {
+            sprint_id: SprintMetrics.parse_raw(raw_metrics)
+            for sprint_id, fingerprint, raw_metrics in rows
+            if fingerprints[sprint_id] == fingerprint
+        }
+        return metrics
+
+    def put_metrics(
+        self, metrics: List[SprintMetrics], fingerprints: Dict[int, str]
+    ) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sprint_metrics "
+                "(sprint_id, fingerprint, metrics) VALUES (?, ?, ?)",
+                [
+                    (
+                        sprint_metrics.sprint_id,
+                        fingerprints[sprint_metrics.sprint_id],
+                        sprint_metrics.json(),
+                    )
+                    for sprint_metrics in metrics
+                ],
+            )
+
+    def _create_tables(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sprint_metrics ("
+                "sprint_id INTEGER PRIMARY KEY, fingerprint TEXT NOT NULL, "
+                "metrics TEXT NOT NULL)"
+            )
+
+
+class SprintIndexManager:
+    @classmethod
+    def build(cls, project_name: str):
+        connection = sqlite3.connect(f"cache/{project_name}_sprints.sqlite")
+        return cls(connection)
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self._create_tables()
+
+    def get_closed_sprints(self, board_id: int) -> Dict[int, BoardSprint]:
+        rows = self.connection.execute(
+            "SELECT position, sprint FROM closed_sprints WHERE board_id = ?",
+            (board_id,),
+        ).fetchall()
+        closed_sprints = {
+            position: BoardSprint.parse_raw(raw_sprint) for position, raw_sprint in rows
+        }
+        return closed_sprints
+
+    def put_closed_sprints(
+        self, board_id: int, closed_sprints: Dict[int, BoardSprint]
+    ) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO closed_sprints "
+                "(board_id, position, sprint_id, sprint) VALUES (?, ?, ?, ?)",
+                [
+                    (board_id, position, sprint.id, sprint.json())
+                    for position, sprint in closed_sprints.items()
+                ],
+            )
+
+    def clear(self, board_id: int) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM closed_sprints WHERE board_id = ?", (board_id,)
+            )
+
+    def _create_tables(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS closed_sprints ("
+                "board_id INTEGER NOT NULL, position INTEGER NOT NULL, "
+                "sprint_id INTEGER NOT NULL, sprint TEXT NOT NULL, "
+                "PRIMARY KEY (board_id, position))"
+            )
+
+
+class HierarchyCacheManager:
+    @classmethod
+    def build(cls, project_name: str):
+        connection = sqlite3.connect(
+            f"cache/{project_name}_hierarchy.sqlite", check_same_thread=False
+        )
+        return cls(connection)
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.lock = threading.Lock()
+        self._create_tables()
+
+    def get_parent_keys(
+        self, keys: List[str], fetched_since: datetime
+    ) -> Dict[str, Optional[str]]:
+        placeholders = ", ".join("?" for _ in keys)
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT key, parent_key FROM parents "
+                f"WHERE key IN ({placeholders}) AND fetched_at >= ?",
+                [*keys, fetched_since.timestamp()],
+            ).fetchall()
+        parent_keys = {key: parent_key for key, parent_key in rows}
+        return parent_keys
+
+    def put_parent_keys(
+        self, parent_keys: Dict[str, Optional[str]], fetched_at: datetime
+    ) -> None:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO parents (key, parent_key, fetched_at) "
+                "VALUES (?, ?, ?)",
+                [
+                    (key, parent_key, fetched_at.timestamp())
+                    for key, parent_key in parent_keys.items()
+                ],
+            )
+
+    def _create_tables(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS parents ("
+                "key TEXT PRIMARY KEY, parent_key TEXT, fetched_at REAL NOT NULL)"
+            )
@@ -0,0 +1,46 @@
+from typing import Dict, List, Optional
+
+from app.managers.jira_managers import JIRAManager
+from app.managers.snapshot_managers import SnapshotManager
+from app.models import ManagerConfig, Snapshot, SprintMetrics, WhatIfCommandLineArgs
+from app.utils import (
+    get_config_file_manager_config,
+    get_variations,
+    get_what_if_command_line_args,
+)
+
+
+class WhatIfManager:
+    @classmethod
+    def build(cls, args: Optional[WhatIfCommandLineArgs] = None):
+        if args is None:
+            args = get_what_if_command_line_args()
+        config = get_config_file_manager_config(args.config_filename)
+        snapshot = SnapshotManager(args.snapshot_filename).read_snapshot()
+        variations = get_variations(args.variations_filename)
+        return cls(config, snapshot, variations)
+
+    def __init__(
+        self, config: ManagerConfig, snapshot: Snapshot, variations: Dict[str, Dict]
+    ):
+        self.config = config
+        self.snapshot = snapshot
+        self.variations = variations
+
+    def run(self) -> Dict[str, List[SprintMetrics]]:
+        variations_metrics = {}
+        for name, overrides in self.variations.items():
+            config = ManagerConfig(**{**self.config.dict(), **(overrides or {})})
+            manager = JIRAManager(None, config)
+            sprint_data = manager.replay_sprint_data(self.snapshot)
+            variations_metrics[name] = manager.compute_sprint_metrics(sprint_data)
+        return variations_metrics
+
+    def create_report(self, variations_metrics: Dict[str, List[SprintMetrics]]) -> str:
+        from app.managers.report_managers import ReportManager
+
+        report_manager = ReportManager(
+            ReportManager.get_empty_report(), self.config.project_name
+        )
+        filename = report_manager.create_what_if_report(variations_metrics)
+        return filename
@@ -1,10 +1,32 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional
 
-from jira import Issue
 from pydantic import BaseModel, validator
 
-from app.constants import DEFAULT_STORY_POINTS_FIELD_NAME
+from app.constants import (
+    DEFAULT_STORY_POINTS_FIELD_NAME,
+    DEFAULT_SPRINT_FIELD_NAME,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_RETRIES,
+    BACKFILL_CHUNK_SIZE,
+    DAEMON_HOST,
+    DAEMON_PORT,
+    DAEMON_RECONCILE_SECONDS,
+    FORECAST_CONFIDENCES,
+    HIERARCHY_CACHE_TTL_HOURS,
+    PORTFOLIO_METRIC_COLUMNS,
+    PORTFOLIO_TREND_SPRINTS,
+    FORECAST_SIMULATIONS,
+    RENDER_MAX_POINTS,
+    RENDER_OUTPUT_DIR,
+    PortfolioAggregations,
+    PortfolioGroups,
+    PortfolioPeriods,
+    RenderFormats,
+    ReportFormats,
+    BurndownFrequencies,
+    BurndownEventTypes,
+)
 
 
 class EnvConfig(BaseModel):
@@ -18,9 +40,30 @@ class ReportCommandLineArgs(BaseModel):
     board_id: int
     project_name: str
     story_points_field: str = DEFAULT_STORY_POINTS_FIELD_NAME
+    sprint_field: str = DEFAULT_SPRINT_FIELD_NAME
     complete_status: str
     priority_epics: Optional[List[str]] = []
     past_n_sprints: Optional[int]
+    max_workers: int = DEFAULT_MAX_WORKERS
+    requests_per_second: Optional[float]
+    max_retries: int = DEFAULT_MAX_RETRIES
+    use_issue_store: bool = False
+    use_metrics_cache: bool = False
+    report_format: ReportFormats = ReportFormats.CSV
+    export_csv: bool = False
+    use_sprint_index: bool = False
+    burndown: bool = False
+    burndown_frequency: BurndownFrequencies = BurndownFrequencies.DAILY
+    record_snapshot: Optional[str]
+    replay: Optional[str]
+    stream: bool = False
+    backfill: bool = False
+    backfill_chunk_size: int = BACKFILL_CHUNK_SIZE
+    resolve_hierarchy: bool = False
+    hierarchy_cache_ttl_hours: float = HIERARCHY_CACHE_TTL_HOURS
+    metrics_json: Optional[str]
+    metrics_prometheus: Optional[str]
+    profile: Optional[str]
 
     @validator("priority_epics")
     def set_priority_epics(cls, priority_epics):
@@ -28,9 +71,52 @@ class ReportCommandLineArgs(BaseModel):
             return []
         return priority_epics
 
+    @validator("max_workers")
+    def validate_max_workers(cls, max_workers):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        return max_workers
+
+    @validator("stream")
+    def validate_stream(cls, stream, values):
+        if stream and (
+            values.get("burndown")
+            or values.get("record_snapshot") is not None
+            or values.get("replay") is not None
+        ):
+            raise ValueError(
+                "stream cannot be combined with burndown, record_snapshot or replay"
+            )
+        return stream
+
+    @validator("backfill")
+    def validate_backfill(cls, backfill, values):
+        if backfill and (
+            values.get("stream")
+            or values.get("record_snapshot") is not None
+            or values.get("replay") is not None
+        ):
+            raise ValueError(
+                "backfill cannot be combined with stream, record_snapshot or replay"
+            )
+        return backfill
+
+    @validator("backfill_chunk_size")
+    def validate_backfill_chunk_size(cls, backfill_chunk_size):
+        if backfill_chunk_size < 1:
+            raise ValueError("backfill_chunk_size must be at least 1")
+        return backfill_chunk_size
+
+    @validator("hierarchy_cache_ttl_hours")
+    def validate_hierarchy_cache_ttl_hours(cls, hierarchy_cache_ttl_hours):
+        if hierarchy_cache_ttl_hours < 0:
+            raise ValueError("hierarchy_cache_ttl_hours cannot be negative")
+        return hierarchy_cache_ttl_hours
+
 
 class VisualizationCommandLineArgs(BaseModel):
     project_name: str
+    report_format: ReportFormats = ReportFormats.CSV
 
 
 class ManagerConfig(BaseModel):
@@ -42,20 +128,60 @@ class ManagerConfig(BaseModel):
     board_id: int
     project_name: str
     story_points_field: str
+    sprint_field: str
     complete_status: str
     priority_epics: List[str]
     past_n_sprints: Optional[int]
+    max_workers: int
+    requests_per_second: Optional[float]
+    max_retries: int
+    use_issue_store: bool
+    use_metrics_cache: bool
+    report_format: ReportFormats
+    export_csv: bool
+    use_sprint_index: bool
+    burndown: bool
+    burndown_frequency: BurndownFrequencies
+    record_snapshot: Optional[str]
+    replay: Optional[str]
+    stream: bool
+    backfill: bool
+    backfill_chunk_size: int
+    resolve_hierarchy: bool
+    hierarchy_cache_ttl_hours: float
+    metrics_json: Optional[str]
+    metrics_prometheus: Optional[str]
+    profile: Optional[str]
+
+
+class BoardSprint(BaseModel):
+    id: int
+    name: str
+    state: str
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
 
 
 class SprintIssues(BaseModel):
-    sprint_id: str
-    issues: List[Issue]
+    sprint_id: int
+    issues: List[Dict]
+    sprint_info: Dict
+
+
+class SprintMembership(BaseModel):
+    sprint_id: int
+    added: datetime
+    removed: Optional[datetime]
+
 
-    class Config:
-        arbitrary_types_allowed = True
+class StoredIssue(BaseModel):
+    key: str
+    updated: str
+    raw: Dict
+    sprint_ids: List[int]
 
 
-class JiraTicket(BaseModel):
+class JiraTicket(NamedTuple):
     issue_type: str
     story_points: Optional[int]
     epic_key: Optional[str]
@@ -76,9 +202,20 @@ class UnpointedBreakdown(BaseModel):
 class PriorityPointsBreakdown(BaseModel):
     priority_points: int
     non_priority_points: int
+    completed_priority_points: int
+
+
+class TicketMetrics(BaseModel):
+    commitment: int
+    completed: int
+    scope_change: int
+
+    unpointed_breakdown: UnpointedBreakdown
+    priority_breakdown: PriorityPointsBreakdown
 
 
 class SprintMetrics(BaseModel):
+    sprint_id: int
     planned_capacity: float
     commitment: int
     completed: int
@@ -103,3 +240,209 @@ class SprintMetrics(BaseModel):
         if self.planned_capacity == 0:
             return 0
         return self.completed / self.planned_capacity
+
+
+class BurndownIssue(NamedTuple):
+    story_points: float
+    is_complete: bool
+
+
+class BurndownEvent(NamedTuple):
+    timestamp: datetime
+    issue_index: int
+    event_type: BurndownEventTypes
+    story_points: Optional[float] = None
+
+
+class SprintBurndown(BaseModel):
+    sprint_id: int
+    start_date: datetime
+    end_date: datetime
+
+    timestamps: List[datetime]
+    remaining: List[float]
+    completed: List[float]
+    added_scope: List[float]
+
+    @property
+    def sprint_name(self) -> str:
+        sprint_name = (
+            f"{self.start_date.month}/{self.start_date.day} - "
+            f"{self.end_date.month}/{self.end_date.day}"
+        )
+        return sprint_name
+
+
+class SprintData(BaseModel):
+    sprint_ids: List[int]
+    closed_sprint_ids: List[int]
+    planned_capacities: Dict[int, float]
+    fingerprints: Dict[int, str]
+    cached_metrics: Dict[int, SprintMetrics]
+    sprints_issues: List[SprintIssues]
+    parent_keys: Dict[str, Optional[str]] = {}
+
+
+class SnapshotSprint(BaseModel):
+    sprint_id: int
+    state: str
+    sprint_info: Dict
+
+
+class Snapshot(BaseModel):
+    project_name: str
+    board_id: int
+    recorded_at: datetime
+    sprints: List[SnapshotSprint]
+    issues: List[Dict]
+    parent_keys: Dict[str, Optional[str]] = {}
+
+
+class WhatIfCommandLineArgs(BaseModel):
+    config_filename: str
+    snapshot_filename: str
+    variations_filename: str
+
+
+class ForecastCommandLineArgs(BaseModel):
+    project_names: List[str]
+    report_format: ReportFormats = ReportFormats.CSV
+    remaining_points: Optional[float]
+    priority_remaining_points: Optional[float]
+    simulations: int = FORECAST_SIMULATIONS
+    confidences: List[float] = FORECAST_CONFIDENCES
+    history: Optional[int]
+    exclude_latest_sprints: int = 1
+    seed: Optional[int]
+
+    @validator("simulations")
+    def validate_simulations(cls, simulations):
+        if simulations < 1:
+            raise ValueError("simulations must be at least 1")
+        return simulations
+
+    @validator("confidences", each_item=True)
+    def validate_confidences(cls, confidence):
+        if not 0 < confidence <= 1:
+            raise ValueError("confidences must be between 0 and 1")
+        return confidence
+
+
+class RenderCommandLineArgs(BaseModel):
+    project_names: List[str]
+    report_format: ReportFormats = ReportFormats.CSV
+    output_dir: str = RENDER_OUTPUT_DIR
+    output_format: RenderFormats = RenderFormats.HTML
+    max_points: int = RENDER_MAX_POINTS
+    force: bool = False
+
+    @validator("max_points")
+    def validate_max_points(cls, max_points):
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        return max_points
+
+
+class RenderedBoard(BaseModel):
+    fingerprint: str
+    filenames: List[str]
+
+
+class RenderResult(BaseModel):
+    project_name: str
+    succeeded: bool
+    rendered: bool = False
+    filenames: List[str] = []
+    error: Optional[str]
+
+
+class BackfillCheckpoint(BaseModel):
+    board_id: int
+    completed_sprint_ids: List[int] = []
+    updated_at: Optional[datetime]
+
+
+class DaemonCommandLineArgs(BaseModel):
+    config_filename: str
+    host: str = DAEMON_HOST
+    port: int = DAEMON_PORT
+    reconcile_seconds: float = DAEMON_RECONCILE_SECONDS
+    webhook_secret: Optional[str]
+
+    @validator("reconcile_seconds")
+    def validate_reconcile_seconds(cls, reconcile_seconds):
+        if reconcile_seconds <= 0:
+            raise ValueError("reconcile_seconds must be positive")
+        return reconcile_seconds
+
+
+class PortfolioCommandLineArgs(BaseModel):
+    project_names: List[str] = []
+    report_format: ReportFormats = ReportFormats.CSV
+    metrics: List[str] = ["Completed"]
+    group_by: List[PortfolioGroups] = [PortfolioGroups.PERIOD]
+    period: PortfolioPeriods = PortfolioPeriods.QUARTER
+    aggregation: PortfolioAggregations = PortfolioAggregations.MEAN
+    rolling: Optional[int]
+    since: Optional[date]
+    until: Optional[date]
+    trend: bool = False
+    trend_sprints: int = PORTFOLIO_TREND_SPRINTS
+    output: Optional[str]
+
+    @validator("metrics", each_item=True)
+    def validate_metrics(cls, metric):
+        if metric not in PORTFOLIO_METRIC_COLUMNS:
+            raise ValueError(
+                f"metrics must be one of {', '.join(PORTFOLIO_METRIC_COLUMNS)}"
+            )
+        return metric
+
+    @validator("rolling")
+    def validate_rolling(cls, rolling, values):
+        if rolling is not None and rolling < 1:
+            raise ValueError("rolling must be at least 1")
+        if rolling is not None and PortfolioGroups.PERIOD not in values.get(
+            "group_by", []
+        ):
+            raise ValueError("rolling requires grouping by period")
+        return rolling
+
+    @validator("trend_sprints")
+    def validate_trend_sprints(cls, trend_sprints):
+        if trend_sprints < 2:
+            raise ValueError("trend_sprints must be at least 2")
+        return trend_sprints
+
+
+class BatchCommandLineArgs(BaseModel):
+    config_filenames: List[str]
+    processes: Optional[int]
+
+
+class BoardResult(BaseModel):
+    project_name: str
+    succeeded: bool
+    sprint_count: int = 0
+    error: Optional[str]
+
+
+class PhaseStats(BaseModel):
+    phase: str
+    sprint_id: Optional[int]
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    http_requests: int = 0
+    response_bytes: int = 0
+    issues: int = 0
+    changelog_entries: int = 0
+    downloads_avoided: int = 0
+    errors: int = 0
+
+
+class RunInstrumentation(BaseModel):
+    project_name: str
+    started_at: datetime
+    wall_seconds: float
+    phases: List[PhaseStats]
@@ -1,36 +1,74 @@
 import os
 import argparse
+from glob import glob
+from typing import TYPE_CHECKING, Dict
 
-from yaml import safe_load
-
-from app.constants import DEFAULT_STORY_POINTS_FIELD_NAME
-from app.models import (
-    EnvConfig,
-    ManagerConfig,
-    ReportCommandLineArgs,
-    VisualizationCommandLineArgs,
+from app.constants import (
+    DEFAULT_STORY_POINTS_FIELD_NAME,
+    DEFAULT_SPRINT_FIELD_NAME,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_RETRIES,
+    BACKFILL_CHUNK_SIZE,
+    DAEMON_HOST,
+    DAEMON_PORT,
+    DAEMON_RECONCILE_SECONDS,
+    FORECAST_CONFIDENCES,
+    FORECAST_SIMULATIONS,
+    HIERARCHY_CACHE_TTL_HOURS,
+    PORTFOLIO_METRIC_COLUMNS,
+    PORTFOLIO_TREND_SPRINTS,
+    RENDER_MAX_POINTS,
+    RENDER_OUTPUT_DIR,
+    BurndownFrequencies,
+    PortfolioAggregations,
+    PortfolioGroups,
+    PortfolioPeriods,
+    RenderFormats,
+    ReportFormats,
 )
 
+if TYPE_CHECKING:
+    from app.models import (
+        BatchCommandLineArgs,
+        DaemonCommandLineArgs,
+        EnvConfig,
+        ForecastCommandLineArgs,
+        ManagerConfig,
+        PortfolioCommandLineArgs,
+        RenderCommandLineArgs,
+        ReportCommandLineArgs,
+        VisualizationCommandLineArgs,
+        WhatIfCommandLineArgs,
+    )
+
+
+def _get_config_file_configs(config_filename: str) -> "ReportCommandLineArgs":
+    from yaml import safe_load
 
-def _get_config_file_configs(config_filename: str) -> ReportCommandLineArgs:
     with open(config_filename) as f:
         config = safe_load(f)
 
+    from app.models import ReportCommandLineArgs
+
     args = ReportCommandLineArgs(**config)
     return args
 
 
 def _get_config_file_visualization_configs(
     config_filename: str,
-) -> VisualizationCommandLineArgs:
+) -> "VisualizationCommandLineArgs":
+    from yaml import safe_load
+
     with open(config_filename) as f:
         config = safe_load(f)
 
+    from app.models import VisualizationCommandLineArgs
+
     args = VisualizationCommandLineArgs(**config)
     return args
 
 
-def _get_report_command_line_args() -> ReportCommandLineArgs:
+def _get_report_command_line_args() -> "ReportCommandLineArgs":
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--config-file",
@@ -69,6 +107,14 @@ def _get_report_command_line_args() -> ReportCommandLineArgs:
         required=False,
         default=DEFAULT_STORY_POINTS_FIELD_NAME,
     )
+    parser.add_argument(
+        "--sprint-field",
+        dest="sprint_field",
+        type=str,
+        help="JIRA Sprint API field name",
+        required=False,
+        default=DEFAULT_SPRINT_FIELD_NAME,
+    )
     parser.add_argument(
         "--complete-status",
         dest="complete_status",
@@ -95,23 +141,218 @@ def _get_report_command_line_args() -> ReportCommandLineArgs:
         required=False,
         default=None,
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        help="Maximum number of concurrent requests made to JIRA "
+        "when fetching sprint issues and sprint info",
+        required=False,
+        default=DEFAULT_MAX_WORKERS,
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        dest="requests_per_second",
+        type=float,
+        help="Optional budget of requests per second made to JIRA",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--max-retries",
+        dest="max_retries",
+        type=int,
+        help="Number of times a throttled or failed JIRA request is retried",
+        required=False,
+        default=DEFAULT_MAX_RETRIES,
+    )
+    parser.add_argument(
+        "--use-issue-store",
+        dest="use_issue_store",
+        action="store_true",
+        help="Keep a local store of fetched issues under cache/ and only "
+        "fetch issues that have been updated since the last run",
+        required=False,
+    )
+    parser.add_argument(
+        "--use-metrics-cache",
+        dest="use_metrics_cache",
+        action="store_true",
+        help="Cache the metrics of closed sprints under cache/ and only "
+        "recompute them when the metrics configuration changes",
+        required=False,
+    )
+    parser.add_argument(
+        "--report-format",
+        dest="report_format",
+        type=str,
+        choices=[report_format.value for report_format in ReportFormats],
+        help="Storage format of the report, parquet stores one file per sprint "
+        "and only rewrites the sprints that changed",
+        required=False,
+        default=ReportFormats.CSV.value,
+    )
+    parser.add_argument(
+        "--export-csv",
+        dest="export_csv",
+        action="store_true",
+        help="Also export the full report as a csv when using the parquet "
+        "report format",
+        required=False,
+    )
+    parser.add_argument(
+        "--use-sprint-index",
+        dest="use_sprint_index",
+        action="store_true",
+        help="Keep a local index of the board's closed sprints under cache/ so "
+        "that only sprints newer than the last run are listed",
+        required=False,
+    )
+    parser.add_argument(
+        "--burndown",
+        dest="burndown",
+        action="store_true",
+        help="Also replay the changelogs of every sprint's issues into a "
+        "burndown series written next to the report",
+        required=False,
+    )
+    parser.add_argument(
+        "--burndown-frequency",
+        dest="burndown_frequency",
+        type=str,
+        choices=[frequency.value for frequency in BurndownFrequencies],
+        help="How often the burndown series is sampled",
+        required=False,
+        default=BurndownFrequencies.DAILY.value,
+    )
+    parser.add_argument(
+        "--record-snapshot",
+        dest="record_snapshot",
+        type=str,
+        help="Optional .ndjson.gz file to record the raw sprint and issue "
+        "responses of the run to",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--replay",
+        dest="replay",
+        type=str,
+        help="Optional snapshot file recorded with --record-snapshot to compute "
+        "the report from instead of JIRA",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--stream",
+        dest="stream",
+        action="store_true",
+        help="Fold every page of issues into the sprint metrics as soon as it "
+        "is fetched instead of holding every sprint's issues in memory",
+        required=False,
+    )
+    parser.add_argument(
+        "--backfill",
+        dest="backfill",
+        action="store_true",
+        help="Compute the metrics of every closed sprint on the board in chunks, "
+        "writing each chunk to the report as it finishes and resuming from the "
+        "last checkpoint under cache/",
+        required=False,
+    )
+    parser.add_argument(
+        "--backfill-chunk-size",
+        dest="backfill_chunk_size",
+        type=int,
+        help="Number of sprints fetched and written to the report at a time "
+        "when backfilling",
+        required=False,
+        default=BACKFILL_CHUNK_SIZE,
+    )
+    parser.add_argument(
+        "--resolve-hierarchy",
+        dest="resolve_hierarchy",
+        action="store_true",
+        help="Attribute the points of sub-tasks and other nested issues to the "
+        "priority epic at the top of their parent chain, fetching unknown parents "
+        "in bulk and caching them under cache/",
+        required=False,
+    )
+    parser.add_argument(
+        "--hierarchy-cache-ttl-hours",
+        dest="hierarchy_cache_ttl_hours",
+        type=float,
+        help="Hours a cached parent is trusted before it is fetched again",
+        required=False,
+        default=HIERARCHY_CACHE_TTL_HOURS,
+    )
+    parser.add_argument(
+        "--metrics-json",
+        dest="metrics_json",
+        type=str,
+        help="Optional file to write the per phase and per sprint timings, "
+        "request counts and issue counts of the run to as JSON",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--metrics-prometheus",
+        dest="metrics_prometheus",
+        type=str,
+        help="Optional .prom file to write the per phase totals of the run to "
+        "for the node_exporter textfile collector",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        type=str,
+        help="Optional file to dump cProfile stats of the run to",
+        required=False,
+        default=None,
+    )
     namespace = parser.parse_args()
     if namespace.config_filename is not None:
         args = _get_config_file_configs(namespace.config_filename)
         return args
 
+    from app.models import ReportCommandLineArgs
+
     args = ReportCommandLineArgs(
-        planned_capacity=namespace.planned_capacity,
+        planned_capacities=namespace.planned_capacities,
         board_id=namespace.board_id,
         project_name=namespace.project_name,
         story_points_field=namespace.story_points_field,
+        sprint_field=namespace.sprint_field,
         complete_status=namespace.complete_status,
         priority_epics=namespace.priority_epics,
+        past_n_sprints=namespace.past_n_sprints,
+        max_workers=namespace.max_workers,
+        requests_per_second=namespace.requests_per_second,
+        max_retries=namespace.max_retries,
+        use_issue_store=namespace.use_issue_store,
+        use_metrics_cache=namespace.use_metrics_cache,
+        report_format=namespace.report_format,
+        export_csv=namespace.export_csv,
+        use_sprint_index=namespace.use_sprint_index,
+        burndown=namespace.burndown,
+        burndown_frequency=namespace.burndown_frequency,
+        record_snapshot=namespace.record_snapshot,
+        replay=namespace.replay,
+        stream=namespace.stream,
+        backfill=namespace.backfill,
+        backfill_chunk_size=namespace.backfill_chunk_size,
+        resolve_hierarchy=namespace.resolve_hierarchy,
+        hierarchy_cache_ttl_hours=namespace.hierarchy_cache_ttl_hours,
+        metrics_json=namespace.metrics_json,
+        metrics_prometheus=namespace.metrics_prometheus,
+        profile=namespace.profile,
     )
     return args
 
 
-def get_visualization_command_line_args() -> VisualizationCommandLineArgs:
+def get_visualization_command_line_args() -> "VisualizationCommandLineArgs":
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--config-file",
@@ -128,16 +369,423 @@ def get_visualization_command_line_args() -> VisualizationCommandLineArgs:
         type=str,
         required=False,
     )
+    parser.add_argument(
+        "--report-format",
+        dest="report_format",
+        type=str,
+        choices=[report_format.value for report_format in ReportFormats],
+        help="Storage format of the report",
+        required=False,
+        default=ReportFormats.CSV.value,
+    )
     namespace = parser.parse_args()
     if namespace.config_filename is not None:
         args = _get_config_file_visualization_configs(namespace.config_filename)
         return args
 
-    args = VisualizationCommandLineArgs(project_name=namespace.project_name)
+    from app.models import VisualizationCommandLineArgs
+
+    args = VisualizationCommandLineArgs(
+        project_name=namespace.project_name, report_format=namespace.report_format
+    )
+    return args
+
+
+def get_render_command_line_args() -> "RenderCommandLineArgs":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--project-names",
+        dest="project_names",
+        type=str,
+        nargs="+",
+        help="JIRA Project Names of the reports to render",
+        required=True,
+    )
+    parser.add_argument(
+        "--report-format",
+        dest="report_format",
+        type=str,
+        choices=[report_format.value for report_format in ReportFormats],
+        help="Storage format of the reports",
+        required=False,
+        default=ReportFormats.CSV.value,
+    )
+    parser.add_argument(
+        "--output-dir",
+        dest="output_dir",
+        type=str,
+        help="Directory the rendered figures are written to",
+        required=False,
+        default=RENDER_OUTPUT_DIR,
+    )
+    parser.add_argument(
+        "--output-format",
+        dest="output_format",
+        type=str,
+        choices=[render_format.value for render_format in RenderFormats],
+        help="Render the figures as HTML pages sharing one plotly.js bundle or "
+        "as JSON figure specs",
+        required=False,
+        default=RenderFormats.HTML.value,
+    )
+    parser.add_argument(
+        "--max-points",
+        dest="max_points",
+        type=int,
+        help="Maximum number of points plotted per series, longer sprint "
+        "histories are averaged into buckets and burndowns are thinned out",
+        required=False,
+        default=RENDER_MAX_POINTS,
+    )
+    parser.add_argument(
+        "--force",
+        dest="force",
+        action="store_true",
+        help="Render every board even if its report has not changed since the "
+        "last render",
+        required=False,
+    )
+    namespace = parser.parse_args()
+
+    from app.models import RenderCommandLineArgs
+
+    args = RenderCommandLineArgs(
+        project_names=namespace.project_names,
+        report_format=namespace.report_format,
+        output_dir=namespace.output_dir,
+        output_format=namespace.output_format,
+        max_points=namespace.max_points,
+        force=namespace.force,
+    )
+    return args
+
+
+def get_portfolio_command_line_args() -> "PortfolioCommandLineArgs":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--project-names",
+        dest="project_names",
+        type=str,
+        nargs="+",
+        help="JIRA Project Names of the reports to aggregate, defaults to every "
+        "report under reports/",
+        required=False,
+        default=[],
+    )
+    parser.add_argument(
+        "--report-format",
+        dest="report_format",
+        type=str,
+        choices=[report_format.value for report_format in ReportFormats],
+        help="Storage format of the reports",
+        required=False,
+        default=ReportFormats.CSV.value,
+    )
+    parser.add_argument(
+        "--metrics",
+        dest="metrics",
+        type=str,
+        nargs="+",
+        choices=PORTFOLIO_METRIC_COLUMNS,
+        metavar="METRIC",
+        help="Report columns to aggregate, any of: "
+        f"{', '.join(PORTFOLIO_METRIC_COLUMNS)}",
+        required=False,
+        default=["Completed"],
+    )
+    parser.add_argument(
+        "--group-by",
+        dest="group_by",
+        type=str,
+        nargs="*",
+        choices=[group.value for group in PortfolioGroups],
+        help="Group the sprints of every team by project and/or period, or "
+        "aggregate all of them when no group is given",
+        required=False,
+        default=[PortfolioGroups.PERIOD.value],
+    )
+    parser.add_argument(
+        "--period",
+        dest="period",
+        type=str,
+        choices=[period.value for period in PortfolioPeriods],
+        help="Calendar period the sprints are grouped into by their start date",
+        required=False,
+        default=PortfolioPeriods.QUARTER.value,
+    )
+    parser.add_argument(
+        "--aggregation",
+        dest="aggregation",
+        type=str,
+        choices=[aggregation.value for aggregation in PortfolioAggregations],
+        help="How the sprints of a group are aggregated",
+        required=False,
+        default=PortfolioAggregations.MEAN.value,
+    )
+    parser.add_argument(
+        "--rolling",
+        dest="rolling",
+        type=int,
+        help="Optional number of periods the aggregates are averaged over, per "
+        "project when grouping by project",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--since",
+        dest="since",
+        type=str,
+        help="Only include sprints starting on or after this date (YYYY-MM-DD)",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--until",
+        dest="until",
+        type=str,
+        help="Only include sprints starting on or before this date (YYYY-MM-DD)",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--trend",
+        dest="trend",
+        action="store_true",
+        help="Instead of aggregating, rank the teams by the slope of every metric "
+        "per sprint over their latest sprints",
+        required=False,
+    )
+    parser.add_argument(
+        "--trend-sprints",
+        dest="trend_sprints",
+        type=int,
+        help="Number of latest sprints of every team the trend is fitted to",
+        required=False,
+        default=PORTFOLIO_TREND_SPRINTS,
+    )
+    parser.add_argument(
+        "--output",
+        dest="output",
+        type=str,
+        help="Optional csv file to write the result to",
+        required=False,
+        default=None,
+    )
+    namespace = parser.parse_args()
+
+    from app.models import PortfolioCommandLineArgs
+
+    args = PortfolioCommandLineArgs(
+        project_names=namespace.project_names,
+        report_format=namespace.report_format,
+        metrics=namespace.metrics,
+        group_by=namespace.group_by,
+        period=namespace.period,
+        aggregation=namespace.aggregation,
+        rolling=namespace.rolling,
+        since=namespace.since,
+        until=namespace.until,
+        trend=namespace.trend,
+        trend_sprints=namespace.trend_sprints,
+        output=namespace.output,
+    )
+    return args
+
+
+def get_forecast_command_line_args() -> "ForecastCommandLineArgs":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--project-names",
+        dest="project_names",
+        type=str,
+        nargs="+",
+        help="JIRA Project Names of the reports to forecast",
+        required=True,
+    )
+    parser.add_argument(
+        "--report-format",
+        dest="report_format",
+        type=str,
+        choices=[report_format.value for report_format in ReportFormats],
+        help="Storage format of the reports",
+        required=False,
+        default=ReportFormats.CSV.value,
+    )
+    parser.add_argument(
+        "--remaining-points",
+        dest="remaining_points",
+        type=float,
+        help="Remaining points to forecast with the completed points of every "
+        "sprint",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--priority-remaining-points",
+        dest="priority_remaining_points",
+        type=float,
+        help="Remaining points of all priority epics combined to forecast with "
+        "the completed points of priority epics in every sprint",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--simulations",
+        dest="simulations",
+        type=int,
+        help="Number of Monte Carlo simulations",
+        required=False,
+        default=FORECAST_SIMULATIONS,
+    )
+    parser.add_argument(
+        "--confidences",
+        dest="confidences",
+        type=float,
+        nargs="+",
+        help="Confidence levels to report the number of sprints at",
+        required=False,
+        default=FORECAST_CONFIDENCES,
+    )
+    parser.add_argument(
+        "--history",
+        dest="history",
+        type=int,
+        help="Optional number of most recent sprints to resample from, "
+        "defaults to every sprint in the report",
+        required=False,
+        default=None,
+    )
+    parser.add_argument(
+        "--exclude-latest-sprints",
+        dest="exclude_latest_sprints",
+        type=int,
+        help="Number of the most recent sprints left out of the history, "
+        "such as the currently active sprint",
+        required=False,
+        default=1,
+    )
+    parser.add_argument(
+        "--seed",
+        dest="seed",
+        type=int,
+        help="Optional seed of the simulations",
+        required=False,
+        default=None,
+    )
+    namespace = parser.parse_args()
+
+    from app.models import ForecastCommandLineArgs
+
+    args = ForecastCommandLineArgs(
+        project_names=namespace.project_names,
+        report_format=namespace.report_format,
+        remaining_points=namespace.remaining_points,
+        priority_remaining_points=namespace.priority_remaining_points,
+        simulations=namespace.simulations,
+        confidences=namespace.confidences,
+        history=namespace.history,
+        exclude_latest_sprints=namespace.exclude_latest_sprints,
+        seed=namespace.seed,
+    )
+    return args
+
+
+def get_what_if_command_line_args() -> "WhatIfCommandLineArgs":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--config-file",
+        dest="config_filename",
+        type=str,
+        help="Config file the variations are applied on top of",
+        required=True,
+    )
+    parser.add_argument(
+        "--snapshot",
+        dest="snapshot_filename",
+        type=str,
+        help="Snapshot file recorded with --record-snapshot",
+        required=True,
+    )
+    parser.add_argument(
+        "--variations",
+        dest="variations_filename",
+        type=str,
+        help="Yaml file mapping the name of every variation to the config "
+        "values it overrides",
+        required=True,
+    )
+    namespace = parser.parse_args()
+
+    from app.models import WhatIfCommandLineArgs
+
+    args = WhatIfCommandLineArgs(
+        config_filename=namespace.config_filename,
+        snapshot_filename=namespace.snapshot_filename,
+        variations_filename=namespace.variations_filename,
+    )
     return args
 
 
-def _get_env_config() -> EnvConfig:
+def get_daemon_command_line_args() -> "DaemonCommandLineArgs":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--config-file",
+        dest="config_filename",
+        type=str,
+        help="Config file of the board to keep the active sprint metrics of",
+        required=True,
+    )
+    parser.add_argument(
+        "--host",
+        dest="host",
+        type=str,
+        help="Host the webhook endpoint listens on",
+        required=False,
+        default=DAEMON_HOST,
+    )
+    parser.add_argument(
+        "--port",
+        dest="port",
+        type=int,
+        help="Port the webhook endpoint listens on",
+        required=False,
+        default=DAEMON_PORT,
+    )
+    parser.add_argument(
+        "--reconcile-seconds",
+        dest="reconcile_seconds",
+        type=float,
+        help="Seconds between full re-syncs of the sprints with JIRA, which "
+        "catch up on any webhook events that were missed",
+        required=False,
+        default=DAEMON_RECONCILE_SECONDS,
+    )
+    namespace = parser.parse_args()
+
+    from app.models import DaemonCommandLineArgs
+
+    args = DaemonCommandLineArgs(
+        config_filename=namespace.config_filename,
+        host=namespace.host,
+        port=namespace.port,
+        reconcile_seconds=namespace.reconcile_seconds,
+        webhook_secret=os.environ.get("JIRA_WEBHOOK_SECRET") or None,
+    )
+    return args
+
+
+def get_variations(variations_filename: str) -> Dict[str, Dict]:
+    from yaml import safe_load
+
+    with open(variations_filename) as f:
+        variations = safe_load(f)
+
+    return variations["variations"]
+
+
+def _get_env_config() -> "EnvConfig":
+    from app.models import EnvConfig
+
     config = EnvConfig(
         jira_token=os.environ["JIRA_TOKEN"],
         email=os.environ["JIRA_EMAIL"],
@@ -146,9 +794,67 @@ def _get_env_config() -> EnvConfig:
     return config
 
 
-def get_manager_config() -> ManagerConfig:
-    env_config = _get_env_config()
+def get_manager_config() -> "ManagerConfig":
     command_line_args = _get_report_command_line_args()
+    env_config = _get_env_config()
+
+    from app.models import ManagerConfig
 
     config = ManagerConfig(**env_config.dict(), **command_line_args.dict())
     return config
+
+
+def get_config_file_manager_config(config_filename: str) -> "ManagerConfig":
+    env_config = _get_env_config()
+    config_file_args = _get_config_file_configs(config_filename)
+
+    from app.models import ManagerConfig
+
+    config = ManagerConfig(**env_config.dict(), **config_file_args.dict())
+    return config
+
+
+def get_batch_command_line_args() -> "BatchCommandLineArgs":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--config-dir",
+        dest="config_dir",
+        type=str,
+        help="Directory of config files, a report is generated for every "
+        "yaml config file in it other than TEMPLATE.yaml",
+        required=False,
+    )
+    parser.add_argument(
+        "--config-files",
+        dest="config_filenames",
+        type=str,
+        nargs="*",
+        help="List of config files to generate reports for",
+        required=False,
+        default=[],
+    )
+    parser.add_argument(
+        "--processes",
+        dest="processes",
+        type=int,
+        help="Number of worker processes used to compute the metrics and "
+        "reports, defaults to the number of CPUs",
+        required=False,
+        default=None,
+    )
+    namespace = parser.parse_args()
+
+    config_filenames = list(namespace.config_filenames)
+    if namespace.config_dir is not None:
+        config_filenames.extend(
+            filename
+            for filename in sorted(glob(os.path.join(namespace.config_dir, "*.yaml")))
+            if os.path.basename(filename) != "TEMPLATE.yaml"
+        )
+
+    from app.models import BatchCommandLineArgs
+
+    args = BatchCommandLineArgs(
+        config_filenames=config_filenames, processes=namespace.processes
+    )
+    return args
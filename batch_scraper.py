@@ -0,0 +1,24 @@
+import sys
+
+from dotenv import load_dotenv
+
+from app.utils import get_batch_command_line_args
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    args = get_batch_command_line_args()
+
+    from app.managers.batch_managers import BatchManager
+
+    batch_manager = BatchManager.build(args)
+    results = batch_manager.run()
+    for result in results:
+        if result.succeeded:
+            print(f"{result.project_name}: reported {result.sprint_count} sprints")
+        else:
+            print(f"{result.project_name}: failed with {result.error}")
+
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
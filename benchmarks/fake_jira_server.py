@@ -0,0 +1,623 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+
+from app.constants import DEFAULT_SPRINT_FIELD_NAME, DEFAULT_STORY_POINTS_FIELD_NAME
+
+SPRINT_LENGTH = timedelta(days=14)
+GREENHOPPER_DATE_FORMAT = "%d/%b/%y %I:%M %p"
+AGILE_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+CHANGELOG_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000+0000"
+JQL_DATE_FORMAT = "%Y/%m/%d %H:%M"
+STATUSES = ["To Do", "In Progress", "Done"]
+ISSUE_TYPES = ["Story", "Story", "Story", "Task", "Bug"]
+STORY_POINTS = [None, 1, 2, 3, 5, 8]
+FILLER_FIELDS = ["description", "summary", "labels", "assignee", "Rank"]
+
+
+class FakeJiraData:
+    def __init__(
+        self,
+        sprint_count: int = 26,
+        issue_count: int = 2000,
+        changelog_entries: int = 10,
+        epic_count: int = 20,
+        board_id: int = 1,
+        project_name: str = "BENCH",
+        story_points_field: str = DEFAULT_STORY_POINTS_FIELD_NAME,
+        sprint_field: str = DEFAULT_SPRINT_FIELD_NAME,
+        complete_status: str = "Done",
+        seed: int = 0,
+    ):
+        self.board_id = board_id
+        self.project_name = project_name
+        self.story_points_field = story_points_field
+        self.sprint_field = sprint_field
+        self.complete_status = complete_status
+        self.changelog_entries = changelog_entries
+        self.seed = seed
+
+        now = datetime.now(pytz.UTC).replace(second=0, microsecond=0)
+        first_start = now - SPRINT_LENGTH * (sprint_count - 1) - SPRINT_LENGTH / 2
+        self.sprints = [
+            self._build_sprint(index, first_start + SPRINT_LENGTH * index, now)
+            for index in range(sprint_count + 1)
+        ]
+        self._sprint_positions = {
+            sprint["id"]: index for index, sprint in enumerate(self.sprints)
+        }
+
+        self.keys: List[str] = []
+        self.issue_types: List[str] = []
+        self.story_points: List[Optional[int]] = []
+        self.statuses: List[str] = []
+        self.parents: List[Optional[str]] = []
+        self.created: List[datetime] = []
+        self.updated: List[datetime] = []
+        self.memberships: List[List[Tuple[int, datetime]]] = []
+        self._build_issues(epic_count, issue_count, sprint_count)
+
+        self.key_index = {key: index for index, key in enumerate(self.keys)}
+        self.sprint_index: Dict[int, List[int]] = {}
+        self.parent_index: Dict[str, List[int]] = {}
+        for index, membership in enumerate(self.memberships):
+            for sprint_id, _ in membership:
+                self.sprint_index.setdefault(sprint_id, []).append(index)
+            if self.parents[index] is not None:
+                self.parent_index.setdefault(self.parents[index], []).append(index)
+
+    def _build_sprint(self, index: int, start_date: datetime, now: datetime) -> Dict:
+        end_date = start_date + SPRINT_LENGTH
+        if end_date <= now:
+            state = "CLOSED"
+        elif start_date <= now:
+            state = "ACTIVE"
+        else:
+            state = "FUTURE"
+        sprint = {
+            "id": 1000 + index,
+            "name": f"{self.project_name} Sprint {index + 1}",
+            "state": state,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        return sprint
+
+    def _build_issues(
+        self, epic_count: int, issue_count: int, sprint_count: int
+    ) -> None:
+        rnd = random.Random(self.seed)
+        for index in range(epic_count):
+            self._add_issue("Epic", None, "In Progress", None, [])
+
+        for index in range(issue_count):
+            position = index * sprint_count // max(issue_count, 1)
+            sprint = self.sprints[position]
+            sprint_positions = [position]
+            while (
+                rnd.random() < 0.15
+                and sprint_positions[-1] + 1 < sprint_count
+                and len(sprint_positions) < 4
+            ):
+                sprint_positions.append(sprint_positions[-1] + 1)
+
+            membership = []
+            for sprint_position in sprint_positions:
+                member_sprint = self.sprints[sprint_position]
+                offset = timedelta(
+                    hours=rnd.randint(-72, 120)
+                    if rnd.random() < 0.3
+                    else -rnd.randint(1, 72)
+                )
+                membership.append(
+                    (member_sprint["id"], member_sprint["start_date"] + offset)
+                )
+
+            last_sprint = self.sprints[sprint_positions[-1]]
+            if last_sprint["state"] == "CLOSED" or rnd.random() < 0.5:
+                status = self.complete_status
+            else:
+                status = rnd.choice(STATUSES[:2])
+
+            issue_type = rnd.choice(ISSUE_TYPES)
+            parent = None
+            if rnd.random() < 0.1 and index > 0:
+                issue_type = "Sub-task"
+                parent = self.keys[-1]
+            elif epic_count > 0 and rnd.random() < 0.6:
+                parent = self.keys[rnd.randrange(epic_count)]
+
+            story_points = rnd.choice(STORY_POINTS)
+            self._add_issue(issue_type, story_points, status, parent, membership)
+            self.created[-1] = sprint["start_date"] - timedelta(days=rnd.randint(1, 30))
+
+    def _add_issue(
+        self,
+        issue_type: str,
+        story_points: Optional[int],
+        status: str,
+        parent: Optional[str],
+        membership: List[Tuple[int, datetime]],
+    ) -> None:
+        created = self.sprints[0]["start_date"] - timedelta(days=30)
+        self.keys.append(f"{self.project_name}-{len(self.keys) + 1}")
+        self.issue_types.append(issue_type)
+        self.story_points.append(story_points)
+        self.statuses.append(status)
+        self.parents.append(parent)
+        self.created.append(created)
+        self.memberships.append(membership)
+        updated = max([added for _, added in membership], default=created)
+        self.updated.append(updated + timedelta(hours=1))
+
+    def render_issue(
+        self, index: int, fields: Optional[List[str]], expand: str
+    ) -> Dict:
+        sprint_ids = [sprint_id for sprint_id, _ in self.memberships[index]]
+        all_fields = {
+            self.story_points_field: self.story_points[index],
+            self.sprint_field: [
+                self.render_agile_sprint(
+                    self.sprints[self._sprint_positions[sprint_id]]
+                )
+                for sprint_id in sprint_ids
+            ]
+            or None,
+            "status": {"name": self.statuses[index]},
+            "issuetype": {"name": self.issue_types[index]},
+            "created": self.created[index].strftime(CHANGELOG_DATE_FORMAT),
+            "updated": self.updated[index].strftime(CHANGELOG_DATE_FORMAT),
+        }
+        if self.parents[index] is not None:
+            all_fields["parent"] = {
+                "key": self.parents[index],
+                "id": str(self.key_index[self.parents[index]] + 1),
+            }
+
+        if fields is None or "*all" in fields:
+            issue_fields = all_fields
+        else:
+            issue_fields = {
+                field: value for field, value in all_fields.items() if field in fields
+            }
+
+        issue = {
+            "expand": "renderedFields,names,schema,changelog",
+            "id": str(index + 1),
+            "key": self.keys[index],
+            "fields": issue_fields,
+        }
+        if expand is not None and "changelog" in expand:
+            histories = self._render_histories(index)
+            issue["changelog"] = {
+                "startAt": 0,
+                "maxResults": len(histories),
+                "total": len(histories),
+                "histories": histories,
+            }
+        return issue
+
+    def _render_histories(self, index: int) -> List[Dict]:
+        rnd = random.Random(self.seed * 1000003 + index)
+        events = []
+
+        sprint_ids: List[str] = []
+        for sprint_id, added in self.memberships[index]:
+            previous = ", ".join(sprint_ids)
+            sprint_ids.append(str(sprint_id))
+            events.append(
+                (
+                    added,
+                    {
+                        "field": "Sprint",
+                        "fieldtype": "custom",
+                        "fieldId": self.sprint_field,
+                        "from": previous,
+                        "fromString": previous,
+                        "to": ", ".join(sprint_ids),
+                        "toString": ", ".join(sprint_ids),
+                    },
+                )
+            )
+
+        created = self.created[index]
+        if self.story_points[index] is not None:
+            events.append(
+                (
+                    created + timedelta(minutes=5),
+                    {
+                        "field": "Story Points",
+                        "fieldtype": "custom",
+                        "fieldId": self.story_points_field,
+                        "from": None,
+                        "fromString": None,
+                        "to": None,
+                        "toString": str(self.story_points[index]),
+                    },
+                )
+            )
+
+        status_path = STATUSES[: STATUSES.index(self.statuses[index]) + 1]
+        if len(self.memberships[index]) > 0:
+            last_added = self.memberships[index][-1][1]
+            for step, (from_status, to_status) in enumerate(
+                zip(status_path, status_path[1:])
+            ):
+                events.append(
+                    (
+                        last_added + timedelta(days=2 + step * 3),
+                        {
+                            "field": "status",
+                            "fieldtype": "jira",
+                            "fieldId": "status",
+                            "from": str(STATUSES.index(from_status) + 1),
+                            "fromString": from_status,
+                            "to": str(STATUSES.index(to_status) + 1),
+                            "toString": to_status,
+                        },
+                    )
+                )
+
+        while len(events) < self.changelog_entries:
+            field = rnd.choice(FILLER_FIELDS)
+            events.append(
+                (
+                    created + timedelta(hours=rnd.randint(1, 24 * 60)),
+                    {
+                        "field": field,
+                        "fieldtype": "jira",
+                        "fieldId": field,
+                        "from": None,
+                        "fromString": "before",
+                        "to": None,
+                        "toString": "after",
+                    },
+                )
+            )
+
+        events.sort(key=lambda event: event[0])
+        histories = [
+            {
+                "id": str(history_id),
+                "author": {"displayName": "Benchmark"},
+                "created": created_at.strftime(CHANGELOG_DATE_FORMAT),
+                "items": [item],
+            }
+            for history_id, (created_at, item) in enumerate(events)
+        ]
+        return histories
+
+    def render_greenhopper_sprint(self, sprint: Dict) -> Dict:
+        greenhopper_sprint = {
+            "id": sprint["id"],
+            "sequence": sprint["id"],
+            "name": sprint["name"],
+            "state": sprint["state"],
+            "linkedPagesCount": 0,
+            "startDate": sprint["start_date"].strftime(GREENHOPPER_DATE_FORMAT),
+            "endDate": sprint["end_date"].strftime(GREENHOPPER_DATE_FORMAT),
+        }
+        return greenhopper_sprint
+
+    def render_agile_sprint(self, sprint: Dict) -> Dict:
+        agile_sprint = {
+            "id": sprint["id"],
+            "name": sprint["name"],
+            "state": sprint["state"].lower(),
+            "boardId": self.board_id,
+            "originBoardId": self.board_id,
+            "startDate": sprint["start_date"].strftime(AGILE_DATE_FORMAT),
+            "endDate": sprint["end_date"].strftime(AGILE_DATE_FORMAT),
+        }
+        return agile_sprint
+
+    def search(self, jql: str) -> List[int]:
+        matches: Optional[set] = None
+        for clause in re.split(r"\s+AND\s+", jql.strip(), flags=re.IGNORECASE):
+            clause_matches = self._match_clause(clause.strip())
+            if clause_matches is None:
+                continue
+            if isinstance(clause_matches, tuple):
+                (excluded,) = clause_matches
+                if matches is None:
+                    matches = set(range(len(self.keys)))
+                matches = matches - excluded
+            else:
+                matches = (
+                    clause_matches if matches is None else matches & clause_matches
+                )
+        if matches is None:
+            matches = set(range(len(self.keys)))
+        return sorted(matches)
+
+    def _match_clause(self, clause: str):
+        project_match = re.fullmatch(r"project\s*=\s*(\S+)", clause)
+        if project_match is not None:
+            if project_match.group(1) != self.project_name:
+                return set()
+            return None
+
+        list_match = re.fullmatch(
+            r"(sprint|key|issuekey|parent)\s+(not\s+in|in)\s*\(([^)]*)\)",
+            clause,
+            flags=re.IGNORECASE,
+        )
+        equals_match = re.fullmatch(
+            r"(sprint|key|issuekey|parent)\s*(!=|=)\s*(\S+)",
+            clause,
+            flags=re.IGNORECASE,
+        )
+        if list_match is not None or equals_match is not None:
+            field, operator, values = (list_match or equals_match).groups()
+            values = [value.strip().strip('"') for value in values.split(",")]
+            found = self._find_by_field(field.lower(), values)
+            if operator.lower().startswith("not") or operator == "!=":
+                return (found,)
+            return found
+
+        status_match = re.fullmatch(r'status\s*(!=|=)\s*"?([^"]*)"?', clause)
+        if status_match is not None:
+            operator, status = status_match.groups()
+            found = {
+                index
+                for index, issue_status in enumerate(self.statuses)
+                if issue_status == status
+            }
+            return (found,) if operator == "!=" else found
+
+        updated_match = re.fullmatch(r'updated\s*>=\s*"([^"]+)"', clause)
+        if updated_match is not None:
+            since = datetime.strptime(updated_match.group(1), JQL_DATE_FORMAT)
+            since = pytz.UTC.localize(since)
+            return {
+                index for index, updated in enumerate(self.updated) if updated >= since
+            }
+
+        raise ValueError(f"Unsupported JQL clause: {clause}")
+
+    def _find_by_field(self, field: str, values: List[str]) -> set:
+        found = set()
+        for value in values:
+            if field == "sprint":
+                found.update(self.sprint_index.get(int(value), []))
+            elif field in ("key", "issuekey"):
+                if value in self.key_index:
+                    found.add(self.key_index[value])
+            else:
+                found.update(self.parent_index.get(value, []))
+        return found
+
+
+class FakeJiraServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        data: FakeJiraData,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        max_page_size: int = 100,
+    ):
+        super().__init__((host, port), FakeJiraRequestHandler)
+        self.data = data
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.request_count = 0
+        self.throttled_count = 0
+        self.response_bytes = 0
+        self.endpoint_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(data.seed)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = {
+                "requests": self.request_count,
+                "throttled": self.throttled_count,
+                "response_bytes": self.response_bytes,
+                "endpoints": dict(self.endpoint_counts),
+            }
+        return stats
+
+    def record_request(self, endpoint: str, response_bytes: int) -> None:
+        with self._lock:
+            self.request_count += 1
+            self.response_bytes += response_bytes
+            self.endpoint_counts[endpoint] = self.endpoint_counts.get(endpoint, 0) + 1
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            throttle = self._random.random() < self.throttle_rate
+            if throttle:
+                self.throttled_count += 1
+        return throttle
+
+
+class FakeJiraRequestHandler(BaseHTTPRequestHandler):
+    server: FakeJiraServer
+
+    routes = [
+        (re.compile(r"^/rest/api/2/serverInfo$"), "_server_info"),
+        (re.compile(r"^/rest/api/2/field$"), "_fields"),
+        (re.compile(r"^/rest/api/2/search$"), "_search"),
+        (re.compile(r"^/rest/greenhopper/1.0/sprintquery/(\d+)$"), "_sprint_query"),
+        (
+            re.compile(r"^/rest/greenhopper/1.0/sprint/(\d+)/edit/model$"),
+            "_greenhopper_sprint",
+        ),
+        (re.compile(r"^/rest/agile/1.0/board/(\d+)/sprint$"), "_board_sprints"),
+        (re.compile(r"^/rest/agile/1.0/sprint/(\d+)$"), "_agile_sprint"),
+    ]
+
+    def log_message(self, format, *args) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        parsed_url = urlparse(self.path)
+        params = {
+            key: ",".join(values) for key, values in parse_qs(parsed_url.query).items()
+        }
+
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+
+        for pattern, handler_name in self.routes:
+            match = pattern.match(parsed_url.path)
+            if match is None:
+                continue
+            if self.server.should_throttle():
+                self._send_json(
+                    429,
+                    {"errorMessages": ["Rate limit exceeded"]},
+                    handler_name,
+                    {"Retry-After": str(self.server.retry_after)},
+                )
+                return None
+            try:
+                body = getattr(self, handler_name)(params, *match.groups())
+            except (KeyError, ValueError) as e:
+                self._send_json(400, {"errorMessages": [str(e)]}, handler_name)
+                return None
+            self._send_json(200, body, handler_name)
+            return None
+
+        self._send_json(404, {"errorMessages": ["Not found"]}, "not_found")
+
+    def _send_json(
+        self, status: int, body: Dict, endpoint: str, headers: Optional[Dict] = None
+    ) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.record_request(endpoint.lstrip("_"), len(payload))
+
+    def _server_info(self, params: Dict) -> Dict:
+        return {
+            "baseUrl": self.server.url,
+            "version": "1001.0.0-SNAPSHOT",
+            "versionNumbers": [1001, 0, 0],
+            "deploymentType": "Cloud",
+            "serverTitle": "Fake JIRA",
+        }
+
+    def _fields(self, params: Dict) -> List:
+        return []
+
+    def _search(self, params: Dict) -> Dict:
+        data = self.server.data
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), self.server.max_page_size)
+        fields = params["fields"].split(",") if params.get("fields") else None
+        matches = data.search(params["jql"])
+        issues = [
+            data.render_issue(index, fields, params.get("expand"))
+            for index in matches[start_at : start_at + max_results]
+        ]
+        return {
+            "expand": "schema,names",
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(matches),
+            "issues": issues,
+        }
+
+    def _sprint_query(self, params: Dict, board_id: str) -> Dict:
+        data = self.server.data
+        return {
+            "rapidViewId": int(board_id),
+            "sprints": [
+                data.render_greenhopper_sprint(sprint) for sprint in data.sprints
+            ],
+        }
+
+    def _greenhopper_sprint(self, params: Dict, sprint_id: str) -> Dict:
+        data = self.server.data
+        sprint = data.sprints[data._sprint_positions[int(sprint_id)]]
+        return {"sprint": data.render_greenhopper_sprint(sprint)}
+
+    def _board_sprints(self, params: Dict, board_id: str) -> Dict:
+        data = self.server.data
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), 50)
+        states = params.get("state")
+        sprints = [data.render_agile_sprint(sprint) for sprint in data.sprints]
+        if states:
+            sprints = [
+                sprint for sprint in sprints if sprint["state"] in states.split(",")
+            ]
+        page = sprints[start_at : start_at + max_results]
+        return {
+            "maxResults": max_results,
+            "startAt": start_at,
+            "total": len(sprints),
+            "isLast": start_at + len(page) >= len(sprints),
+            "values": page,
+        }
+
+    def _agile_sprint(self, params: Dict, sprint_id: str) -> Dict:
+        data = self.server.data
+        sprint = data.sprints[data._sprint_positions[int(sprint_id)]]
+        return data.render_agile_sprint(sprint)
+
+
+def _get_command_line_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", dest="port", type=int, default=8080)
+    parser.add_argument("--sprints", dest="sprints", type=int, default=26)
+    parser.add_argument("--issues", dest="issues", type=int, default=2000)
+    parser.add_argument(
+        "--changelog-entries", dest="changelog_entries", type=int, default=10
+    )
+    parser.add_argument("--latency", dest="latency", type=float, default=0.0)
+    parser.add_argument(
+        "--throttle-rate", dest="throttle_rate", type=float, default=0.0
+    )
+    parser.add_argument("--seed", dest="seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _get_command_line_args()
+    data = FakeJiraData(
+        sprint_count=args.sprints,
+        issue_count=args.issues,
+        changelog_entries=args.changelog_entries,
+        seed=args.seed,
+    )
+    server = FakeJiraServer(
+        data,
+        port=args.port,
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+    )
+    print(f"Serving fake JIRA for project {data.project_name} on {server.url}")
+    server.serve_forever()
@@ -0,0 +1,128 @@
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+HEAVY_MODULES = ["jira", "pandas", "plotly", "numpy", "pydantic", "yaml"]
+
+
+class EntryPath(NamedTuple):
+    name: str
+    arguments: List[str]
+    budget_ms: float
+    forbidden_modules: List[str]
+
+
+ENTRY_PATHS = [
+    EntryPath("jira_scraper --help", ["jira_scraper.py", "--help"], 150, HEAVY_MODULES),
+    EntryPath(
+        "visualization --help", ["visualization.py", "--help"], 150, HEAVY_MODULES
+    ),
+    EntryPath("forecast --help", ["forecast.py", "--help"], 150, HEAVY_MODULES),
+    EntryPath(
+        "batch_scraper --help", ["batch_scraper.py", "--help"], 150, HEAVY_MODULES
+    ),
+    EntryPath("what_if --help", ["what_if.py", "--help"], 150, HEAVY_MODULES),
+    EntryPath("render --help", ["render.py", "--help"], 150, HEAVY_MODULES),
+    EntryPath("daemon --help", ["daemon.py", "--help"], 150, HEAVY_MODULES),
+    EntryPath("portfolio --help", ["portfolio.py", "--help"], 150, HEAVY_MODULES),
+    EntryPath(
+        "import jira_managers",
+        ["-c", "import app.managers.jira_managers"],
+        800,
+        ["jira", "pandas", "plotly"],
+    ),
+    EntryPath(
+        "import report_managers",
+        ["-c", "import app.managers.report_managers"],
+        1500,
+        ["jira", "plotly"],
+    ),
+]
+
+
+def parse_import_times(output: str) -> Tuple[float, Set[str]]:
+    total_us = 0
+    modules = set()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip().split(".")[0])
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def measure_entry_path(entry_path: EntryPath, repeat: int) -> Dict:
+    import_times = []
+    modules: Set[str] = set()
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", *entry_path.arguments],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        import_time, modules = parse_import_times(process.stderr)
+        import_times.append(import_time)
+
+    loaded_forbidden_modules = sorted(
+        module for module in entry_path.forbidden_modules if module in modules
+    )
+    result = {
+        "name": entry_path.name,
+        "import_ms": min(import_times),
+        "budget_ms": entry_path.budget_ms,
+        "modules": len(modules),
+        "forbidden_modules": loaded_forbidden_modules,
+        "passed": min(import_times) <= entry_path.budget_ms
+        and not loaded_forbidden_modules,
+    }
+    return result
+
+
+def get_command_line_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check the import time of every entry point against a budget."
+    )
+    parser.add_argument("--repeat", dest="repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-scale",
+        dest="budget_scale",
+        type=float,
+        default=1.0,
+        help="Multiplies every budget, e.g. for slower CI machines.",
+    )
+    parser.add_argument("--output", dest="output", type=str, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = get_command_line_args()
+    results = []
+    for entry_path in ENTRY_PATHS:
+        entry_path = entry_path._replace(
+            budget_ms=entry_path.budget_ms * args.budget_scale
+        )
+        result = measure_entry_path(entry_path, args.repeat)
+        results.append(result)
+        status = "ok" if result["passed"] else "FAILED"
+        print(
+            f"{result['name']}: {result['import_ms']:.1f}ms "
+            f"(budget {result['budget_ms']:.0f}ms) {status}"
+        )
+        if result["forbidden_modules"]:
+            print(f"  loaded {', '.join(result['forbidden_modules'])}")
+
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump({"results": results}, output_file, indent=2)
+
+    if not all(result["passed"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from benchmarks.fake_jira_server import FakeJiraData, FakeJiraServer
+from app.constants import (
+    BACKFILL_CHUNK_SIZE,
+    HIERARCHY_CACHE_TTL_HOURS,
+    BurndownFrequencies,
+    ReportFormats,
+)
+from app.managers.jira_managers import JIRAManager
+from app.managers.report_managers import ReportManager
+from app.models import ManagerConfig
+
+BENCHMARK_PROJECT_NAME = "BENCH"
+BENCHMARK_BOARD_ID = 1
+
+
+def run_scrape(config: ManagerConfig, repeat: int) -> List[Dict]:
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        os.makedirs("reports")
+        os.makedirs("cache")
+        for run in range(repeat):
+            started = time.perf_counter()
+            manager = JIRAManager.build(config)
+            if config.stream:
+                sprint_metrics = manager.stream_sprint_metrics()
+            else:
+                sprint_metrics = manager.get_sprint_metrics()
+            scraped = time.perf_counter()
+            report_manager = ReportManager.build(
+                config.project_name, config.report_format, tail=len(sprint_metrics)
+            )
+            report_manager.create_or_update_report(sprint_metrics)
+            finished = time.perf_counter()
+            runs.append(
+                {
+                    "run": run,
+                    "sprints": len(sprint_metrics),
+                    "scrape_seconds": scraped - started,
+                    "report_seconds": finished - scraped,
+                    "wall_seconds": finished - started,
+                    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                    "phases": [
+                        stats.dict()
+                        for stats in manager.instrumentation.get_run_instrumentation().phases
+                    ],
+                }
+            )
+    return runs
+
+
+def run_strategy(server: FakeJiraServer, config: ManagerConfig, repeat: int) -> Dict:
+    before = server.get_stats()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        runs = executor.submit(run_scrape, config, repeat).result()
+    after = server.get_stats()
+
+    result = {
+        "max_workers": config.max_workers,
+        "use_issue_store": config.use_issue_store,
+        "use_metrics_cache": config.use_metrics_cache,
+        "use_sprint_index": config.use_sprint_index,
+        "stream": config.stream,
+        "report_format": config.report_format.value,
+        "runs": runs,
+        "requests": after["requests"] - before["requests"],
+        "throttled": after["throttled"] - before["throttled"],
+        "response_bytes": after["response_bytes"] - before["response_bytes"],
+    }
+    return result
+
+
+def build_config(server: FakeJiraServer, args: argparse.Namespace, **kwargs):
+    config = ManagerConfig(
+        jira_token="benchmark",
+        email="benchmark@example.com",
+        server_url=server.url,
+        planned_capacities=[40],
+        board_id=BENCHMARK_BOARD_ID,
+        project_name=BENCHMARK_PROJECT_NAME,
+        story_points_field=server.data.story_points_field,
+        sprint_field=server.data.sprint_field,
+        complete_status=server.data.complete_status,
+        priority_epics=server.data.keys[:2],
+        past_n_sprints=(
+            args.past_n_sprints
+            if args.past_n_sprints is not None
+            else len(server.data.sprints)
+        ),
+        max_workers=kwargs.get("max_workers", 1),
+        requests_per_second=args.requests_per_second,
+        max_retries=args.max_retries,
+        use_issue_store=kwargs.get("use_issue_store", False),
+        use_metrics_cache=kwargs.get("use_metrics_cache", False),
+        report_format=args.report_format,
+        export_csv=False,
+        use_sprint_index=kwargs.get("use_sprint_index", False),
+        burndown=False,
+        burndown_frequency=BurndownFrequencies.DAILY,
+        stream=kwargs.get("stream", False),
+        backfill=False,
+        backfill_chunk_size=BACKFILL_CHUNK_SIZE,
+        resolve_hierarchy=False,
+        hierarchy_cache_ttl_hours=HIERARCHY_CACHE_TTL_HOURS,
+    )
+    return config
+
+
+def get_command_line_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark a full scrape against a local fake JIRA server."
+    )
+    parser.add_argument("--sprints", dest="sprints", type=int, default=26)
+    parser.add_argument("--issues", dest="issues", type=int, default=2000)
+    parser.add_argument(
+        "--changelog-entries", dest="changelog_entries", type=int, default=10
+    )
+    parser.add_argument("--latency", dest="latency", type=float, default=0.0)
+    parser.add_argument(
+        "--throttle-rate", dest="throttle_rate", type=float, default=0.0
+    )
+    parser.add_argument("--retry-after", dest="retry_after", type=float, default=0.1)
+    parser.add_argument("--seed", dest="seed", type=int, default=0)
+    parser.add_argument(
+        "--past-n-sprints", dest="past_n_sprints", type=int, default=None
+    )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        nargs="+",
+        default=[1, 4],
+        help="Each value is benchmarked as a separate strategy.",
+    )
+    parser.add_argument(
+        "--requests-per-second", dest="requests_per_second", type=float, default=None
+    )
+    parser.add_argument("--max-retries", dest="max_retries", type=int, default=5)
+    parser.add_argument(
+        "--use-issue-store", dest="use_issue_store", action="store_true"
+    )
+    parser.add_argument(
+        "--use-metrics-cache", dest="use_metrics_cache", action="store_true"
+    )
+    parser.add_argument(
+        "--use-sprint-index", dest="use_sprint_index", action="store_true"
+    )
+    parser.add_argument("--stream", dest="stream", action="store_true")
+    parser.add_argument(
+        "--report-format",
+        dest="report_format",
+        type=ReportFormats,
+        choices=list(ReportFormats),
+        default=ReportFormats.CSV,
+    )
+    parser.add_argument("--repeat", dest="repeat", type=int, default=2)
+    parser.add_argument("--output", dest="output", type=str, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = get_command_line_args()
+    data = FakeJiraData(
+        sprint_count=args.sprints,
+        issue_count=args.issues,
+        changelog_entries=args.changelog_entries,
+        project_name=BENCHMARK_PROJECT_NAME,
+        board_id=BENCHMARK_BOARD_ID,
+        seed=args.seed,
+    )
+    server = FakeJiraServer(
+        data,
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+    )
+    server.start()
+
+    results = []
+    for max_workers in args.max_workers:
+        config = build_config(
+            server,
+            args,
+            max_workers=max_workers,
+            use_issue_store=args.use_issue_store,
+            use_metrics_cache=args.use_metrics_cache,
+            use_sprint_index=args.use_sprint_index,
+            stream=args.stream,
+        )
+        result = run_strategy(server, config, args.repeat)
+        results.append(result)
+        for run in result["runs"]:
+            print(
+                f"max_workers={max_workers} run={run['run']} "
+                f"wall={run['wall_seconds']:.2f}s "
+                f"scrape={run['scrape_seconds']:.2f}s "
+                f"report={run['report_seconds']:.2f}s "
+                f"peak_rss={run['peak_rss_kb'] / 1024:.1f}MB"
+            )
+        print(
+            f"max_workers={max_workers} requests={result['requests']} "
+            f"throttled={result['throttled']} bytes={result['response_bytes']}"
+        )
+
+    server.shutdown()
+    summary = {
+        "dataset": {
+            "sprints": args.sprints,
+            "issues": args.issues,
+            "changelog_entries": args.changelog_entries,
+            "latency": args.latency,
+            "throttle_rate": args.throttle_rate,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(summary, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
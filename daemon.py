@@ -0,0 +1,31 @@
+from dotenv import load_dotenv
+
+from app.constants import DAEMON_WEBHOOK_PATH
+from app.utils import get_daemon_command_line_args
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    args = get_daemon_command_line_args()
+
+    from app.managers.daemon_managers import DaemonManager
+
+    daemon_manager = DaemonManager.build(args)
+    config = daemon_manager.config
+    print(
+        f"Keeping {config.project_name} up to date, listening for webhooks on "
+        f"http://{args.host}:{args.port}{DAEMON_WEBHOOK_PATH}"
+    )
+    try:
+        daemon_manager.run(
+            on_reconcile_error=lambda e: print(f"Reconciliation failed with {e!r}")
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        instrumentation = daemon_manager.manager.instrumentation
+        if config.metrics_json is not None:
+            instrumentation.write_json(config.metrics_json)
+        if config.metrics_prometheus is not None:
+            instrumentation.write_prometheus(config.metrics_prometheus)
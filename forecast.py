@@ -0,0 +1,25 @@
+from app.utils import get_forecast_command_line_args
+
+if __name__ == "__main__":
+    args = get_forecast_command_line_args()
+
+    import pandas as pd
+
+    from app.managers.report_managers import ReportManager
+
+    forecast_dfs = []
+    for project_name in args.project_names:
+        report_manager = ReportManager.build(project_name, args.report_format)
+        forecast_df = report_manager.forecast(
+            remaining_points=args.remaining_points,
+            priority_remaining_points=args.priority_remaining_points,
+            simulations=args.simulations,
+            confidences=args.confidences,
+            history=args.history,
+            exclude_latest_sprints=args.exclude_latest_sprints,
+            seed=args.seed,
+        )
+        report_manager.write_forecast(forecast_df)
+        forecast_dfs.append(forecast_df)
+
+    print(pd.concat(forecast_dfs, ignore_index=True).to_string(index=False))
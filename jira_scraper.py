@@ -1,13 +1,70 @@
+import cProfile
+
 from dotenv import load_dotenv
 
-from app.managers.jira_managers import JIRAManager
-from app.managers.report_managers import ReportManager
+from app.utils import get_manager_config
 
 load_dotenv()
 
 
 if __name__ == "__main__":
-    manager = JIRAManager.build()
-    sprint_metrics = manager.get_sprint_metrics()
-    report_manager = ReportManager.build(manager.config.project_name)
-    report_manager.create_or_update_report(sprint_metrics)
+    config = get_manager_config()
+    profiler = cProfile.Profile() if config.profile is not None else None
+    if profiler is not None:
+        profiler.enable()
+
+    from app.managers.jira_managers import JIRAManager
+
+    manager = JIRAManager.build(config)
+    instrumentation = manager.instrumentation
+    if config.backfill:
+        from app.managers.backfill_managers import BackfillManager
+
+        backfill_manager = BackfillManager.build(manager)
+        backfilled_sprint_ids = backfill_manager.run()
+        report_manager = backfill_manager.report_manager
+        print(f"Backfilled {len(backfilled_sprint_ids)} sprints")
+    else:
+        if config.stream:
+            sprint_metrics = manager.stream_sprint_metrics()
+        else:
+            if config.replay is not None:
+                from app.managers.snapshot_managers import SnapshotManager
+
+                with instrumentation.phase("replay"):
+                    snapshot = SnapshotManager(config.replay).read_snapshot()
+                    sprint_data = manager.replay_sprint_data(snapshot)
+            else:
+                sprint_data = manager.fetch_sprint_data()
+            if config.record_snapshot is not None:
+                from app.managers.snapshot_managers import SnapshotManager
+
+                with instrumentation.phase("record_snapshot"):
+                    snapshot = manager.get_snapshot(sprint_data)
+                    SnapshotManager(config.record_snapshot).write_snapshot(snapshot)
+            sprint_metrics = manager.compute_sprint_metrics(sprint_data)
+
+        from app.managers.report_managers import ReportManager
+
+        with instrumentation.phase("report"):
+            report_manager = ReportManager.build(
+                config.project_name,
+                config.report_format,
+                tail=len(sprint_metrics),
+            )
+            report_manager.create_or_update_report(sprint_metrics)
+        if config.burndown:
+            burndowns = manager.compute_sprint_burndowns(sprint_data)
+            with instrumentation.phase("report"):
+                report_manager.create_or_update_burndown(burndowns)
+    if config.export_csv:
+        with instrumentation.phase("export_csv"):
+            report_manager.export_csv()
+
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(config.profile)
+    if config.metrics_json is not None:
+        instrumentation.write_json(config.metrics_json)
+    if config.metrics_prometheus is not None:
+        instrumentation.write_prometheus(config.metrics_prometheus)
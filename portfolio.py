@@ -0,0 +1,30 @@
+from app.utils import get_portfolio_command_line_args
+
+if __name__ == "__main__":
+    args = get_portfolio_command_line_args()
+
+    from app.managers.portfolio_managers import PortfolioManager
+
+    portfolio_manager = PortfolioManager.build(args.report_format)
+    project_names = args.project_names or None
+    synced_project_names = portfolio_manager.sync(project_names)
+    print(f"Synced {len(synced_project_names)} changed reports into the portfolio")
+
+    if args.trend:
+        df = portfolio_manager.trends(
+            args.metrics, args.trend_sprints, project_names, args.since, args.until
+        )
+    else:
+        df = portfolio_manager.query(
+            args.metrics,
+            args.group_by,
+            period=args.period,
+            aggregation=args.aggregation,
+            rolling=args.rolling,
+            project_names=project_names,
+            since=args.since,
+            until=args.until,
+        )
+    if args.output is not None:
+        df.to_csv(args.output, index=False)
+    print(df.to_string(index=False))
@@ -0,0 +1,21 @@
+import sys
+
+from app.utils import get_render_command_line_args
+
+if __name__ == "__main__":
+    args = get_render_command_line_args()
+
+    from app.managers.render_managers import RenderManager
+
+    render_manager = RenderManager.build(args)
+    results = render_manager.run()
+    for result in results:
+        if not result.succeeded:
+            print(f"{result.project_name}: failed with {result.error}")
+        elif result.rendered:
+            print(f"{result.project_name}: rendered {', '.join(result.filenames)}")
+        else:
+            print(f"{result.project_name}: unchanged, skipped")
+
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
@@ -0,0 +1,81 @@
+import pytest
+
+from app.models import ManagerConfig, ReportCommandLineArgs
+from benchmarks.fake_jira_server import FakeJiraData, FakeJiraServer
+
+
+@pytest.fixture(scope="session")
+def fake_jira_server():
+    server = FakeJiraServer(
+        FakeJiraData(sprint_count=14, issue_count=600, changelog_entries=4)
+    )
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def nested_epics_server():
+    data = FakeJiraData(sprint_count=14, issue_count=600, changelog_entries=4)
+    initiative_key = data.keys[0]
+    for index, issue_type in enumerate(data.issue_types):
+        if issue_type == "Epic" and index > 0:
+            data.parents[index] = initiative_key
+            data.parent_index.setdefault(initiative_key, []).append(index)
+    server = FakeJiraServer(data)
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    (tmp_path / "reports").mkdir()
+    (tmp_path / "cache").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def build_config(fake_jira_server):
+    def build(**overrides) -> ManagerConfig:
+        data = fake_jira_server.data
+        args = ReportCommandLineArgs(
+            **{
+                "planned_capacities": [40, 38, 42],
+                "board_id": data.board_id,
+                "project_name": data.project_name,
+                "story_points_field": data.story_points_field,
+                "sprint_field": data.sprint_field,
+                "complete_status": data.complete_status,
+                "priority_epics": data.keys[:2],
+                "past_n_sprints": 12,
+                **overrides,
+            }
+        )
+        config = ManagerConfig(
+            jira_token="test",
+            email="test@example.com",
+            server_url=fake_jira_server.url,
+            **args.dict(),
+        )
+        return config
+
+    return build
+
+
+@pytest.fixture
+def build_nested_epics_config(build_config, nested_epics_server):
+    def build(**overrides) -> ManagerConfig:
+        config = build_config(
+            **{
+                "resolve_hierarchy": True,
+                "priority_epics": [nested_epics_server.data.keys[0]],
+                **overrides,
+            }
+        ).copy(update={"server_url": nested_epics_server.url})
+        return config
+
+    return build
@@ -0,0 +1,73 @@
+import pytest
+
+from app.managers.backfill_managers import BackfillManager
+from app.managers.jira_managers import JIRAManager
+from app.managers.report_managers import ReportManager
+from app.models import BackfillCheckpoint
+
+
+def backfill(config):
+    backfill_manager = BackfillManager.build(JIRAManager.build(config))
+    backfilled_sprint_ids = backfill_manager.run()
+    return backfill_manager, backfilled_sprint_ids
+
+
+def test_backfill_reports_every_closed_sprint_in_chunks(workdir, build_config):
+    chunks = []
+    backfill_chunk = BackfillManager._backfill_chunk
+
+    def record_chunk(self, sprints, planned_capacities):
+        chunks.append([sprint.id for sprint in sprints])
+        backfill_chunk(self, sprints, planned_capacities)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(BackfillManager, "_backfill_chunk", record_chunk)
+        backfill_manager, backfilled_sprint_ids = backfill(
+            build_config(backfill=True, backfill_chunk_size=5)
+        )
+    chunked_df = ReportManager.build("BENCH").df
+
+    assert [len(chunk) for chunk in chunks] == [5, 5, 3]
+    assert sum(chunks, []) == backfilled_sprint_ids
+    assert backfilled_sprint_ids == sorted(backfilled_sprint_ids)
+    assert chunked_df["Sprint ID"].tolist() == backfilled_sprint_ids
+    assert (
+        BackfillCheckpoint.parse_file(
+            backfill_manager.checkpoint_filename
+        ).completed_sprint_ids
+        == backfilled_sprint_ids
+    )
+
+    (workdir / "reports" / "BENCH_sprint_metrics.csv").unlink()
+    (workdir / backfill_manager.checkpoint_filename).unlink()
+    backfill(build_config(backfill=True, backfill_chunk_size=100))
+    assert ReportManager.build("BENCH").df.equals(chunked_df)
+
+
+def test_interrupted_backfill_resumes_after_the_last_chunk(workdir, build_config):
+    config = build_config(backfill=True, backfill_chunk_size=5)
+    backfill_chunk = BackfillManager._backfill_chunk
+    chunk_count = 0
+
+    def fail_second_chunk(self, sprints, planned_capacities):
+        nonlocal chunk_count
+        chunk_count += 1
+        if chunk_count == 2:
+            raise ConnectionError("interrupted")
+        backfill_chunk(self, sprints, planned_capacities)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(BackfillManager, "_backfill_chunk", fail_second_chunk)
+        with pytest.raises(ConnectionError):
+            backfill(config)
+    backfill_manager, resumed_sprint_ids = backfill(config)
+
+    completed_sprint_ids = BackfillCheckpoint.parse_file(
+        backfill_manager.checkpoint_filename
+    ).completed_sprint_ids
+    assert len(resumed_sprint_ids) == 8
+    assert completed_sprint_ids[5:] == resumed_sprint_ids
+    assert ReportManager.build("BENCH").df["Sprint ID"].tolist() == (
+        completed_sprint_ids
+    )
+    assert backfill(config)[1] == []
@@ -0,0 +1,93 @@
+from app.managers.batch_managers import BatchManager
+from app.managers.jira_managers import JIRAManager
+from app.managers.report_managers import ReportManager
+
+
+def test_batch_report_matches_single_board_report(workdir, build_config):
+    config = build_config()
+    results = BatchManager([config], processes=1).run()
+    batch_df = ReportManager.build(config.project_name).df
+
+    ReportManager.build(config.project_name).create_or_update_report(
+        JIRAManager.build(config).get_sprint_metrics()
+    )
+    single_board_df = ReportManager.build(config.project_name).df
+
+    assert results[0].succeeded
+    assert results[0].sprint_count == 13
+    assert batch_df.equals(single_board_df)
+
+
+def test_batch_rejects_options_it_cannot_honour(workdir, build_config):
+    results = BatchManager(
+        [build_config(stream=True, metrics_json="metrics.json")], processes=1
+    ).run()
+
+    assert not results[0].succeeded
+    assert "stream, metrics_json cannot be used in a batch run" in results[0].error
+
+
+def test_batch_rejects_duplicate_project_names(workdir, build_config):
+    results = BatchManager([build_config(), build_config()], processes=1).run()
+
+    assert [result.succeeded for result in results] == [False, False]
+    assert all(
+        "BENCH is configured by more than one config file" in result.error
+        for result in results
+    )
+
+
+def test_batch_resolves_the_hierarchy_like_a_single_board_run(
+    workdir, build_nested_epics_config
+):
+    config = build_nested_epics_config(use_metrics_cache=True)
+    results = BatchManager([config], processes=1).run()
+    batch_df = ReportManager.build(config.project_name).df
+
+    single_board_metrics = JIRAManager.build(config).get_sprint_metrics()
+    unresolved_metrics = JIRAManager.build(
+        config.copy(update={"resolve_hierarchy": False})
+    ).get_sprint_metrics()
+    ReportManager.build(config.project_name).create_or_update_report(
+        single_board_metrics
+    )
+    single_board_df = ReportManager.build(config.project_name).df
+
+    assert results[0].succeeded
+    assert batch_df.equals(single_board_df)
+    assert [metrics.priority_breakdown for metrics in single_board_metrics] != [
+        metrics.priority_breakdown for metrics in unresolved_metrics
+    ]
+
+
+def test_batch_counts_every_request_once(
+    workdir, build_config, fake_jira_server, monkeypatch
+):
+    managers = []
+    build = JIRAManager.build
+
+    def record_build(*args, **kwargs):
+        manager = build(*args, **kwargs)
+        managers.append(manager)
+        return manager
+
+    monkeypatch.setattr(JIRAManager, "build", record_build)
+    request_count = fake_jira_server.request_count
+    batch_manager = BatchManager(
+        [build_config(project_name="FIRST"), build_config(project_name="SECOND")],
+        processes=1,
+    )
+    results = batch_manager.run()
+
+    counted_requests = [
+        sum(
+            phase.http_requests
+            for phase in manager.instrumentation.get_run_instrumentation().phases
+        )
+        for manager in managers
+    ]
+    jira = batch_manager._jiras[fake_jira_server.url]
+    assert [result.succeeded for result in results] == [True, True]
+    assert len(jira._session.hooks["response"]) == 1
+    assert counted_requests[0] == counted_requests[1] > 0
+    assert sum(counted_requests) == fake_jira_server.request_count - request_count - 2
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.constants import BurndownEventTypes, BurndownFrequencies
+from app.managers.burndown_managers import BurndownManager
+from app.models import BurndownEvent, BurndownIssue
+
+SPRINT_ID = 1
+START_DATE = datetime(2022, 1, 10, tzinfo=pytz.UTC)
+END_DATE = START_DATE + timedelta(days=4)
+DAY = timedelta(days=1)
+ISSUES = [
+    BurndownIssue(story_points=3, is_complete=False),
+    BurndownIssue(story_points=5, is_complete=False),
+    BurndownIssue(story_points=2, is_complete=False),
+]
+EVENTS = [
+    BurndownEvent(START_DATE + 2.5 * DAY, 0, BurndownEventTypes.COMPLETED),
+    BurndownEvent(START_DATE - DAY, 0, BurndownEventTypes.ADDED),
+    BurndownEvent(START_DATE + 1.5 * DAY, 1, BurndownEventTypes.ADDED),
+    BurndownEvent(START_DATE + 3.5 * DAY, 1, BurndownEventTypes.STORY_POINTS, 8),
+    BurndownEvent(START_DATE - 2 * DAY, 2, BurndownEventTypes.ADDED),
+    BurndownEvent(START_DATE + 2.5 * DAY, 2, BurndownEventTypes.REMOVED),
+]
+
+
+def test_burndown_series_replay_the_sprint_events(build_config):
+    burndown = BurndownManager(build_config()).get_sprint_burndown(
+        SPRINT_ID, START_DATE, END_DATE, ISSUES, EVENTS, END_DATE + DAY
+    )
+
+    assert burndown.timestamps == [START_DATE + index * DAY for index in range(5)]
+    assert burndown.remaining == [5, 5, 10, 5, 8]
+    assert burndown.completed == [0, 0, 0, 3, 3]
+    assert burndown.added_scope == [0, 0, 5, 5, 8]
+
+
+def test_burndown_of_an_active_sprint_ends_now(build_config):
+    now = START_DATE + 1.75 * DAY
+    burndown = BurndownManager(
+        build_config(burndown_frequency=BurndownFrequencies.HOURLY)
+    ).get_sprint_burndown(SPRINT_ID, START_DATE, END_DATE, ISSUES, EVENTS, now)
+
+    assert len(burndown.timestamps) == 43
+    assert burndown.timestamps[-1] == now
+    assert burndown.remaining[-1] == 10
+    assert burndown.added_scope[-1] == 5
@@ -0,0 +1,61 @@
+import copy
+from datetime import datetime, timedelta
+
+from app.constants import ISSUE_DATE_FORMAT, WebhookEvents
+from app.managers.daemon_managers import DaemonManager
+from app.managers.jira_managers import JIRAManager
+
+
+def test_issue_events_resolve_the_hierarchy_outside_the_lock(
+    workdir, build_config, monkeypatch
+):
+    manager = JIRAManager.build(build_config(resolve_hierarchy=True))
+    daemon_manager = DaemonManager(manager, "127.0.0.1", 0, 3600)
+    daemon_manager.reconcile()
+    daemon_manager.flush()
+
+    resolved_under_lock = []
+    resolve_hierarchy = manager.resolve_hierarchy
+
+    def record_resolve_hierarchy(issues):
+        resolved_under_lock.append(daemon_manager._condition._is_owned())
+        resolve_hierarchy(issues)
+
+    monkeypatch.setattr(manager, "resolve_hierarchy", record_resolve_hierarchy)
+    issue = copy.deepcopy(next(iter(daemon_manager.issues.values())))
+    updated = datetime.strptime(issue["fields"]["updated"], ISSUE_DATE_FORMAT)
+    issue["fields"]["updated"] = (updated + timedelta(minutes=1)).strftime(
+        ISSUE_DATE_FORMAT
+    )
+    issue["fields"]["status"] = {"name": "Reopened"}
+    daemon_manager.handle_event(
+        {"webhookEvent": WebhookEvents.ISSUE_UPDATED.value, "issue": issue}
+    )
+
+    assert resolved_under_lock == [False]
+    assert daemon_manager.issues[issue["key"]]["fields"]["status"] == {
+        "name": "Reopened"
+    }
+    assert len(daemon_manager._changed_sprint_ids) > 0
+
+
+def test_failed_reconciliations_are_counted_and_reported(
+    workdir, build_config, monkeypatch
+):
+    manager = JIRAManager.build(build_config())
+    daemon_manager = DaemonManager(manager, "127.0.0.1", 0, 3600)
+
+    def fail_fetch_sprint_data():
+        raise ConnectionError("JIRA is down")
+
+    monkeypatch.setattr(manager, "fetch_sprint_data", fail_fetch_sprint_data)
+    reconcile_errors = []
+    daemon_manager._try_reconcile(reconcile_errors.append)
+
+    assert [repr(e) for e in reconcile_errors] == ["ConnectionError('JIRA is down')"]
+    assert [
+        stats.errors
+        for stats in manager.instrumentation.get_run_instrumentation().phases
+        if stats.phase == "reconcile"
+    ] == [1]
+    assert daemon_manager._pending_events is None
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from app.constants import PHASE_COUNTER_FIELDS
+from app.managers import instrumentation_managers
+from app.managers.instrumentation_managers import InstrumentationManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.wall = 100.0
+        self.cpu = 10.0
+
+    def perf_counter(self) -> float:
+        return self.wall
+
+    def thread_time(self) -> float:
+        return self.cpu
+
+    def advance(self, wall: float, cpu: float) -> None:
+        self.wall += wall
+        self.cpu += cpu
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(instrumentation_managers, "time", clock)
+    return clock
+
+
+def record_run(clock):
+    instrumentation = InstrumentationManager("BENCH")
+    with instrumentation.phase("list_sprints"):
+        clock.advance(1.0, 0.25)
+    for sprint_id in [1, 2]:
+        with instrumentation.phase("search", sprint_id):
+            clock.advance(2.0, 0.5)
+            with instrumentation.phase("parse_issues", sprint_id):
+                clock.advance(0.5, 0.5)
+                instrumentation.count(
+                    "parse_issues", sprint_id, issues=10, changelog_entries=40
+                )
+    clock.advance(0.5, 0.0)
+    return instrumentation
+
+
+def test_phases_time_their_own_calls_including_nested_phases(clock):
+    run_instrumentation = record_run(clock).get_run_instrumentation()
+
+    phases = {
+        (stats.phase, stats.sprint_id): stats for stats in run_instrumentation.phases
+    }
+    assert list(phases) == [
+        ("list_sprints", None),
+        ("parse_issues", 1),
+        ("search", 1),
+        ("parse_issues", 2),
+        ("search", 2),
+    ]
+    assert phases[("search", 1)].calls == 1
+    assert phases[("search", 1)].wall_seconds == 2.5
+    assert phases[("search", 1)].cpu_seconds == 1.0
+    assert phases[("parse_issues", 2)].wall_seconds == 0.5
+    assert phases[("parse_issues", 2)].issues == 10
+    assert phases[("parse_issues", 2)].changelog_entries == 40
+    assert run_instrumentation.wall_seconds == 6.5
+
+
+def test_prometheus_textfile_totals_every_phase(clock, tmp_path):
+    instrumentation = record_run(clock)
+    filename = str(tmp_path / "jira_scraper.prom")
+
+    instrumentation.write_prometheus(filename)
+
+    with open(filename) as f:
+        lines = f.read().splitlines()
+    assert lines[:6] == [
+        "# HELP jira_scraper_run_wall_seconds Wall time of the whole scraper run.",
+        "# TYPE jira_scraper_run_wall_seconds gauge",
+        'jira_scraper_run_wall_seconds{project="BENCH"} 6.5',
+        "# HELP jira_scraper_last_run_timestamp_seconds Unix timestamp of the start "
+        "of the last scraper run.",
+        "# TYPE jira_scraper_last_run_timestamp_seconds gauge",
+        "jira_scraper_last_run_timestamp_seconds"
+        f'{{project="BENCH"}} {instrumentation.started_at.timestamp()}',
+    ]
+    assert 'jira_scraper_phase_calls{project="BENCH",phase="search"} 2' in lines
+    assert (
+        'jira_scraper_phase_wall_seconds{project="BENCH",phase="search"} 5.0' in lines
+    )
+    assert 'jira_scraper_phase_issues{project="BENCH",phase="parse_issues"} 20' in lines
+    assert (
+        'jira_scraper_phase_cpu_seconds{project="BENCH",phase="list_sprints"} 0.25'
+        in lines
+    )
+    assert len(lines) == 6 + len(PHASE_COUNTER_FIELDS) * (2 + 3)
+    assert not (tmp_path / "jira_scraper.prom.tmp").exists()
+
+
+def test_json_report_lists_every_phase(clock, tmp_path):
+    filename = str(tmp_path / "metrics.json")
+
+    record_run(clock).write_json(filename)
+
+    with open(filename) as f:
+        run_instrumentation = json.load(f)
+    assert run_instrumentation["project_name"] == "BENCH"
+    assert len(run_instrumentation["phases"]) == 5
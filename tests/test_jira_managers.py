@@ -0,0 +1,65 @@
+import pytest
+
+from app.managers.jira_managers import JIRAManager
+
+
+def get_metrics(config):
+    manager = JIRAManager.build(config)
+    if config.stream:
+        return [metrics.dict() for metrics in manager.stream_sprint_metrics()]
+    return [metrics.dict() for metrics in manager.get_sprint_metrics()]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"max_workers": 4},
+        {"max_workers": 4, "stream": True},
+        {"use_issue_store": True},
+        {"use_issue_store": True, "stream": True},
+        {"use_sprint_index": True},
+    ],
+)
+def test_sprint_metrics_are_equal_across_modes(workdir, build_config, overrides):
+    expected_metrics = get_metrics(build_config(max_workers=1))
+
+    config = build_config(**overrides)
+    assert get_metrics(config) == expected_metrics
+    assert get_metrics(config) == expected_metrics
+
+
+def test_cached_sprint_metrics_are_equal_to_computed_metrics(workdir, build_config):
+    expected_metrics = get_metrics(build_config())
+
+    config = build_config(use_metrics_cache=True)
+    assert get_metrics(config) == expected_metrics
+    assert get_metrics(config) == expected_metrics
+
+
+def test_sprint_jqls_exclude_the_sprints_of_earlier_chunks(build_config):
+    manager = JIRAManager(None, build_config())
+    sprint_ids = list(range(1, 26))
+
+    jqls = manager._get_sprint_jqls(sprint_ids)
+
+    assert len(jqls) == 3
+    assert jqls[0] == "project = BENCH AND sprint in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)"
+    assert jqls[1].endswith("AND sprint not in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)")
+    assert jqls[2].startswith("project = BENCH AND sprint in (21, 22, 23, 24, 25)")
+
+
+def test_sprint_jqls_download_every_issue_once(fake_jira_server, build_config):
+    data = fake_jira_server.data
+    manager = JIRAManager(None, build_config())
+    sprint_ids = [sprint["id"] for sprint in data.sprints]
+
+    chunks = [data.search(jql) for jql in manager._get_sprint_jqls(sprint_ids)]
+    downloaded = [index for chunk in chunks for index in chunk]
+
+    assert len(downloaded) == len(set(downloaded))
+    assert set(downloaded) == set(
+        data.search(
+            "project = BENCH AND sprint in "
+            f"({', '.join(str(sprint_id) for sprint_id in sprint_ids)})"
+        )
+    )
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.constants import ISSUE_DATE_FORMAT
+from app.managers.jira_managers import JIRAManager
+from app.managers.metric_managers import MetricsManager
+from app.models import JiraTicket, SprintMembership
+
+SPRINT_ID = 1
+START_DATE = datetime(2022, 1, 10, tzinfo=pytz.UTC)
+
+
+def get_ticket(manager, story_points, memberships):
+    ticket = JiraTicket(
+        issue_type="Story",
+        story_points=story_points,
+        epic_key=None,
+        status="Done",
+        date_added=manager._get_date_issue_added_to_sprint(
+            memberships, SPRINT_ID, START_DATE
+        ),
+    )
+    return ticket
+
+
+def test_commitment_and_scope_change_follow_membership_intervals(build_config):
+    config = build_config()
+    manager = JIRAManager(None, config)
+    day = timedelta(days=1)
+    tickets = [
+        get_ticket(
+            manager,
+            1,
+            [SprintMembership(sprint_id=SPRINT_ID, added=START_DATE - day)],
+        ),
+        get_ticket(
+            manager,
+            2,
+            [SprintMembership(sprint_id=SPRINT_ID, added=START_DATE + day)],
+        ),
+        get_ticket(
+            manager,
+            4,
+            [
+                SprintMembership(
+                    sprint_id=SPRINT_ID,
+                    added=START_DATE - 3 * day,
+                    removed=START_DATE - 2 * day,
+                ),
+                SprintMembership(sprint_id=SPRINT_ID, added=START_DATE + 2 * day),
+            ],
+        ),
+        get_ticket(
+            manager,
+            8,
+            [
+                SprintMembership(
+                    sprint_id=SPRINT_ID,
+                    added=START_DATE - 3 * day,
+                    removed=START_DATE + day,
+                ),
+                SprintMembership(sprint_id=SPRINT_ID, added=START_DATE + 2 * day),
+            ],
+        ),
+    ]
+
+    ticket_metrics = MetricsManager(config).get_ticket_metrics([tickets], [START_DATE])[
+        0
+    ]
+
+    assert ticket_metrics.commitment == 1 + 8
+    assert ticket_metrics.scope_change == 2 + 4
+    assert ticket_metrics.completed == 1 + 2 + 4 + 8
+
+
+def test_completed_priority_points_only_count_completed_priority_tickets(
+    build_config,
+):
+    config = build_config()
+    priority_epic, other_epic = config.priority_epics[0], "OTHER-1"
+    tickets = [
+        JiraTicket("Story", story_points, epic_key, status, START_DATE)
+        for story_points, epic_key, status in [
+            (1, priority_epic, config.complete_status),
+            (2, priority_epic, "In Progress"),
+            (4, other_epic, config.complete_status),
+            (8, None, config.complete_status),
+        ]
+    ]
+
+    ticket_metrics = MetricsManager(config).get_ticket_metrics([tickets], [START_DATE])[
+        0
+    ]
+
+    assert ticket_metrics.priority_breakdown.priority_points == 1 + 2
+    assert ticket_metrics.priority_breakdown.completed_priority_points == 1
+    assert ticket_metrics.completed == 1 + 4 + 8
+
+
+def test_sprint_memberships_answer_the_date_added_at_a_sprint_start(build_config):
+    config = build_config()
+    manager = JIRAManager(None, config)
+    day = timedelta(days=1)
+
+    def format_date(date):
+        return date.strftime(ISSUE_DATE_FORMAT)
+
+    def sprint_change(date, from_sprint_ids, to_sprint_ids):
+        history = {
+            "created": format_date(date),
+            "items": [
+                {"field": "status", "from": None, "to": None},
+                {"field": "Sprint", "from": from_sprint_ids, "to": to_sprint_ids},
+            ],
+        }
+        return history
+
+    issue = {
+        "key": "BENCH-1",
+        "fields": {
+            "created": format_date(START_DATE - 10 * day),
+            config.sprint_field: [{"id": SPRINT_ID}],
+        },
+        "changelog": {
+            "histories": [
+                sprint_change(START_DATE + 3 * day, None, f"{SPRINT_ID}"),
+                sprint_change(START_DATE - 5 * day, None, f"{SPRINT_ID}"),
+                sprint_change(START_DATE + day, f"{SPRINT_ID}", None),
+            ]
+        },
+    }
+    memberships = manager._get_sprint_memberships(issue)
+
+    assert memberships == [
+        SprintMembership(
+            sprint_id=SPRINT_ID, added=START_DATE - 5 * day, removed=START_DATE + day
+        ),
+        SprintMembership(sprint_id=SPRINT_ID, added=START_DATE + 3 * day),
+    ]
+    for at, date_added in [
+        (START_DATE - 6 * day, START_DATE + 3 * day),
+        (START_DATE, START_DATE - 5 * day),
+        (START_DATE + 2 * day, START_DATE + 3 * day),
+        (START_DATE + 4 * day, START_DATE + 3 * day),
+    ]:
+        assert (
+            manager._get_date_issue_added_to_sprint(memberships, SPRINT_ID, at)
+            == date_added
+        )
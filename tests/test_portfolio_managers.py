@@ -0,0 +1,42 @@
+from app.constants import ReportFormats
+from app.managers.jira_managers import JIRAManager
+from app.managers.portfolio_managers import PortfolioManager
+from app.managers.report_managers import ReportManager
+
+
+def test_sync_only_prunes_boards_of_its_report_format(workdir, build_config):
+    sprint_metrics = JIRAManager.build(build_config()).get_sprint_metrics()
+    ReportManager.build("CSV", ReportFormats.CSV).create_or_update_report(
+        sprint_metrics
+    )
+    ReportManager.build("PARQUET", ReportFormats.PARQUET).create_or_update_report(
+        sprint_metrics
+    )
+
+    csv_portfolio_manager = PortfolioManager.build(ReportFormats.CSV)
+    parquet_portfolio_manager = PortfolioManager.build(ReportFormats.PARQUET)
+
+    assert csv_portfolio_manager.sync() == ["CSV"]
+    assert parquet_portfolio_manager.sync() == ["PARQUET"]
+    assert parquet_portfolio_manager.sync(["CSV"]) == []
+    assert csv_portfolio_manager.sync() == []
+    trends_df = csv_portfolio_manager.trends(["Completed"])
+    assert sorted(trends_df["Project"]) == ["CSV", "PARQUET"]
+
+
+def test_sync_keeps_both_report_formats_of_a_project(workdir, build_config):
+    sprint_metrics = JIRAManager.build(build_config()).get_sprint_metrics()
+    for report_format in ReportFormats:
+        ReportManager.build("BENCH", report_format).create_or_update_report(
+            sprint_metrics
+        )
+
+    csv_portfolio_manager = PortfolioManager.build(ReportFormats.CSV)
+    parquet_portfolio_manager = PortfolioManager.build(ReportFormats.PARQUET)
+
+    assert csv_portfolio_manager.sync() == ["BENCH"]
+    assert parquet_portfolio_manager.sync() == ["BENCH"]
+    assert csv_portfolio_manager.sync() == []
+    assert parquet_portfolio_manager.sync() == []
+    df = csv_portfolio_manager.store.read_sprints(["Completed"])
+    assert len(df) == 2 * len(sprint_metrics)
@@ -0,0 +1,83 @@
+import json
+
+from app.constants import (
+    REPORT_COLUMNS,
+    REPORT_INDEX_COLUMNS,
+    RenderFormats,
+    ReportFormats,
+)
+from app.managers.jira_managers import JIRAManager
+from app.managers.render_managers import RenderManager
+from app.managers.report_managers import ReportManager
+
+
+def write_report(config):
+    manager = JIRAManager.build(config)
+    sprint_data = manager.fetch_sprint_data()
+    report_manager = ReportManager.build(config.project_name)
+    report_manager.create_or_update_report(manager.compute_sprint_metrics(sprint_data))
+    report_manager.create_or_update_burndown(
+        manager.compute_sprint_burndowns(sprint_data)
+    )
+
+
+def build_render_manager(force=False):
+    render_manager = RenderManager(
+        ["BENCH"],
+        ReportFormats.CSV,
+        "reports/render",
+        RenderFormats.JSON,
+        5,
+        force,
+    )
+    return render_manager
+
+
+def read_traces(filename):
+    with open(filename) as f:
+        traces = json.load(f)["data"]
+    return traces
+
+
+def test_rendered_figures_plot_the_downsampled_report(workdir, build_config):
+    write_report(build_config())
+
+    result = build_render_manager().run()[0]
+
+    assert result.succeeded and result.rendered
+    assert result.filenames == [
+        "reports/render/BENCH_sprint_metrics.json",
+        "reports/render/BENCH_sprint_burndown.json",
+    ]
+    report_df = ReportManager.build("BENCH").get_visualization_frames(5)[0]
+    report_traces = {trace["name"]: trace for trace in read_traces(result.filenames[0])}
+    assert list(report_traces) == [
+        column for column in REPORT_COLUMNS if column not in REPORT_INDEX_COLUMNS
+    ]
+    assert report_traces["Completed"]["x"] == report_df["Sprint"].tolist()
+    assert report_traces["Completed"]["y"] == report_df["Completed"].tolist()
+    burndown_traces = read_traces(result.filenames[1])
+    assert len(burndown_traces) == 3 * 13
+    assert all(len(trace["x"]) <= 5 for trace in burndown_traces)
+
+
+def test_render_skips_boards_whose_report_did_not_change(workdir, build_config):
+    write_report(build_config())
+    result = build_render_manager().run()[0]
+
+    unchanged_result = build_render_manager().run()[0]
+    write_report(build_config(planned_capacities=[60, 60, 60]))
+    changed_result = build_render_manager().run()[0]
+    forced_result = build_render_manager(force=True).run()[0]
+
+    assert unchanged_result.succeeded and not unchanged_result.rendered
+    assert unchanged_result.filenames == result.filenames
+    assert changed_result.rendered
+    assert forced_result.rendered
+
+
+def test_render_fails_boards_without_a_report(workdir):
+    result = build_render_manager().run()[0]
+
+    assert not result.succeeded
+    assert "No sprints in the report of BENCH" in result.error
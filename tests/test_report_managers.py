@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from app.constants import ReportFormats
+from app.managers.jira_managers import JIRAManager
+from app.managers.report_managers import ReportManager
+from app.models import PriorityPointsBreakdown, SprintMetrics, UnpointedBreakdown
+
+
+def test_parquet_report_format_requires_an_engine(workdir, monkeypatch):
+    monkeypatch.setattr("app.managers.report_managers.find_spec", lambda name: None)
+
+    with pytest.raises(ImportError, match="poetry install -E parquet"):
+        ReportManager.build("BENCH", ReportFormats.PARQUET)
+
+
+def test_parquet_report_matches_csv_report(workdir, build_config):
+    sprint_metrics = JIRAManager.build(build_config()).get_sprint_metrics()
+    csv_report_manager = ReportManager.build("BENCH", ReportFormats.CSV)
+    csv_report_manager.create_or_update_report(sprint_metrics)
+    parquet_report_manager = ReportManager.build("BENCH", ReportFormats.PARQUET)
+    parquet_report_manager.create_or_update_report(sprint_metrics)
+
+    assert ReportManager.build("BENCH", ReportFormats.PARQUET).df.equals(
+        ReportManager.build("BENCH", ReportFormats.CSV).df
+    )
+
+
+def test_forecast_requires_historical_sprints(workdir):
+    report_manager = ReportManager.build("BENCH")
+
+    with pytest.raises(ValueError, match="no historical sprints"):
+        report_manager.forecast(remaining_points=100)
+
+
+def test_priority_forecast_resamples_completed_priority_points(workdir):
+    start_date = datetime(2022, 1, 10, tzinfo=pytz.UTC)
+    sprint_metrics = [
+        SprintMetrics(
+            sprint_id=index,
+            planned_capacity=10,
+            commitment=10,
+            completed=10,
+            scope_change=0,
+            start_date=start_date + index * timedelta(days=14),
+            end_date=start_date + (index + 1) * timedelta(days=14),
+            unpointed_breakdown=UnpointedBreakdown(
+                unpointed_stories=0, unpointed_tasks=0, unpointed_bugs=0
+            ),
+            priority_breakdown=PriorityPointsBreakdown(
+                priority_points=8, non_priority_points=2, completed_priority_points=5
+            ),
+        )
+        for index in range(4)
+    ]
+    report_manager = ReportManager.build("BENCH")
+    report_manager.create_or_update_report(sprint_metrics)
+
+    forecast_df = report_manager.forecast(
+        remaining_points=20, priority_remaining_points=20, simulations=1000, seed=1
+    )
+
+    assert forecast_df["Target"].tolist() == ["All", "Priority"]
+    assert forecast_df.iloc[0, 4:].tolist() == [2, 2, 2]
+    assert forecast_df.iloc[1, 4:].tolist() == [4, 4, 4]
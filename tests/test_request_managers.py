@@ -0,0 +1,148 @@
+import threading
+
+import pytest
+from jira.exceptions import JIRAError
+from requests import Response
+
+from app.managers import request_managers
+from app.managers.jira_managers import JIRAManager
+from app.managers.request_managers import RequestManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeCondition(threading.Condition):
+    def __init__(self, clock: FakeClock):
+        super().__init__()
+        self.clock = clock
+
+    def wait(self, timeout=None) -> bool:
+        self.clock.sleep(timeout)
+        return True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(request_managers, "time", clock)
+    monkeypatch.setattr(request_managers.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def build_request_manager(clock, max_concurrency=4, requests_per_second=None):
+    request_manager = RequestManager(max_concurrency, requests_per_second, 3)
+    request_manager._condition = FakeCondition(clock)
+    return request_manager
+
+
+def build_error(status_code, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return JIRAError(status_code=status_code, response=response)
+
+
+def fail_then_return(errors, result="ok"):
+    errors = list(errors)
+
+    def function():
+        if len(errors) > 0:
+            raise errors.pop(0)
+        return result
+
+    return function
+
+
+def test_token_bucket_spaces_requests_at_the_configured_rate(clock):
+    request_manager = build_request_manager(clock, requests_per_second=2)
+
+    started_at = [request_manager.call(clock.monotonic) for _ in range(5)]
+
+    assert started_at == [0.0, 0.0, 0.5, 1.0, 1.5]
+
+
+def test_retry_after_header_sets_the_retry_delay(clock):
+    request_manager = build_request_manager(clock)
+    function = fail_then_return([build_error(429, {"Retry-After": "7"})])
+
+    assert request_manager.call(function) == "ok"
+    assert clock.sleeps == [7.0]
+    assert request_manager._paused_until == 7.0
+
+
+def test_invalid_retry_after_header_falls_back_to_backoff(clock):
+    request_manager = build_request_manager(clock)
+    function = fail_then_return([build_error(503, {"Retry-After": "soon"})])
+
+    assert request_manager.call(function) == "ok"
+    assert clock.sleeps == [1.0]
+
+
+def test_backoff_doubles_until_retries_run_out(clock):
+    request_manager = build_request_manager(clock)
+    function = fail_then_return([build_error(500) for _ in range(4)])
+
+    with pytest.raises(JIRAError):
+        request_manager.call(function)
+    assert clock.sleeps == [1.0, 2.0, 4.0]
+    assert request_manager._get_retry_delay(build_error(500), 10) == 60.0
+
+
+def test_client_errors_are_not_retried(clock):
+    request_manager = build_request_manager(clock)
+    function = fail_then_return([build_error(404)])
+
+    with pytest.raises(JIRAError):
+        request_manager.call(function)
+    assert clock.sleeps == []
+
+
+def test_concurrency_limit_halves_on_failure_and_grows_additively(clock):
+    request_manager = build_request_manager(clock, max_concurrency=8)
+
+    request_manager._on_failure(build_error(500), 1.0)
+    request_manager._on_failure(build_error(500), 1.0)
+    assert request_manager.concurrency_limit == 2
+
+    for _ in range(2):
+        request_manager._on_success(0.1)
+    assert request_manager._concurrency_limit == pytest.approx(2.5 + 1 / 2.5)
+
+    for _ in range(100):
+        request_manager._on_success(0.1)
+    assert request_manager.concurrency_limit == 8
+
+
+def test_concurrency_limit_backs_off_when_latency_rises(clock):
+    request_manager = build_request_manager(clock, max_concurrency=8)
+    request_manager._on_success(0.1)
+    assert request_manager.concurrency_limit == 8
+
+    request_manager._on_success(10.0)
+    assert request_manager._concurrency_limit == pytest.approx(8 * 0.9)
+
+
+def test_jira_client_is_built_through_the_request_manager(build_config):
+    request_manager = RequestManager(1, None, 0)
+    calls = []
+    call = request_manager.call
+
+    def record_call(function, *args, **kwargs):
+        calls.append(function.__name__)
+        return call(function, *args, **kwargs)
+
+    request_manager.call = record_call
+    JIRAManager.build_jira(build_config(), request_manager)
+
+    assert calls == ["JIRA"]
@@ -0,0 +1,77 @@
+import pandas as pd
+
+from app.managers.jira_managers import JIRAManager
+from app.managers.snapshot_managers import SnapshotManager
+from app.managers.what_if_managers import WhatIfManager
+
+
+def record_and_replay(config):
+    manager = JIRAManager.build(config)
+    sprint_data = manager.fetch_sprint_data()
+    sprint_metrics = manager.compute_sprint_metrics(sprint_data)
+    SnapshotManager("snapshot.ndjson.gz").write_snapshot(
+        manager.get_snapshot(sprint_data)
+    )
+
+    replay_manager = JIRAManager.build(
+        config.copy(update={"record_snapshot": None, "replay": "snapshot.ndjson.gz"})
+    )
+    snapshot = SnapshotManager("snapshot.ndjson.gz").read_snapshot()
+    replayed_sprint_metrics = replay_manager.compute_sprint_metrics(
+        replay_manager.replay_sprint_data(snapshot)
+    )
+    return sprint_metrics, replayed_sprint_metrics
+
+
+def test_replay_matches_live_run_with_resolved_hierarchy(
+    workdir, build_nested_epics_config
+):
+    sprint_metrics, replayed_sprint_metrics = record_and_replay(
+        build_nested_epics_config(record_snapshot="snapshot.ndjson.gz")
+    )
+
+    assert replayed_sprint_metrics == sprint_metrics
+
+
+def test_snapshot_round_trips_through_the_snapshot_file(workdir, build_config):
+    manager = JIRAManager.build(build_config())
+    snapshot = manager.get_snapshot(manager.fetch_sprint_data())
+    SnapshotManager("snapshot.ndjson.gz").write_snapshot(snapshot)
+
+    assert SnapshotManager("snapshot.ndjson.gz").read_snapshot() == snapshot
+    assert len(snapshot.sprints) == 13
+
+
+def test_replay_matches_live_run(workdir, build_config):
+    sprint_metrics, replayed_sprint_metrics = record_and_replay(
+        build_config(record_snapshot="snapshot.ndjson.gz")
+    )
+
+    assert replayed_sprint_metrics == sprint_metrics
+
+
+def test_what_if_variations_match_live_runs_of_their_configs(workdir, build_config):
+    config = build_config()
+    manager = JIRAManager.build(config)
+    snapshot = manager.get_snapshot(manager.fetch_sprint_data())
+    variations = {
+        "baseline": None,
+        "no priority epics": {"priority_epics": []},
+        "more capacity": {"planned_capacities": [60, 60, 60], "past_n_sprints": 6},
+    }
+
+    what_if_manager = WhatIfManager(config, snapshot, variations)
+    variations_metrics = what_if_manager.run()
+    filename = what_if_manager.create_report(variations_metrics)
+
+    for name, overrides in variations.items():
+        expected_metrics = JIRAManager.build(
+            build_config(**(overrides or {}))
+        ).get_sprint_metrics()
+        assert variations_metrics[name] == expected_metrics
+    df = pd.read_csv(filename)
+    assert df["Variation"].value_counts().to_dict() == {
+        "baseline": 13,
+        "no priority epics": 13,
+        "more capacity": 7,
+    }
@@ -0,0 +1,34 @@
+from app.utils import _get_report_command_line_args
+
+
+def test_report_command_line_args_are_parsed(monkeypatch):
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "jira_scraper.py",
+            "--planned-capacities",
+            "40",
+            "38",
+            "--board-id",
+            "1",
+            "--project-name",
+            "BENCH",
+            "--complete-status",
+            "Done",
+            "--priority-epics",
+            "BENCH-1",
+            "--past-n-sprints",
+            "6",
+            "--max-workers",
+            "4",
+        ],
+    )
+
+    args = _get_report_command_line_args()
+
+    assert args.planned_capacities == [40, 38]
+    assert args.board_id == 1
+    assert args.project_name == "BENCH"
+    assert args.priority_epics == ["BENCH-1"]
+    assert args.past_n_sprints == 6
+    assert args.max_workers == 4
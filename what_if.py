@@ -0,0 +1,16 @@
+from dotenv import load_dotenv
+
+from app.utils import get_what_if_command_line_args
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    args = get_what_if_command_line_args()
+
+    from app.managers.what_if_managers import WhatIfManager
+
+    what_if_manager = WhatIfManager.build(args)
+    variations_metrics = what_if_manager.run()
+    filename = what_if_manager.create_report(variations_metrics)
+    print(f"Wrote {len(variations_metrics)} variations to {filename}")